@@ -0,0 +1,498 @@
+#!/usr/bin/env python3
+"""
+Public Data API SSL Adapter - 벤치마크
+
+로컬 TLS 스텁 서버를 상대로 성능을 측정하고 결과를 JSON으로 출력합니다.
+커밋 사이의 결과를 비교하여 성능 회귀를 확인할 수 있습니다.
+
+    python benchmark.py clients            # 클라이언트별 처리량/지연/핸드셰이크 수
+    python benchmark.py clients --requests 5000 --concurrency 8 -o result.json
+    python benchmark.py timings            # 단계별 소요 시간 기록 비용
+    python benchmark.py sessions           # 세션 생성 비용 (공유 SSL 컨텍스트 유무)
+    python benchmark.py ciphers            # cipher suite별 핸드셰이크/전송 비용
+
+clients: 같은 스텁 서버(PagedEnvelopeResponder)에 같은 수의 요청을 보내며
+클라이언트 구성별로 초당 요청 수, 지연 시간 백분위수(p50/p95/p99),
+요청 1000개당 TLS 핸드셰이크 수(전체/재개), 요청당 CPU 시간, RSS를 측정합니다.
+
+    new-session   요청마다 create_public_data_api_session()으로 새 세션 생성
+    convenience   public_data_api_get() (공유 세션)
+    session       create_public_data_api_session() 세션 하나를 재사용
+    urllib3       같은 SSL 컨텍스트를 쓰는 urllib3.PoolManager
+    async         AsyncPublicDataApiClient
+
+timings: record_timings를 끈 세션과 켠 세션의 요청당 CPU 시간, 그리고
+요청 하나에 더해지는 기록 작업(RequestTimings 생성, 히스토그램 기록)만의
+비용을 측정합니다.
+
+sessions: create_public_data_api_session() 하나를 만드는 시간을, 프로필별
+공유 SSL 컨텍스트를 재사용할 때(shared)와 세션마다 컨텍스트를 새로 만들 때
+(uncached, 공유 컨텍스트 캐시 도입 전과 같은 비용)로 나누어 측정합니다.
+
+ciphers: 서버가 cipher suite 하나만 허용하도록 설정한 스텁 서버마다
+전체 핸드셰이크 시간과 CPU 시간, 큰 응답 본문의 전송 속도를 측정합니다.
+이 파이썬의 OpenSSL이 지원하지 않는 suite는 unsupported로 표시합니다.
+
+스텁 서버가 같은 프로세스에서 실행되므로 CPU 시간과 RSS는 클라이언트와
+서버의 합입니다. 절대값보다 같은 환경에서 커밋 사이의 차이를 비교하세요.
+"""
+
+import argparse
+import asyncio
+import http.client
+import json
+import os
+import platform
+import socket
+import ssl
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import urllib3
+
+import public_data_api_ssl_adapter
+from public_data_api_async import AsyncPublicDataApiClient
+from public_data_api_ssl_adapter import (
+    LEGACY_CIPHERS,
+    PREFERRED_CIPHERS,
+    RequestTimings,
+    TimingHistograms,
+    close_all,
+    create_public_data_api_session,
+    create_public_data_api_ssl_context,
+    get_public_data_api_ssl_context,
+    public_data_api_get,
+    resolve_tls_profile,
+)
+from public_data_api_stub_server import PagedEnvelopeResponder, PublicDataApiStubServer
+
+# 전송 속도 측정에 쓰는 응답 본문 크기
+BULK_BYTES = 8 * 1024 * 1024
+
+# clients 벤치마크의 요청 파라미터 (스텁 서버는 자체 서명 인증서라 검증하지 않음)
+CLIENT_PARAMS = {"pageNo": 1, "numOfRows": 10, "_type": "json"}
+
+
+def bulk_response(method, path, query, body):
+    """요청한 크기(size 파라미터)의 본문을 돌려주는 스텁 응답 함수"""
+    size = int(query.get("size", BULK_BYTES))
+    return 200, {"Content-Type": "application/octet-stream"}, b"\0" * size
+
+
+def percentile(values, fraction):
+    """정렬된 값 목록의 백분위수 (가장 가까운 순위)"""
+    index = min(len(values) - 1, max(0, round(fraction * len(values)) - 1))
+    return values[index]
+
+
+def client_context(cipher):
+    # 세션 재개 없이 매번 전체 핸드셰이크를 하도록 티켓을 끈 컨텍스트
+    ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    ctx.check_hostname = False
+    ctx.verify_mode = ssl.CERT_NONE
+    ctx.minimum_version = ssl.TLSVersion.TLSv1_2
+    ctx.maximum_version = ssl.TLSVersion.TLSv1_2
+    ctx.options |= ssl.OP_NO_TICKET
+    ctx.set_ciphers(cipher)
+    return ctx
+
+
+def bench_cipher(cipher, handshakes, bulk_bytes):
+    """
+    cipher suite 하나의 핸드셰이크와 전송 비용 측정
+
+    Returns:
+        dict: handshake_ms(p50/p95/mean), handshake_cpu_ms, bulk_mib_per_s
+    """
+    try:
+        ctx = client_context(cipher)
+    except ssl.SSLError as exc:
+        return {"cipher": cipher, "unsupported": str(exc)}
+
+    with PublicDataApiStubServer(ciphers=cipher, responder=bulk_response) as server:
+        address = server.address
+        times = []
+        cpu_start = time.process_time()
+        for _ in range(handshakes):
+            with socket.create_connection(address) as sock:
+                start = time.perf_counter()
+                with ctx.wrap_socket(sock) as tls_sock:
+                    times.append(time.perf_counter() - start)
+                    negotiated = tls_sock.cipher()[0]
+        cpu = time.process_time() - cpu_start
+
+        connection = http.client.HTTPSConnection(*address, context=ctx)
+        connection.request("GET", "/bulk?size=1024")
+        connection.getresponse().read()  # 핸드셰이크는 전송 시간에서 제외
+        start = time.perf_counter()
+        connection.request("GET", f"/bulk?size={bulk_bytes}")
+        received = len(connection.getresponse().read())
+        elapsed = time.perf_counter() - start
+        connection.close()
+
+    times.sort()
+    return {
+        "cipher": cipher,
+        "negotiated": negotiated,
+        "handshake_ms": {
+            "p50": percentile(times, 0.50) * 1000,
+            "p95": percentile(times, 0.95) * 1000,
+            "mean": statistics.fmean(times) * 1000,
+        },
+        "handshake_cpu_ms": cpu / handshakes * 1000,
+        "bulk_mib_per_s": received / elapsed / (1024 * 1024),
+    }
+
+
+def rss_mib():
+    """현재 RSS (MiB). /proc가 없으면 최대 RSS"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        import resource  # Windows에는 없음
+
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux는 KiB, macOS는 바이트 단위
+        return maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def _timed(send):
+    start = time.perf_counter()
+    response = send()
+    elapsed = time.perf_counter() - start
+    if response.status_code != 200:
+        raise RuntimeError(f"unexpected status {response.status_code}")
+    return elapsed
+
+
+def _run_sync(make_send, requests, concurrency):
+    # make_send()는 요청 하나를 보내고 본문까지 읽은 응답을 반환하는 함수를 만듦
+    send = make_send()
+    if concurrency == 1:
+        return [_timed(send) for _ in range(requests)]
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(lambda _: _timed(send), range(requests)))
+
+
+def new_session_client(url, requests, concurrency):
+    def send():
+        with create_public_data_api_session() as session:
+            return session.get(url, params=CLIENT_PARAMS, verify=False)
+
+    return _run_sync(lambda: send, requests, concurrency)
+
+
+def convenience_client(url, requests, concurrency):
+    def send():
+        return public_data_api_get(url, params=CLIENT_PARAMS, verify=False)
+
+    try:
+        return _run_sync(lambda: send, requests, concurrency)
+    finally:
+        close_all()
+
+
+def session_client(url, requests, concurrency):
+    session = create_public_data_api_session(pool_maxsize=max(concurrency, 10))
+
+    def send():
+        return session.get(url, params=CLIENT_PARAMS, verify=False)
+
+    try:
+        return _run_sync(lambda: send, requests, concurrency)
+    finally:
+        session.close()
+
+
+class _Urllib3Response:
+    def __init__(self, response):
+        self.status_code = response.status
+        self.content = response.data
+
+
+def urllib3_client(url, requests, concurrency):
+    ctx = get_public_data_api_ssl_context(resolve_tls_profile(None, verify=False))
+    manager = urllib3.PoolManager(
+        maxsize=max(concurrency, 10), ssl_context=ctx, cert_reqs="CERT_NONE"
+    )
+
+    def send():
+        return _Urllib3Response(manager.request("GET", url, fields=CLIENT_PARAMS))
+
+    try:
+        return _run_sync(lambda: send, requests, concurrency)
+    finally:
+        manager.clear()
+
+
+def async_client(url, requests, concurrency):
+    async def run():
+        async with AsyncPublicDataApiClient(
+            limit_per_host=concurrency, verify=False
+        ) as client:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def timed():
+                async with semaphore:
+                    start = time.perf_counter()
+                    response = await client.get(url, params=CLIENT_PARAMS)
+                    elapsed = time.perf_counter() - start
+                if response.status_code != 200:
+                    raise RuntimeError(f"unexpected status {response.status_code}")
+                return elapsed
+
+            return await asyncio.gather(*(timed() for _ in range(requests)))
+
+    return asyncio.run(run())
+
+
+CLIENTS = {
+    "new-session": new_session_client,
+    "convenience": convenience_client,
+    "session": session_client,
+    "urllib3": urllib3_client,
+    "async": async_client,
+}
+
+
+def bench_client(name, requests, concurrency, latency):
+    """
+    클라이언트 구성 하나의 처리량, 지연 시간, 핸드셰이크 수 측정
+
+    Returns:
+        dict: requests_per_s, latency_ms(p50/p95/p99/mean),
+            handshakes_per_1k(full/resumed), cpu_ms_per_request, rss_mib
+    """
+    responder = PagedEnvelopeResponder(total_count=1000, latency=latency)
+    with PublicDataApiStubServer(responder=responder) as server:
+        url = server.url("/getList")
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        times = CLIENTS[name](url, requests, concurrency)
+        elapsed = time.perf_counter() - start
+        cpu = time.process_time() - cpu_start
+        stats = server.stats()
+
+    times = sorted(times)
+    return {
+        "client": name,
+        "requests": requests,
+        "concurrency": concurrency,
+        "requests_per_s": requests / elapsed,
+        "latency_ms": {
+            "p50": percentile(times, 0.50) * 1000,
+            "p95": percentile(times, 0.95) * 1000,
+            "p99": percentile(times, 0.99) * 1000,
+            "mean": statistics.fmean(times) * 1000,
+        },
+        "handshakes_per_1k": {
+            "full": stats["full_handshakes"] * 1000 / requests,
+            "resumed": stats["resumed_handshakes"] * 1000 / requests,
+        },
+        "cpu_ms_per_request": cpu / requests * 1000,
+        "rss_mib": rss_mib(),
+    }
+
+
+def run_clients(args):
+    """클라이언트 구성별 측정"""
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    names = args.client or list(CLIENTS)
+    return [
+        bench_client(name, args.requests, args.concurrency, args.latency)
+        for name in names
+    ]
+
+
+def timing_bookkeeping(iterations):
+    """
+    재사용한 연결의 요청 하나에 record_timings가 더하는 기록 작업의 비용 (µs)
+
+    _InstrumentedPoolMixin이 요청마다 하는 일(RequestTimings 생성,
+    perf_counter 세 번, 연결을 반납할 때의 히스토그램 기록)을 그대로 반복합니다.
+    """
+    histograms = TimingHistograms()
+    perf_counter = time.perf_counter
+    start = perf_counter()
+    for _ in range(iterations):
+        timings = RequestTimings(True)
+        sent = perf_counter()
+        timings._headers_at = now = perf_counter()
+        timings.ttfb = now - sent
+        timings.body = perf_counter() - timings._headers_at
+        histograms.record(timings)
+    return (perf_counter() - start) / iterations * 1e6
+
+
+def run_timings(args):
+    """
+    record_timings를 끈 세션과 켠 세션 비교
+
+    두 세션으로 requests개씩 번갈아(순서도 매번 바꿔) rounds번 요청하고,
+    요청한 스레드의 CPU 시간을 라운드별로 비교합니다. 같은 프로세스의 스텁 서버
+    스레드는 time.thread_time()에 포함되지 않습니다. 차이가 수 µs이므로
+    end-to-end 값은 잡음 범위 안에 있을 수 있으며, 기록 작업만의 비용은
+    bookkeeping_us_per_request를 참고합니다.
+    """
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    cpu = {False: [], True: []}
+    with PublicDataApiStubServer(responder=PagedEnvelopeResponder()) as server:
+        url = server.url("/getList")
+        sessions = {
+            record_timings: create_public_data_api_session(record_timings=record_timings)
+            for record_timings in (False, True)
+        }
+        try:
+            for session in sessions.values():
+                session.get(url, params=CLIENT_PARAMS, verify=False)  # 핸드셰이크 제외
+            for i in range(args.rounds):
+                for record_timings in (False, True) if i % 2 else (True, False):
+                    session = sessions[record_timings]
+                    cpu_start = time.thread_time()
+                    for _ in range(args.requests):
+                        session.get(url, params=CLIENT_PARAMS, verify=False)
+                    cpu[record_timings].append(
+                        (time.thread_time() - cpu_start) / args.requests * 1e6
+                    )
+        finally:
+            for session in sessions.values():
+                session.close()
+    return {
+        "requests": args.requests,
+        "rounds": args.rounds,
+        "cpu_us_per_request": {
+            "disabled": statistics.median(cpu[False]),
+            "enabled": statistics.median(cpu[True]),
+        },
+        # 같은 라운드의 꺼짐/켜짐 차이의 중앙값 (시간에 따른 변동이 상쇄됨)
+        "enabled_overhead_us": statistics.median(
+            enabled - disabled for disabled, enabled in zip(cpu[False], cpu[True])
+        ),
+        "bookkeeping_us_per_request": timing_bookkeeping(args.iterations),
+    }
+
+
+def time_session_creation(count, shared):
+    """create_public_data_api_session() 하나를 만드는 평균 시간 (µs)"""
+    sessions = []
+    start = time.perf_counter()
+    for _ in range(count):
+        if not shared:
+            # 공유 컨텍스트 캐시를 비워 세션마다 컨텍스트를 새로 만들게 함
+            public_data_api_ssl_adapter._shared_ssl_context.cache_clear()
+        sessions.append(create_public_data_api_session())
+    elapsed = time.perf_counter() - start
+    for session in sessions:
+        session.close()
+    return elapsed / count * 1e6
+
+
+def run_sessions(args):
+    """공유 SSL 컨텍스트를 쓸 때와 쓰지 않을 때의 세션 생성 비용 (번갈아 rounds번 측정)"""
+    created = {True: [], False: []}
+    for _ in range(args.rounds):
+        for shared in (True, False):
+            created[shared].append(time_session_creation(args.sessions, shared))
+    start = time.perf_counter()
+    for _ in range(args.sessions):
+        create_public_data_api_ssl_context()
+    context = (time.perf_counter() - start) / args.sessions * 1e6
+    shared = statistics.median(created[True])
+    uncached = statistics.median(created[False])
+    return {
+        "sessions": args.sessions,
+        "rounds": args.rounds,
+        "us_per_session": {"shared": shared, "uncached": uncached},
+        "speedup": uncached / shared,
+        "us_per_ssl_context": context,
+    }
+
+
+def run_ciphers(args):
+    """클라이언트 선호 순서(PREFERRED_CIPHERS + LEGACY_CIPHERS)의 suite별 측정"""
+    ciphers = args.cipher or list(dict.fromkeys(PREFERRED_CIPHERS + LEGACY_CIPHERS))
+    return [bench_cipher(cipher, args.handshakes, args.bulk_bytes) for cipher in ciphers]
+
+
+def environment():
+    """결과를 비교할 때 참고할 실행 환경"""
+    return {
+        "python": platform.python_version(),
+        "openssl": ssl.OPENSSL_VERSION,
+        "machine": platform.machine(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="공공데이터 API 어댑터 벤치마크")
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument("-o", "--output", help="결과 JSON 파일 (기본값: 표준 출력)")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    clients = subparsers.add_parser(
+        "clients", parents=[output], help="클라이언트별 처리량/지연/핸드셰이크 수"
+    )
+    clients.add_argument("--requests", type=int, default=1000, help="클라이언트별 요청 수")
+    clients.add_argument("--concurrency", type=int, default=1, help="동시 요청 수")
+    clients.add_argument(
+        "--latency", type=float, default=0.0, help="스텁 서버의 응답 지연 (초)"
+    )
+    clients.add_argument(
+        "--client",
+        action="append",
+        choices=list(CLIENTS),
+        help="측정할 클라이언트 (여러 번 지정 가능, 기본값: 전체)",
+    )
+    clients.set_defaults(run=run_clients)
+
+    timings = subparsers.add_parser(
+        "timings", parents=[output], help="단계별 소요 시간 기록 비용"
+    )
+    timings.add_argument("--requests", type=int, default=50, help="라운드별 요청 수")
+    timings.add_argument("--rounds", type=int, default=400, help="꺼짐/켜짐 측정 반복 횟수")
+    timings.add_argument(
+        "--iterations", type=int, default=100000, help="기록 작업만 반복할 횟수"
+    )
+    timings.set_defaults(run=run_timings)
+
+    sessions = subparsers.add_parser(
+        "sessions", parents=[output], help="세션 생성 비용 (공유 SSL 컨텍스트 유무)"
+    )
+    sessions.add_argument("--sessions", type=int, default=200, help="라운드별 세션 수")
+    sessions.add_argument("--rounds", type=int, default=5, help="측정 반복 횟수")
+    sessions.set_defaults(run=run_sessions)
+
+    ciphers = subparsers.add_parser(
+        "ciphers", parents=[output], help="cipher suite별 핸드셰이크/전송 비용"
+    )
+    ciphers.add_argument("--handshakes", type=int, default=200, help="suite별 핸드셰이크 수")
+    ciphers.add_argument(
+        "--bulk-bytes", type=int, default=BULK_BYTES, help="전송 속도 측정 본문 크기"
+    )
+    ciphers.add_argument(
+        "--cipher", action="append", help="측정할 suite (여러 번 지정 가능, 기본값: 전체)"
+    )
+    ciphers.set_defaults(run=run_ciphers)
+
+    args = parser.parse_args(argv)
+    result = {
+        "benchmark": args.benchmark,
+        "environment": environment(),
+        "results": args.run(args),
+    }
+    text = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
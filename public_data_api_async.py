@@ -0,0 +1,451 @@
+"""
+Public Data API Async Client
+
+공공데이터 API용 asyncio 클라이언트
+PublicDataApiSSLAdapter와 같은 TLS 프로필(버전, cipher, 레거시 옵션)을 사용하며,
+asyncio 스트림 위에서 호스트별 keep-alive 연결 풀을 관리합니다.
+"""
+
+import asyncio
+import collections
+import json
+import ssl
+import time
+import zlib
+from urllib.parse import urlencode, urlsplit
+
+from requests.structures import CaseInsensitiveDict
+
+from public_data_api_cache import cache_key, is_cacheable_response
+from public_data_api_ratelimit import rate_limit_key
+from public_data_api_ssl_adapter import (
+    PUBLIC_DATA_API_HEADERS,
+    create_public_data_api_ssl_context,
+    get_public_data_api_ssl_context,
+    resolve_tls_profile,
+)
+
+# 호스트별 최대 동시 연결 수
+DEFAULT_LIMIT_PER_HOST = 10
+
+# 요청 하나(연결 + 전송 + 응답 수신)의 기본 제한 시간 (초)
+DEFAULT_TIMEOUT = 30.0
+
+# 풀에 보관한 유휴 연결을 재사용할 최대 시간 (초)
+DEFAULT_KEEPALIVE_TIMEOUT = 15.0
+
+# 응답 헤더 한 줄과 전체 헤더 수 제한
+_MAX_LINE = 65536
+_MAX_HEADERS = 100
+
+# 응답 일부를 받은 뒤 끊겨도 다시 보내도 되는 메서드
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+
+
+class AsyncPublicDataApiResponse:
+    """
+    AsyncPublicDataApiClient의 응답
+
+    requests.Response와 비슷하게 status_code, headers, content, text,
+    json()을 제공합니다. 본문은 이미 모두 읽혀 있습니다.
+    """
+
+    def __init__(self, url, status_code, reason, headers, content):
+        self.url = url
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+
+    def __repr__(self):
+        return f"<AsyncPublicDataApiResponse [{self.status_code}]>"
+
+    @property
+    def ok(self):
+        """상태 코드가 400 미만이면 True"""
+        return self.status_code < 400
+
+    @property
+    def encoding(self):
+        """Content-Type 헤더의 charset (없으면 utf-8)"""
+        content_type = self.headers.get("Content-Type", "")
+        for param in content_type.split(";")[1:]:
+            name, _, value = param.strip().partition("=")
+            if name.lower() == "charset" and value:
+                return value.strip("\"'")
+        return "utf-8"
+
+    @property
+    def text(self):
+        """본문을 문자열로 디코딩"""
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self, **kwargs):
+        """본문을 JSON으로 파싱"""
+        return json.loads(self.content.decode(self.encoding), **kwargs)
+
+
+class _NoResponseError(ConnectionError):
+    """응답을 한 바이트도 받기 전에 연결이 끊긴 경우"""
+
+
+class _PooledConnection:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.last_used = time.monotonic()
+        self.reused = False
+
+    def is_usable(self, keepalive_timeout):
+        if self.reader.at_eof() or self.writer.is_closing():
+            return False
+        return time.monotonic() - self.last_used <= keepalive_timeout
+
+    def close(self):
+        self.writer.close()
+
+
+class AsyncPublicDataApiClient:
+    """
+    공공데이터 API용 asyncio 클라이언트
+
+    PublicDataApiSSLAdapter와 같은 공유 SSL 컨텍스트를 사용하고, 호스트별로
+    keep-alive 연결을 풀에 보관하여 재사용합니다. 호스트별 동시 연결 수는
+    limit_per_host로 제한됩니다.
+
+    Usage:
+        async with AsyncPublicDataApiClient() as client:
+            response = await client.get(
+                "https://apis.data.go.kr/your-endpoint", params={"pageNo": 1}
+            )
+            print(response.json())
+    """
+
+    def __init__(
+        self,
+        tls_profile=None,
+        limit_per_host=DEFAULT_LIMIT_PER_HOST,
+        timeout=DEFAULT_TIMEOUT,
+        keepalive_timeout=DEFAULT_KEEPALIVE_TIMEOUT,
+        verify=True,
+        headers=None,
+        rate_limiter=None,
+        single_flight=None,
+    ):
+        """
+        Args:
+            tls_profile (TLSProfile | None): 사용할 TLS 설정.
+                기본값은 LEGACY_TLS_PROFILE
+            limit_per_host (int): 호스트별 최대 동시 연결 수
+            timeout (float | None): 요청당 기본 제한 시간 (초)
+            keepalive_timeout (float): 유휴 연결을 재사용할 최대 시간 (초)
+            verify (bool | str): 인증서 검증 여부 또는 CA 번들 경로
+            headers (dict | None): 기본 헤더에 추가/덮어쓸 헤더
+            rate_limiter (ServiceKeyRateLimiter | None): 서비스키별 호출 속도
+                제한 (동기 세션과 같은 객체를 공유할 수 있음)
+            single_flight (SingleFlight | None): 동시에 진행 중인 같은 GET
+                요청을 하나로 합침 (합쳐진 요청은 같은 응답 객체를 받음)
+        """
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.keepalive_timeout = keepalive_timeout
+        self.rate_limiter = rate_limiter
+        self.single_flight = single_flight
+        self.ssl_context = self._create_ssl_context(tls_profile, verify)
+
+        self.headers = CaseInsensitiveDict(PUBLIC_DATA_API_HEADERS)
+        # asyncio 클라이언트는 brotli를 해제하지 않음
+        self.headers["Accept-Encoding"] = "gzip, deflate"
+        self.headers.pop("Upgrade-Insecure-Requests", None)
+        if headers:
+            self.headers.update(headers)
+
+        self._idle = collections.defaultdict(collections.deque)
+        self._semaphores = {}
+        self._closed = False
+
+    @staticmethod
+    def _create_ssl_context(tls_profile, verify):
+        # SSL 계층에서 호스트 이름을 확인하도록 검증 시 check_hostname을 켬
+        profile = resolve_tls_profile(tls_profile, verify, check_hostname=True)
+        if isinstance(verify, str):
+            # 사용자 CA 번들은 공유 컨텍스트를 오염시키지 않도록 별도로 생성
+            ctx = create_public_data_api_ssl_context(profile)
+            ctx.load_verify_locations(verify)
+            return ctx
+        return get_public_data_api_ssl_context(profile)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """풀에 보관된 모든 연결을 닫음"""
+        self._closed = True
+        writers = []
+        for connections in self._idle.values():
+            while connections:
+                connection = connections.popleft()
+                connection.close()
+                writers.append(connection.writer)
+        for writer in writers:
+            try:
+                await writer.wait_closed()
+            except (OSError, ssl.SSLError):
+                pass
+
+    async def get(self, url, params=None, **kwargs):
+        """GET 요청 (인자는 request()와 같음)"""
+        return await self.request("GET", url, params=params, **kwargs)
+
+    async def post(self, url, data=None, json=None, **kwargs):
+        """POST 요청 (인자는 request()와 같음)"""
+        return await self.request("POST", url, data=data, json=json, **kwargs)
+
+    async def request(
+        self, method, url, params=None, data=None, json=None, headers=None, timeout=None
+    ):
+        """
+        HTTP 요청을 보내고 응답 전체를 읽어 반환
+
+        Args:
+            method (str): HTTP 메서드
+            url (str): 요청할 URL (http 또는 https)
+            params (dict | None): 쿼리 파라미터
+            data (bytes | str | dict | None): 요청 본문 (dict는 form 인코딩)
+            json (object | None): JSON으로 보낼 본문
+            headers (dict | None): 이 요청에만 추가할 헤더
+            timeout (float | None): 제한 시간 (None이면 클라이언트 기본값)
+
+        Returns:
+            AsyncPublicDataApiResponse: 응답
+
+        Raises:
+            asyncio.TimeoutError: 제한 시간 초과
+            ssl.SSLError: TLS 핸드셰이크 또는 인증서 검증 실패
+            ConnectionError: 연결 실패 또는 잘못된 HTTP 응답
+            PublicDataApiQuotaExceededError: rate_limiter의 일일 한도 초과
+        """
+        if self._closed:
+            raise RuntimeError("AsyncPublicDataApiClient가 이미 닫혔습니다")
+
+        url_parts = urlsplit(url)
+        scheme = url_parts.scheme.lower()
+        if scheme not in ("http", "https"):
+            raise ValueError(f"지원하지 않는 URL 스킴: {url}")
+        host = url_parts.hostname
+        port = url_parts.port or (443 if scheme == "https" else 80)
+
+        target = url_parts.path or "/"
+        query = url_parts.query
+        if params:
+            encoded = urlencode(params, doseq=True)
+            query = f"{query}&{encoded}" if query else encoded
+        if query:
+            target = f"{target}?{query}"
+
+        request_headers = CaseInsensitiveDict(self.headers)
+        request_headers["Host"] = url_parts.netloc.rpartition("@")[2]
+        if headers:
+            request_headers.update(headers)
+        body = self._encode_body(data, json, request_headers)
+        if body or method.upper() in ("POST", "PUT", "PATCH"):
+            request_headers["Content-Length"] = str(len(body))
+
+        head = f"{method.upper()} {target} HTTP/1.1\r\n" + "".join(
+            f"{name}: {value}\r\n" for name, value in request_headers.items()
+        )
+        payload = head.encode("latin-1") + b"\r\n" + body
+
+        if timeout is None:
+            timeout = self.timeout
+        full_url = f"{scheme}://{url_parts.netloc}{target}"
+
+        async def fetch():
+            if self.rate_limiter is not None:
+                # 호출 허가를 기다리는 시간은 요청 제한 시간에 포함하지 않음
+                await self.rate_limiter.acquire_async(*rate_limit_key(full_url))
+            return await asyncio.wait_for(
+                self._send((scheme, host, port), method.upper(), url, payload),
+                timeout,
+            )
+
+        if self.single_flight is not None and method.upper() == "GET":
+            return await self.single_flight.do_async(
+                cache_key("GET", full_url), fetch, is_cacheable_response
+            )
+        return await fetch()
+
+    @staticmethod
+    def _encode_body(data, json_body, headers):
+        if json_body is not None:
+            headers.setdefault("Content-Type", "application/json")
+            return json.dumps(json_body).encode("utf-8")
+        if data is None:
+            return b""
+        if isinstance(data, dict):
+            headers.setdefault("Content-Type", "application/x-www-form-urlencoded")
+            return urlencode(data, doseq=True).encode("utf-8")
+        if isinstance(data, str):
+            return data.encode("utf-8")
+        return bytes(data)
+
+    async def _send(self, key, method, url, payload):
+        semaphore = self._semaphores.get(key)
+        if semaphore is None:
+            semaphore = self._semaphores[key] = asyncio.Semaphore(self.limit_per_host)
+
+        async with semaphore:
+            connection = await self._acquire(key)
+            try:
+                try:
+                    response, reusable = await self._exchange(
+                        connection, method, url, payload
+                    )
+                except (ConnectionError, asyncio.IncompleteReadError) as exc:
+                    if not connection.reused:
+                        raise
+                    # 서버가 조용히 닫은 keep-alive 연결이면 새 연결로 한 번 재시도.
+                    # 응답 일부를 받은 뒤 끊겼다면 서버가 요청을 처리했을 수 있으므로
+                    # 멱등 메서드만 다시 보냄
+                    if not (
+                        isinstance(exc, _NoResponseError)
+                        or method in _IDEMPOTENT_METHODS
+                    ):
+                        raise
+                    connection.close()
+                    connection = await self._open(key)
+                    response, reusable = await self._exchange(
+                        connection, method, url, payload
+                    )
+            except BaseException:
+                connection.close()
+                raise
+
+            if reusable and not self._closed:
+                connection.last_used = time.monotonic()
+                connection.reused = True
+                self._idle[key].append(connection)
+            else:
+                connection.close()
+            return response
+
+    async def _acquire(self, key):
+        idle = self._idle[key]
+        while idle:
+            connection = idle.pop()
+            if connection.is_usable(self.keepalive_timeout):
+                return connection
+            connection.close()
+        return await self._open(key)
+
+    async def _open(self, key):
+        scheme, host, port = key
+        if scheme == "https":
+            reader, writer = await asyncio.open_connection(
+                host, port, ssl=self.ssl_context, server_hostname=host, limit=_MAX_LINE
+            )
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=_MAX_LINE)
+        return _PooledConnection(reader, writer)
+
+    async def _exchange(self, connection, method, url, payload):
+        try:
+            connection.writer.write(payload)
+            await connection.writer.drain()
+        except ConnectionError as exc:
+            raise _NoResponseError(str(exc)) from exc
+        return await _read_response(connection.reader, method, url)
+
+
+async def _read_response(reader, method, url):
+    """
+    스트림에서 HTTP/1.x 응답 하나를 읽음
+
+    Returns:
+        tuple: (AsyncPublicDataApiResponse, 연결 재사용 가능 여부)
+    """
+    try:
+        status_line = await reader.readline()
+    except ConnectionError as exc:
+        raise _NoResponseError(str(exc)) from exc
+    if not status_line:
+        raise _NoResponseError("서버가 응답 없이 연결을 닫았습니다")
+    try:
+        version, status, reason = (
+            status_line.decode("latin-1").rstrip("\r\n").split(" ", 2) + [""]
+        )[:3]
+        status_code = int(status)
+    except ValueError:
+        raise ConnectionError(f"잘못된 HTTP 상태 줄: {status_line!r}") from None
+
+    headers = CaseInsensitiveDict()
+    for _ in range(_MAX_HEADERS):
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n"):
+            break
+        if not line:
+            raise ConnectionError("응답 헤더를 읽는 중 연결이 끊어졌습니다")
+        name, _, value = line.decode("latin-1").partition(":")
+        name, value = name.strip(), value.strip()
+        if name in headers:
+            headers[name] = f"{headers[name]}, {value}"
+        else:
+            headers[name] = value
+    else:
+        raise ConnectionError("응답 헤더가 너무 많습니다")
+
+    connection_header = headers.get("Connection", "").lower()
+    reusable = (
+        "close" not in connection_header
+        if version == "HTTP/1.1"
+        else "keep-alive" in connection_header
+    )
+
+    if method == "HEAD" or status_code in (204, 304) or 100 <= status_code < 200:
+        content = b""
+    elif "chunked" in headers.get("Transfer-Encoding", "").lower():
+        content = await _read_chunked(reader)
+    elif "Content-Length" in headers:
+        content = await reader.readexactly(int(headers["Content-Length"]))
+    else:
+        # 길이 정보가 없으면 연결이 닫힐 때까지 읽음
+        content = await reader.read()
+        reusable = False
+
+    content = _decode_content(content, headers.get("Content-Encoding", ""))
+    response = AsyncPublicDataApiResponse(url, status_code, reason, headers, content)
+    return response, reusable
+
+
+async def _read_chunked(reader):
+    chunks = []
+    while True:
+        size_line = await reader.readline()
+        if not size_line:
+            raise ConnectionError("chunked 본문을 읽는 중 연결이 끊어졌습니다")
+        size = int(size_line.split(b";", 1)[0].strip(), 16)
+        if size == 0:
+            # trailer 헤더는 무시
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)  # chunk 끝의 CRLF
+
+
+def _decode_content(content, content_encoding):
+    encoding = content_encoding.strip().lower()
+    if not content or encoding in ("", "identity"):
+        return content
+    if encoding in ("gzip", "x-gzip"):
+        return zlib.decompress(content, 16 + zlib.MAX_WBITS)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(content)
+        except zlib.error:
+            # zlib 헤더 없이 raw deflate로 보내는 서버 대응
+            return zlib.decompress(content, -zlib.MAX_WBITS)
+    raise ConnectionError(f"지원하지 않는 Content-Encoding: {content_encoding}")
@@ -0,0 +1,918 @@
+"""
+Public Data API Response Cache
+
+자주 바뀌지 않는 공공데이터(지역 코드, 정류장 목록, 월별 실거래가 등)의 응답 캐시
+정규화한 요청 파라미터를 키로 크기 제한이 있는 LRU에 엔드포인트별 TTL 동안 보관합니다.
+SQLiteCacheStore를 붙이면 여러 프로세스와 재시작 사이에 공유되는 디스크 계층이 추가됩니다.
+SingleFlight는 동시에 진행 중인 같은 요청을 하나의 업스트림 호출로 합칩니다.
+"""
+
+import asyncio
+import collections
+import copy
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from public_data_api_response import (
+    RESULT_RETRYABLE,
+    PublicDataApiError,
+    classify_response,
+    classify_result_code,
+)
+
+# 기본 보관 시간 (초)
+DEFAULT_TTL = 300.0
+
+# 메모리 캐시 기본 크기 제한
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# 디스크 캐시 기본 크기 제한
+DEFAULT_DISK_MAX_BYTES = 512 * 1024 * 1024
+
+# 디스크 항목의 마지막 사용 시각을 갱신하는 최소 간격 (초).
+# 읽을 때마다 쓰기 잠금을 잡지 않도록 LRU 순서는 이 정도로만 정확하게 유지
+_DISK_TOUCH_INTERVAL = 60.0
+
+# 만료된 항목을 백그라운드에서 갱신할 기본 스레드 수
+DEFAULT_REFRESH_WORKERS = 2
+
+# 이 크기 이상의 본문은 압축하여 보관 (XML/JSON은 보통 5~10배 줄어듦)
+DEFAULT_COMPRESS_THRESHOLD = 1024
+
+# 캐시에 보관할 응답 헤더 (본문은 디코딩된 상태로 보관하므로
+# Content-Encoding, Content-Length 등은 보관하지 않음)
+CACHED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Date")
+
+CacheEntry = collections.namedtuple(
+    "CacheEntry",
+    ["status_code", "reason", "headers", "body", "compressed", "stored_at", "expires_at"],
+)
+CacheEntry.__doc__ = """
+캐시된 응답
+
+headers는 (이름, 값) 튜플, body는 compressed가 True면 zlib으로 압축된 본문입니다.
+stored_at과 expires_at은 유닉스 시각입니다.
+"""
+
+
+def cache_key(method, url):
+    """
+    요청의 정규화된 캐시 키
+
+    쿼리 파라미터를 정렬하고 serviceKey를 빼므로, 파라미터 순서나
+    서비스키가 달라도 같은 데이터를 요청하면 같은 키가 됩니다.
+
+    Args:
+        method (str): HTTP 메서드
+        url (str): 쿼리 파라미터를 포함한 요청 URL
+
+    Returns:
+        str: 캐시 키
+
+    Example:
+        >>> cache_key("GET", "https://apis.data.go.kr/a?pageNo=1&serviceKey=K&numOfRows=10")
+        'GET https://apis.data.go.kr/a?numOfRows=10&pageNo=1'
+    """
+    url_parts = urlsplit(url)
+    params = sorted(
+        (name, value)
+        for name, value in parse_qsl(url_parts.query, keep_blank_values=True)
+        if name.lower() != "servicekey"
+    )
+    return (
+        f"{method.upper()} {url_parts.scheme.lower()}://{url_parts.netloc.lower()}"
+        f"{url_parts.path}?{urlencode(params)}"
+    )
+
+
+def is_cacheable_response(response):
+    """
+    캐시에 보관하거나 다른 요청과 나눠도 되는 응답인지 확인
+
+    HTTP 200이고 resultCode가 정상(또는 데이터 없음)인 응답만 해당합니다.
+    서비스키 미등록, 한도 초과처럼 서비스키마다 다른 오류 응답은 제외됩니다.
+
+    Args:
+        response (requests.Response): 본문을 읽은 응답
+
+    Returns:
+        bool: 나눠도 되면 True
+    """
+    return response.status_code == 200 and classify_response(response)[0] is None
+
+
+def cache_endpoint(url):
+    """
+    URL의 엔드포인트 ("호스트/경로", endpoint_ttls의 키 형식)
+
+    Args:
+        url (str): 요청 URL
+
+    Returns:
+        str: 엔드포인트
+    """
+    url_parts = urlsplit(url)
+    return f"{url_parts.netloc.lower()}{url_parts.path}"
+
+
+class ResponseCache:
+    """
+    LRU + TTL 응답 캐시 계층
+
+    GET 요청의 정상 응답(HTTP 200, 정상 resultCode)을 보관하여 TTL 안의 같은
+    요청은 네트워크를 거치지 않고 응답합니다. 오류 봉투는 보관하지 않습니다.
+    본문은 디코딩된 상태로, 일정 크기 이상이면 zlib으로 압축하여 보관하며
+    항목 수와 전체 크기가 제한을 넘으면 가장 오래 쓰지 않은 항목부터 버립니다.
+
+    만료된 항목에 ETag나 Last-Modified가 있으면 If-None-Match/
+    If-Modified-Since 조건부 요청으로 다시 확인하고, 304 Not Modified면
+    본문을 다시 받지 않고 보관 시간만 연장합니다.
+
+    disk_store를 지정하면 메모리에 없는 항목을 디스크에서 찾아 메모리로
+    올리고, 새로 보관하는 항목은 두 계층에 모두 씁니다.
+
+    stale_while_revalidate를 지정하면 만료 후 그 시간 동안은 만료된 항목으로
+    바로 응답하고 백그라운드 스레드에서 갱신합니다. 만료 직후의 요청이
+    느린 구형 TLS 왕복을 기다리지 않게 하여 p99 지연을 줄입니다.
+    stale_if_error를 지정하면 만료 후 그 시간 동안은 서버가 5xx나 일시적
+    오류 봉투(resultCode 99 등)를 돌려주거나 연결에 실패할 때 만료된 항목으로
+    대신 응답합니다. 만료된 항목으로 응답하면 response.stale이 True입니다.
+
+    캐시에서 꺼낸 응답은 response.from_cache가 True입니다. 요청에
+    Cache-Control: no-cache 헤더가 있으면 캐시를 건너뛰고 새로 받아 갱신하며,
+    stream=True 요청은 캐시하지 않습니다.
+
+    Usage:
+        cache = ResponseCache(ttl=600, endpoint_ttls={
+            "apis.data.go.kr/1741000/StanReginCd/getStanReginCdList": 86400,
+        }, disk_store=SQLiteCacheStore("/var/cache/public-data-api/cache.db"))
+        session = create_public_data_api_session(cache=cache)
+        response = session.get(url, params=params)
+        print(cache.stats())
+    """
+
+    def __init__(
+        self,
+        ttl=DEFAULT_TTL,
+        endpoint_ttls=None,
+        max_entries=DEFAULT_MAX_ENTRIES,
+        max_bytes=DEFAULT_MAX_BYTES,
+        compress_threshold=DEFAULT_COMPRESS_THRESHOLD,
+        disk_store=None,
+        stale_while_revalidate=0,
+        stale_if_error=0,
+        refresh_workers=DEFAULT_REFRESH_WORKERS,
+        time_func=time.time,
+    ):
+        """
+        Args:
+            ttl (float): 기본 보관 시간 (초)
+            endpoint_ttls (dict | None): 엔드포인트("호스트/경로")별 보관 시간.
+                0이면 그 엔드포인트는 캐시하지 않음
+            max_entries (int): 최대 항목 수
+            max_bytes (int): 보관한 본문의 최대 전체 크기 (바이트)
+            compress_threshold (int | None): 이 크기 이상의 본문은 압축.
+                None이면 압축하지 않음
+            disk_store (SQLiteCacheStore | None): 메모리 뒤에 둘 디스크 계층
+            stale_while_revalidate (float): 만료 후 만료된 항목으로 응답하며
+                백그라운드에서 갱신할 시간 (초)
+            stale_if_error (float): 만료 후 서버 오류 시 만료된 항목으로
+                응답할 시간 (초)
+            refresh_workers (int): 백그라운드 갱신 스레드 수
+            time_func (callable): 현재 유닉스 시각 (테스트용)
+        """
+        self.ttl = ttl
+        self.endpoint_ttls = {
+            endpoint.lower(): value for endpoint, value in (endpoint_ttls or {}).items()
+        }
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.compress_threshold = compress_threshold
+        self.disk_store = disk_store
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_if_error = stale_if_error
+        self.refresh_workers = refresh_workers
+        self.time_func = time_func
+
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self._bytes = 0
+        self._stats = collections.Counter()
+        self._refreshing = set()
+        self._executor = None
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def send(self, next_send, request, **kwargs):
+        """
+        어댑터 계층 인터페이스: 캐시된 응답이 있으면 반환하고, 없으면 받아서 보관
+
+        Args:
+            next_send (callable): 다음 계층의 send 함수
+            request (requests.PreparedRequest): 보낼 요청
+            **kwargs: HTTPAdapter.send()의 인자들
+
+        Returns:
+            requests.Response: 응답 (캐시에서 꺼냈으면 from_cache가 True)
+        """
+        if request.method != "GET" or kwargs.get("stream"):
+            return next_send(request, **kwargs)
+        ttl = self.ttl_for(request.url)
+        if not ttl:
+            return next_send(request, **kwargs)
+
+        key = cache_key(request.method, request.url)
+        entry = None
+        if "no-cache" not in request.headers.get("Cache-Control", ""):
+            entry = self._lookup(key)
+        now = self.time_func()
+        if entry is not None:
+            if entry.expires_at > now:
+                self._count("hits")
+                return self.build_response(entry, request)
+            if now < entry.expires_at + self.stale_while_revalidate:
+                self._count("stale_hits")
+                self._refresh_in_background(key, next_send, request, kwargs, entry, ttl)
+                return self.build_response(entry, request, stale=True)
+            self._count("expired")
+        self._count("misses")
+
+        serve_stale_on_error = (
+            entry is not None and now < entry.expires_at + self.stale_if_error
+        )
+        try:
+            response = self._fetch(key, next_send, request, kwargs, entry, ttl)
+        except (requests.ConnectionError, requests.Timeout, PublicDataApiError) as e:
+            if serve_stale_on_error and _is_transient_error(e):
+                self._count("stale_if_error")
+                return self.build_response(entry, request, stale=True)
+            raise
+        if serve_stale_on_error and _is_transient_response(response):
+            self._count("stale_if_error")
+            response.close()
+            return self.build_response(entry, request, stale=True)
+        return response
+
+    def ttl_for(self, url):
+        """
+        URL에 적용할 보관 시간
+
+        Args:
+            url (str): 요청 URL
+
+        Returns:
+            float: 보관 시간 (초)
+        """
+        return self.endpoint_ttls.get(cache_endpoint(url), self.ttl)
+
+    def get(self, key):
+        """
+        만료되지 않은 항목을 꺼냄 (메모리, 디스크 순서로 찾음)
+
+        Args:
+            key (str): cache_key()로 만든 키
+
+        Returns:
+            CacheEntry | None: 캐시된 항목
+        """
+        entry = self._lookup(key)
+        if entry is None or entry.expires_at <= self.time_func():
+            return None
+        return entry
+
+    def store(self, key, response, ttl):
+        """
+        보관할 수 있는 응답이면 보관
+
+        HTTP 200이고 봉투의 resultCode가 정상(또는 데이터 없음)인 응답만
+        보관합니다.
+
+        Args:
+            key (str): cache_key()로 만든 키
+            response (requests.Response): 본문을 읽은 응답
+            ttl (float): 보관 시간 (초)
+
+        Returns:
+            bool: 보관했으면 True
+        """
+        if not is_cacheable_response(response):
+            return False
+        self._put(key, self.make_entry(response, ttl))
+        self._count("stores")
+        return True
+
+    def discard(self, key):
+        """
+        항목을 두 계층에서 모두 버림
+
+        Args:
+            key (str): cache_key()로 만든 키
+        """
+        with self._lock:
+            self._remove(key)
+        if self.disk_store is not None:
+            self.disk_store.delete(key)
+
+    def make_entry(self, response, ttl):
+        """
+        응답을 CacheEntry로 변환
+
+        Args:
+            response (requests.Response): 본문을 읽은 응답
+            ttl (float): 보관 시간 (초)
+
+        Returns:
+            CacheEntry: 보관할 항목
+        """
+        body = response.content
+        compressed = (
+            self.compress_threshold is not None and len(body) >= self.compress_threshold
+        )
+        if compressed:
+            body = zlib.compress(body, 1)
+        headers = tuple(
+            (name, response.headers[name])
+            for name in CACHED_HEADERS
+            if name in response.headers
+        )
+        now = self.time_func()
+        return CacheEntry(
+            response.status_code, response.reason, headers, body, compressed, now, now + ttl
+        )
+
+    @staticmethod
+    def build_response(entry, request, stale=False):
+        """
+        캐시된 항목으로 requests.Response를 만듦
+
+        Args:
+            entry (CacheEntry): 캐시된 항목
+            request (requests.PreparedRequest): 요청
+            stale (bool): 만료된 항목으로 응답하는지 여부
+
+        Returns:
+            requests.Response: from_cache가 True인 응답
+        """
+        response = requests.Response()
+        response.status_code = entry.status_code
+        response.reason = entry.reason
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = zlib.decompress(entry.body) if entry.compressed else entry.body
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.from_cache = True
+        response.stale = stale
+        response.timings = None  # 서버에 요청하지 않았으므로 단계별 소요 시간 없음
+        return response
+
+    def close(self):
+        """백그라운드 갱신 스레드를 정리 (진행 중인 갱신은 끝날 때까지 기다림)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def clear(self):
+        """모든 항목을 버림 (디스크 계층 포함)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if self.disk_store is not None:
+            self.disk_store.clear()
+
+    def stats(self):
+        """
+        캐시 통계
+
+        Returns:
+            dict: hits, misses, expired, revalidated, disk_hits, stale_hits,
+                stale_if_error, refreshes, refresh_errors, stores, evictions,
+                entries, bytes (디스크 계층이 있으면 disk 통계 포함)
+        """
+        with self._lock:
+            stats = {
+                name: self._stats[name]
+                for name in (
+                    "hits",
+                    "misses",
+                    "expired",
+                    "revalidated",
+                    "disk_hits",
+                    "stale_hits",
+                    "stale_if_error",
+                    "refreshes",
+                    "refresh_errors",
+                    "stores",
+                    "evictions",
+                )
+            }
+            stats["entries"] = len(self._entries)
+            stats["bytes"] = self._bytes
+        if self.disk_store is not None:
+            stats["disk"] = self.disk_store.stats()
+        return stats
+
+    def _fetch(self, key, next_send, request, kwargs, entry, ttl):
+        # 서버에서 받아 보관 (만료된 항목이 있으면 조건부 요청으로 확인)
+        upstream_request = request
+        if entry is not None:
+            upstream_request = self._conditional_request(request, entry)
+            if upstream_request is None:
+                upstream_request = request
+                if self.time_func() >= entry.expires_at + max(
+                    self.stale_while_revalidate, self.stale_if_error
+                ):
+                    # 검증자도 없고 더 쓸 수도 없는 항목
+                    self.discard(key)
+
+        response = next_send(upstream_request, **kwargs)
+        if entry is not None and response.status_code == 304:
+            # 바뀌지 않았으므로 보관한 본문의 보관 시간만 연장
+            now = self.time_func()
+            entry = entry._replace(stored_at=now, expires_at=now + ttl)
+            self._put(key, entry)
+            self._count("revalidated")
+            return self.build_response(entry, request)
+
+        self.store(key, response, ttl)
+        return response
+
+    def _refresh_in_background(self, key, next_send, request, kwargs, entry, ttl):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.refresh_workers,
+                    thread_name_prefix="public-data-api-cache-refresh",
+                )
+            executor = self._executor
+        executor.submit(
+            self._refresh, key, next_send, request.copy(), dict(kwargs), entry, ttl
+        )
+
+    def _refresh(self, key, next_send, request, kwargs, entry, ttl):
+        try:
+            self._fetch(key, next_send, request, kwargs, entry, ttl).close()
+            self._count("refreshes")
+        except Exception:
+            # 갱신에 실패해도 다음 요청이 다시 시도하므로 통계만 남김
+            self._count("refresh_errors")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _lookup(self, key):
+        # 만료 여부와 관계없이 메모리, 디스크 순서로 찾음
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if self.disk_store is None:
+            return None
+        entry = self.disk_store.get(key)
+        if entry is not None:
+            self._count("disk_hits")
+            self._put_memory(key, entry)
+        return entry
+
+    def _put(self, key, entry):
+        self._put_memory(key, entry)
+        if self.disk_store is not None:
+            self.disk_store.put(key, entry)
+
+    def _put_memory(self, key, entry):
+        with self._lock:
+            self._remove(key)
+            if len(entry.body) > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self._bytes += len(entry.body)
+            self._evict()
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    @staticmethod
+    def _conditional_request(request, entry):
+        # 검증자(ETag, Last-Modified)가 없으면 None
+        headers = dict(entry.headers)
+        if "ETag" not in headers and "Last-Modified" not in headers:
+            return None
+        conditional = request.copy()
+        if "ETag" in headers:
+            conditional.headers["If-None-Match"] = headers["ETag"]
+        if "Last-Modified" in headers:
+            conditional.headers["If-Modified-Since"] = headers["Last-Modified"]
+        return conditional
+
+    def _remove(self, key):
+        # 호출자가 self._lock을 잡고 있어야 함
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry.body)
+
+    def _evict(self):
+        # 호출자가 self._lock을 잡고 있어야 함
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= len(entry.body)
+            self._stats["evictions"] += 1
+
+
+def _is_transient_response(response):
+    # 잠시 후 다시 받으면 정상일 수 있는 응답 (5xx, 일시적 오류 봉투)
+    return response.status_code >= 500 or classify_response(response)[0] == RESULT_RETRYABLE
+
+
+def _is_transient_error(error):
+    if isinstance(error, PublicDataApiError):
+        return classify_result_code(error.result_code) == RESULT_RETRYABLE
+    return True
+
+
+class SQLiteCacheStore:
+    """
+    여러 프로세스와 재시작 사이에 공유되는 디스크 응답 캐시 계층
+
+    ResponseCache의 disk_store로 사용합니다. 항목은 WAL 모드의 SQLite
+    파일에 (압축된) 본문과 TTL, 응답 헤더(ETag/Last-Modified 포함)를 함께
+    보관하므로, 새로 시작한 워커도 네트워크를 거치지 않고 이전 프로세스가
+    받아 둔 응답을 쓸 수 있습니다. 전체 크기가 max_bytes를 넘으면 마지막
+    사용 시각이 가장 오래된 항목부터 지웁니다.
+
+    만료된 항목도 ETag/Last-Modified로 다시 확인할 수 있도록 바로 지우지
+    않으며, 크기 제한에 따라 정리됩니다. 연결은 스레드와 프로세스마다 따로
+    열며, fork된 자식 프로세스는 부모의 연결을 쓰지 않고 새로 엽니다.
+
+    Usage:
+        store = SQLiteCacheStore("/var/cache/public-data-api/cache.db")
+        cache = ResponseCache(ttl=3600, disk_store=store)
+        session = create_public_data_api_session(cache=cache)
+    """
+
+    def __init__(
+        self, path, max_bytes=DEFAULT_DISK_MAX_BYTES, time_func=time.time, busy_timeout=5.0
+    ):
+        """
+        Args:
+            path (str | os.PathLike): SQLite 파일 경로 (프로세스들이 공유)
+            max_bytes (int): 보관한 본문의 최대 전체 크기 (바이트)
+            time_func (callable): 현재 유닉스 시각 (테스트용)
+            busy_timeout (float): 다른 프로세스의 쓰기 잠금을 기다릴 최대 시간 (초)
+        """
+        self.path = os.fspath(path)
+        self.max_bytes = max_bytes
+        self.time_func = time_func
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._connection()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def __len__(self):
+        return self._connection().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def get(self, key):
+        """
+        항목을 꺼냄 (만료된 항목 포함)
+
+        Args:
+            key (str): cache_key()로 만든 키
+
+        Returns:
+            CacheEntry | None: 보관된 항목
+        """
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT status_code, reason, headers, body, compressed, stored_at,"
+            " expires_at, accessed FROM responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        now = self.time_func()
+        if now - row[7] >= _DISK_TOUCH_INTERVAL:
+            connection.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        headers = tuple(tuple(header) for header in json.loads(row[2]))
+        return CacheEntry(row[0], row[1], headers, row[3], bool(row[4]), row[5], row[6])
+
+    def put(self, key, entry):
+        """
+        항목을 보관하고 크기 제한을 넘으면 오래 쓰지 않은 항목부터 지움
+
+        Args:
+            key (str): cache_key()로 만든 키
+            entry (CacheEntry): 보관할 항목
+        """
+        size = len(entry.body)
+        if size > self.max_bytes:
+            self.delete(key)
+            return
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    entry.status_code,
+                    entry.reason,
+                    json.dumps(entry.headers),
+                    entry.body,
+                    int(entry.compressed),
+                    entry.stored_at,
+                    entry.expires_at,
+                    self.time_func(),
+                    size,
+                ),
+            )
+            self._evict(connection)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def delete(self, key):
+        """
+        항목을 지움
+
+        Args:
+            key (str): cache_key()로 만든 키
+        """
+        self._connection().execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self):
+        """모든 항목을 지움"""
+        self._connection().execute("DELETE FROM responses")
+
+    def stats(self):
+        """
+        디스크 계층 통계
+
+        Returns:
+            dict: entries, bytes
+        """
+        entries, size = self._connection().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        return {"entries": entries, "bytes": size}
+
+    def close(self):
+        """현재 스레드의 SQLite 연결을 닫음"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None and self._local.pid == os.getpid():
+            connection.close()
+        self._local.__dict__.clear()
+
+    def _evict(self, connection):
+        # 트랜잭션 안에서 호출됨
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = connection.execute("SELECT key, size FROM responses ORDER BY accessed")
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def _connection(self):
+        local = self._local
+        if getattr(local, "pid", None) != os.getpid():
+            # fork 이전에 열린 연결은 자식 프로세스에서 쓰거나 닫지 않음
+            local.connection = self._connect()
+            local.pid = os.getpid()
+        return local.connection
+
+    def _connect(self):
+        connection = sqlite3.connect(
+            self.path, timeout=self.busy_timeout, isolation_level=None
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " status_code INTEGER NOT NULL,"
+            " reason TEXT,"
+            " headers TEXT NOT NULL,"
+            " body BLOB NOT NULL,"
+            " compressed INTEGER NOT NULL,"
+            " stored_at REAL NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " accessed REAL NOT NULL,"
+            " size INTEGER NOT NULL"
+            ")"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+        )
+        return connection
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.shared = False  # 기다리던 호출들이 결과를 받아도 되는지 여부
+
+
+class SingleFlight:
+    """
+    동시에 진행 중인 같은 요청을 하나로 합치는 계층 (single-flight)
+
+    여러 스레드가 같은 엔드포인트와 파라미터를 동시에 요청하면 첫 요청만
+    서버로 보내고, 나머지는 그 응답을 기다렸다가 복사본을 받습니다. 같은
+    데이터에 호출 한도를 여러 번 쓰지 않고, 캐시가 비어 있을 때 몰리는
+    요청도 한 번으로 줄어듭니다. 요청은 cache_key()로 비교하므로 서비스키가
+    달라도 같은 요청으로 봅니다. 그래서 정상 응답(is_cacheable_response())만
+    나누고, 첫 요청이 예외나 오류 응답(서비스키 미등록, 한도 초과 등)으로
+    끝나면 기다리던 요청들은 각자 요청을 보냅니다.
+
+    어댑터 계층으로 마운트하면 GET 요청에 적용되며(stream=True 제외),
+    do()/do_async()로 임의의 함수나 코루틴에도 사용할 수 있습니다.
+    AsyncPublicDataApiClient의 single_flight 인자로도 넘길 수 있습니다.
+
+    Usage:
+        single_flight = SingleFlight()
+        session = create_public_data_api_session(single_flight=single_flight)
+        ...
+        print(single_flight.stats())  # {"leaders": 1, "coalesced": 9, "refetched": 0, "in_flight": 0}
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._async_tasks = {}
+        self._stats = collections.Counter()
+
+    def send(self, next_send, request, **kwargs):
+        """
+        어댑터 계층 인터페이스: 같은 요청이 진행 중이면 그 응답을 함께 받음
+
+        Args:
+            next_send (callable): 다음 계층의 send 함수
+            request (requests.PreparedRequest): 보낼 요청
+            **kwargs: HTTPAdapter.send()의 인자들
+
+        Returns:
+            requests.Response: 응답 (다른 요청의 응답을 받았으면 coalesced가 True)
+        """
+        if request.method != "GET" or kwargs.get("stream"):
+            return next_send(request, **kwargs)
+
+        def fetch():
+            response = next_send(request, **kwargs)
+            response.content  # 기다리는 요청들과 나누도록 본문을 미리 읽음
+            return response
+
+        response, leader = self._do(
+            cache_key(request.method, request.url), fetch, is_cacheable_response
+        )
+        if leader:
+            return response
+        # 응답 객체는 요청마다 따로 (본문 bytes는 공유)
+        shared = copy.copy(response)
+        shared.headers = CaseInsensitiveDict(response.headers)
+        shared.request = request
+        shared.coalesced = True
+        return shared
+
+    def do(self, key, func, share=None):
+        """
+        key가 같은 호출이 진행 중이면 그 결과를, 아니면 func()를 실행한 결과를 반환
+
+        진행 중이던 호출이 예외로 끝났거나 share(결과)가 False이면 기다리던
+        호출들은 그 결과를 받지 않고 각자 func()를 실행합니다.
+
+        Args:
+            key (hashable): 호출을 구분하는 키
+            func (callable): 인자 없는 함수
+            share (callable | None): 결과를 기다리던 호출들과 나눠도 되는지
+                판단하는 함수 (None이면 예외가 아닌 결과는 모두 나눔)
+
+        Returns:
+            object: func()의 결과 (결과를 나눠 받은 호출들은 같은 객체를 받음)
+        """
+        return self._do(key, func, share)[0]
+
+    async def do_async(self, key, func, share=None):
+        """
+        do()의 asyncio 버전
+
+        첫 호출의 코루틴은 별도 태스크로 실행되므로, 기다리는 쪽 하나가
+        취소되어도 다른 쪽이 받을 결과에는 영향이 없습니다.
+
+        Args:
+            key (hashable): 호출을 구분하는 키
+            func (callable): 인자 없이 코루틴을 반환하는 함수
+            share (callable | None): 결과를 기다리던 호출들과 나눠도 되는지
+                판단하는 함수 (None이면 예외가 아닌 결과는 모두 나눔)
+
+        Returns:
+            object: 코루틴의 결과 (결과를 나눠 받은 호출들은 같은 객체를 받음)
+        """
+        task_key = (asyncio.get_running_loop(), key)
+        with self._lock:
+            task = self._async_tasks.get(task_key)
+            leader = task is None
+            if leader:
+                task = asyncio.ensure_future(func())
+                self._async_tasks[task_key] = task
+                task.add_done_callback(lambda _: self._async_tasks.pop(task_key, None))
+                self._stats["leaders"] += 1
+            else:
+                self._stats["coalesced"] += 1
+        if leader:
+            return await asyncio.shield(task)
+
+        try:
+            result = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.cancelled():
+                raise  # 기다리던 쪽이 취소됨
+        except Exception:
+            pass
+        else:
+            if share is None or share(result):
+                return result
+        # 첫 호출의 예외나 오류 응답은 나누지 않고 직접 실행
+        with self._lock:
+            self._stats["refetched"] += 1
+        return await func()
+
+    def stats(self):
+        """
+        합치기 통계
+
+        Returns:
+            dict: leaders(실제로 실행한 호출 수), coalesced(다른 호출을 기다린
+                수), refetched(그중 결과를 나눠 받지 못해 직접 실행한 수),
+                in_flight(지금 진행 중인 호출 수)
+        """
+        with self._lock:
+            return {
+                "leaders": self._stats["leaders"],
+                "coalesced": self._stats["coalesced"],
+                "refetched": self._stats["refetched"],
+                "in_flight": len(self._calls) + len(self._async_tasks),
+            }
+
+    def _do(self, key, func, share=None):
+        # (결과, 직접 실행했는지 여부)를 반환
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._stats["leaders"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.shared:
+                return call.result, False
+            # 첫 호출의 예외나 오류 응답은 나누지 않고 직접 실행
+            with self._lock:
+                self._stats["refetched"] += 1
+            return func(), True
+
+        try:
+            call.result = func()
+            call.shared = share is None or share(call.result)
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, True
@@ -0,0 +1,257 @@
+"""
+Public Data API Fan-out
+
+한 엔드포인트를 파라미터 격자(예: 법정동 코드 LAWD_CD × 계약년월 DEAL_YMD)의
+모든 칸에 대해 호출하는 실행기
+칸마다 모든 페이지를 읽어 칸 식별자와 함께 반환하고, 끝난 칸을 체크포인트 파일에
+기록하여 중단된 작업을 이어서 실행할 수 있습니다.
+"""
+
+import collections
+import itertools
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlencode
+
+import requests
+
+from public_data_api_pagination import fetch_page, remaining_page_nos
+from public_data_api_response import PublicDataApiQuotaExceededError
+from public_data_api_ssl_adapter import PublicDataApiClient
+
+# 동시에 처리할 칸 수
+DEFAULT_MAX_WORKERS = 8
+
+FanOutResult = collections.namedtuple(
+    "FanOutResult", ["cell_id", "cell", "items", "total_count", "error"]
+)
+FanOutResult.__doc__ = """
+격자 한 칸의 결과
+
+cell_id는 칸의 파라미터로 만든 식별자(예: "LAWD_CD=11110&DEAL_YMD=202401"),
+cell은 칸의 파라미터 dict, items는 모든 페이지의 item, total_count는 첫 페이지의
+totalCount입니다. on_error="yield"로 실패한 칸을 반환할 때는 items가 비어 있고
+error에 예외가 담깁니다 (성공하면 None).
+"""
+
+
+def grid_cells(param_grid):
+    """
+    파라미터 격자의 칸을 차례로 반환하는 제너레이터
+
+    Args:
+        param_grid (dict | iterable): 파라미터 이름 -> 값 목록 dict(모든 조합),
+            또는 칸 파라미터 dict의 목록
+
+    Yields:
+        tuple: (cell_id, cell) - 식별자와 칸의 파라미터 dict
+
+    Example:
+        >>> list(grid_cells({"LAWD_CD": ["11110"], "DEAL_YMD": ["202401", "202402"]}))
+        [('LAWD_CD=11110&DEAL_YMD=202401', {'LAWD_CD': '11110', 'DEAL_YMD': '202401'}),
+         ('LAWD_CD=11110&DEAL_YMD=202402', {'LAWD_CD': '11110', 'DEAL_YMD': '202402'})]
+    """
+    if isinstance(param_grid, dict):
+        names = list(param_grid)
+        cells = (
+            dict(zip(names, values))
+            for values in itertools.product(*(param_grid[name] for name in names))
+        )
+    else:
+        cells = (dict(cell) for cell in param_grid)
+    for cell in cells:
+        yield urlencode(cell), cell
+
+
+class FanOutCheckpoint:
+    """
+    끝난 칸의 식별자를 한 줄씩 덧붙여 기록하는 체크포인트 파일
+
+    줄바꿈으로 끝나지 않은 마지막 줄(기록 중 중단된 줄)은 잘라냅니다.
+    기록할 때마다 flush하므로 프로세스가 죽어도 기록된 칸은 남습니다.
+
+    Usage:
+        with FanOutCheckpoint("trades.checkpoint") as checkpoint:
+            for result in fan_out(client, url, grid, checkpoint=checkpoint):
+                save(result)
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): 체크포인트 파일 경로 (없으면 새로 만듦)
+        """
+        self.path = path
+        self._done = set()
+        content = ""
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                content = f.read()
+        lines = content.split("\n")
+        self._done.update(line for line in lines[:-1] if line)
+
+        if lines[-1]:
+            # 중단된 줄을 잘라내어 다음 기록과 이어지지 않게 함
+            os.truncate(path, len(content.encode("utf-8")) - len(lines[-1].encode("utf-8")))
+        self._file = open(path, "a", encoding="utf-8")
+
+    def __contains__(self, cell_id):
+        return cell_id in self._done
+
+    def __len__(self):
+        return len(self._done)
+
+    def add(self, cell_id):
+        """
+        칸을 끝난 것으로 기록
+
+        Args:
+            cell_id (str): 칸 식별자
+        """
+        if cell_id in self._done:
+            return
+        self._file.write(cell_id + "\n")
+        self._file.flush()
+        self._done.add(cell_id)
+
+    def close(self):
+        """파일을 닫음"""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def fetch_cell(session, url, params, **kwargs):
+    """
+    칸 하나의 모든 페이지를 차례로 요청
+
+    Args:
+        session (requests.Session | PublicDataApiClient): 공공데이터 API 세션
+        url (str): 요청할 URL
+        params (dict): 쿼리 파라미터 (칸의 파라미터 포함)
+        **kwargs: session.get()에 전달할 추가 인자들
+
+    Returns:
+        tuple: (items, total_count)
+
+    Raises:
+        requests.HTTPError: HTTP 오류 응답
+        PublicDataApiError: 응답 봉투의 resultCode가 오류인 경우
+    """
+    first_page_no = int(params.get("pageNo", 1))
+    first_page = fetch_page(session, url, {**params, "pageNo": first_page_no}, **kwargs)
+    items = list(first_page.items)
+    for page_no in remaining_page_nos(first_page, first_page_no, params.get("numOfRows")):
+        items.extend(fetch_page(session, url, {**params, "pageNo": page_no}, **kwargs).items)
+    return items, first_page.total_count
+
+
+def fan_out(
+    session,
+    url,
+    param_grid,
+    params=None,
+    max_workers=DEFAULT_MAX_WORKERS,
+    checkpoint=None,
+    on_error="raise",
+    **kwargs,
+):
+    """
+    파라미터 격자의 모든 칸을 호출하여 끝나는 순서대로 반환하는 제너레이터
+
+    칸은 max_workers개의 스레드로 동시에 처리하고, 각 칸의 페이지는 그 칸의
+    스레드에서 차례로 읽습니다. 동시에 진행 중인 칸은 max_workers의 두 배를
+    넘지 않으므로 격자가 커도 메모리에 쌓이는 결과는 일정합니다. 모든 요청은
+    세션의 어댑터를 거치므로 어댑터에 설정한 호출 한도(rate_limiter), 재시도,
+    캐시가 그대로 적용되며, 일일 한도를 모두 쓰면
+    PublicDataApiQuotaExceededError로 멈춥니다.
+
+    requests.Session은 스레드 안전이 보장되지 않으므로, 세션을 주면
+    PublicDataApiClient.from_session()으로 감싸 스레드마다 세션을 복사하고
+    연결 풀(어댑터)만 공유합니다.
+
+    checkpoint를 지정하면 이미 끝난 칸은 건너뛰고, 반환한 칸은 호출한 쪽이
+    다음 결과를 요청할 때 끝난 것으로 기록합니다. 따라서 중단된 뒤 다시
+    실행하면 마지막으로 받은 칸부터 다시 받습니다 (최소 한 번 전달).
+    실패한 칸은 기록하지 않습니다.
+
+    Args:
+        session (PublicDataApiClient | requests.Session): 공공데이터 API 클라이언트
+            또는 세션
+        url (str): 요청할 URL
+        param_grid (dict | iterable): 격자 (grid_cells() 참고)
+        params (dict | None): 모든 칸에 공통인 쿼리 파라미터 (serviceKey, numOfRows 등)
+        max_workers (int): 동시에 처리할 칸 수
+        checkpoint (str | FanOutCheckpoint | None): 체크포인트 파일 경로 또는 객체
+        on_error (str): "raise"면 칸이 실패할 때 예외를 발생시키고, "yield"면
+            error가 담긴 FanOutResult를 반환한 뒤 계속 진행
+        **kwargs: session.get()에 전달할 추가 인자들
+
+    Yields:
+        FanOutResult: 칸 하나의 결과
+
+    Raises:
+        ValueError: on_error가 "raise"나 "yield"가 아닌 경우
+        PublicDataApiQuotaExceededError: 호출 한도를 모두 쓴 경우 (on_error와 무관)
+        requests.RequestException: 칸이 실패한 경우 (on_error="raise")
+
+    Example:
+        >>> grid = {"LAWD_CD": region_codes, "DEAL_YMD": months}
+        >>> for result in fan_out(client, url, grid, {"serviceKey": key, "numOfRows": 1000},
+        ...                       checkpoint="trades.checkpoint"):
+        ...     save(result.cell_id, result.items)
+    """
+    if on_error not in ("raise", "yield"):
+        raise ValueError(f"on_error는 'raise' 또는 'yield'여야 합니다: {on_error!r}")
+
+    if isinstance(session, requests.Session):
+        session = PublicDataApiClient.from_session(session)
+    params = dict(params or {})
+    owns_checkpoint = isinstance(checkpoint, (str, os.PathLike))
+    if owns_checkpoint:
+        checkpoint = FanOutCheckpoint(checkpoint)
+    cells = (
+        (cell_id, cell)
+        for cell_id, cell in grid_cells(param_grid)
+        if checkpoint is None or cell_id not in checkpoint
+    )
+
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="public-data-api-fanout"
+    )
+    pending = {}  # Future -> (cell_id, cell)
+
+    def submit(count):
+        for cell_id, cell in itertools.islice(cells, count):
+            future = executor.submit(fetch_cell, session, url, {**params, **cell}, **kwargs)
+            pending[future] = (cell_id, cell)
+
+    try:
+        submit(max_workers * 2)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            results = [(future, pending.pop(future)) for future in done]
+            submit(len(done))
+            for future, (cell_id, cell) in results:
+                try:
+                    items, total_count = future.result()
+                except PublicDataApiQuotaExceededError:
+                    raise
+                except requests.RequestException as e:
+                    if on_error == "raise":
+                        raise
+                    yield FanOutResult(cell_id, cell, [], None, e)
+                    continue
+                yield FanOutResult(cell_id, cell, items, total_count, None)
+                if checkpoint is not None:
+                    checkpoint.add(cell_id)
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+        if owns_checkpoint:
+            checkpoint.close()
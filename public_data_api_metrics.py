@@ -0,0 +1,447 @@
+"""
+Public Data API Metrics
+
+어댑터의 요청, 연결 풀, TLS 핸드셰이크, 캐시, 호출 한도 지표를
+Prometheus 텍스트 형식으로 내보내는 모듈
+외부 패키지 없이 표준 라이브러리만 사용합니다.
+"""
+
+import bisect
+import hashlib
+import itertools
+import math
+import threading
+import time
+import weakref
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from public_data_api_response import PublicDataApiError, peek_result_code
+from public_data_api_ssl_adapter import TIMING_BUCKETS, PoolStats
+
+# Prometheus 텍스트 형식의 Content-Type
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# start_http_server()의 기본 포트
+DEFAULT_METRICS_PORT = 9464
+
+# 지표 이름 접두사
+METRIC_PREFIX = "public_data_api"
+
+# PoolStats 항목 중 누적값이 아닌 항목 (gauge)
+_POOL_GAUGES = frozenset({"in_use", "max_in_use"})
+
+# ResponseCache.stats() 항목 중 누적값이 아닌 항목 (gauge)
+_CACHE_GAUGES = frozenset({"entries", "bytes"})
+
+
+def service_key_id(service_key):
+    """
+    서비스키를 지표 레이블에 쓸 짧은 식별자로 바꿈
+
+    서비스키가 지표 수집 시스템에 그대로 남지 않도록 SHA-256 앞 8자리를 씁니다.
+
+    Args:
+        service_key (str | None): 서비스키
+
+    Returns:
+        str: 16진수 8자리 (서비스키가 없으면 빈 문자열)
+    """
+    if not service_key:
+        return ""
+    return hashlib.sha256(service_key.encode()).hexdigest()[:8]
+
+
+class _Histogram:
+    # 구간별 관측 수와 합계 (호출자가 잠금을 잡고 있어야 함)
+    __slots__ = ("counts", "sum")
+
+    def __init__(self, size):
+        self.counts = [0] * size
+        self.sum = 0.0
+
+
+class _MetricFamily:
+    """지표 하나(이름, 종류, 설명)와 레이블별 값"""
+
+    def __init__(self, name, kind, help_text):
+        self.name = name
+        self.kind = kind
+        self.help_text = help_text
+        self.samples = {}
+
+    def add(self, labels, value, peak=False):
+        # 같은 레이블의 값은 더함 (여러 어댑터의 풀 통계 등). peak=True인
+        # 최댓값 항목은 더하지 않고 가장 큰 값을 씀
+        key = tuple(labels.items())
+        if peak:
+            self.samples[key] = max(self.samples.get(key, value), value)
+        else:
+            self.samples[key] = self.samples.get(key, 0) + value
+
+    def render(self, lines):
+        lines.append(f"# HELP {self.name} {self.help_text}")
+        lines.append(f"# TYPE {self.name} {self.kind}")
+        for labels, value in self.samples.items():
+            lines.append(f"{self.name}{_format_labels(labels)} {_format_value(value)}")
+
+
+class _HistogramFamily(_MetricFamily):
+    """Prometheus histogram (_bucket, _sum, _count)"""
+
+    def __init__(self, name, help_text):
+        super().__init__(name, "histogram", help_text)
+
+    def add_histogram(self, labels, buckets, cumulative, total):
+        """
+        Args:
+            labels (dict): 레이블
+            buckets (sequence): 구간 상한 (마지막은 math.inf)
+            cumulative (sequence): 구간별 누적 관측 수
+            total (float): 관측값 합계
+        """
+        key = tuple(labels.items())
+        entry = self.samples.get(key)
+        if entry is None:
+            self.samples[key] = (list(buckets), list(cumulative), total)
+        else:
+            merged = [a + b for a, b in zip(entry[1], cumulative)]
+            self.samples[key] = (entry[0], merged, entry[2] + total)
+
+    def render(self, lines):
+        lines.append(f"# HELP {self.name} {self.help_text}")
+        lines.append(f"# TYPE {self.name} histogram")
+        for labels, (buckets, cumulative, total) in self.samples.items():
+            for bound, count in zip(buckets, cumulative):
+                le = "+Inf" if math.isinf(bound) else _format_value(bound)
+                bucket_labels = labels + (("le", le),)
+                lines.append(f"{self.name}_bucket{_format_labels(bucket_labels)} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative[-1]}")
+
+
+class PublicDataApiMetrics:
+    """
+    요청 지표를 집계하는 어댑터 계층이자 Prometheus 내보내기
+
+    어댑터에 metrics=로 마운트하면 가장 바깥 계층에서 호출마다 호스트,
+    엔드포인트(경로), HTTP 상태, resultCode별 요청 수와 소요 시간
+    히스토그램을 기록합니다. 재시도와 캐시를 거친 최종 결과가 한 번
+    기록됩니다. render()는 마운트된 어댑터들의 연결 풀, 핸드셰이크,
+    단계별 소요 시간(record_timings=True일 때), 캐시, 동시 요청 합치기,
+    호출 한도 통계도 함께 내보냅니다.
+
+    엔드포인트 레이블에는 쿼리(서비스키 포함)를 넣지 않으며, 호출 한도
+    지표의 서비스키는 service_key_id()로 바꿔 씁니다.
+
+    Usage:
+        metrics = PublicDataApiMetrics()
+        session = create_public_data_api_session(metrics=metrics, cache=cache)
+        server = start_http_server(metrics, port=9464)  # GET /metrics
+        print(metrics.render())
+    """
+
+    def __init__(self, buckets=TIMING_BUCKETS, clock=time.perf_counter):
+        """
+        Args:
+            buckets (sequence): 요청 소요 시간 히스토그램의 구간 상한 (초)
+            clock (callable): 소요 시간 측정에 쓸 시계 (테스트용)
+        """
+        self.buckets = tuple(buckets)
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._requests = {}
+        self._errors = {}
+        self._durations = {}
+        self._adapters = weakref.WeakSet()
+
+    def add_adapter(self, adapter):
+        """render()에서 통계를 모을 어댑터 등록 (어댑터 생성자가 호출)"""
+        self._adapters.add(adapter)
+
+    def send(self, next_send, request, **kwargs):
+        """
+        어댑터 계층 인터페이스: 요청을 전달하고 결과를 기록
+
+        stream=True 요청은 본문을 읽지 않으므로 resultCode 없이 기록합니다.
+
+        Args:
+            next_send (callable): 다음 계층의 send 함수
+            request (requests.PreparedRequest): 보낼 요청
+            **kwargs: HTTPAdapter.send()의 인자들
+
+        Returns:
+            requests.Response: 응답
+        """
+        url = urlsplit(request.url)
+        host = (url.hostname or "").lower()
+        endpoint = url.path or "/"
+        start = self.clock()
+        try:
+            response = next_send(request, **kwargs)
+        except PublicDataApiError as e:
+            # 봉투 오류(재시도 후 실패, 호출 한도 초과 등)도 응답 결과로 기록
+            status = "" if e.response is None else str(e.response.status_code)
+            self._record(host, endpoint, status, e.result_code or "", self.clock() - start)
+            raise
+        except Exception as e:
+            self._record_error(host, endpoint, type(e).__name__, self.clock() - start)
+            raise
+
+        result_code = ""
+        if not kwargs.get("stream"):
+            result_code = peek_result_code(response.content)[0] or ""
+        self._record(
+            host, endpoint, str(response.status_code), result_code, self.clock() - start
+        )
+        return response
+
+    def _record(self, host, endpoint, status, result_code, elapsed):
+        key = (host, endpoint, status, result_code)
+        with self._lock:
+            self._requests[key] = self._requests.get(key, 0) + 1
+            self._observe(host, endpoint, elapsed)
+
+    def _record_error(self, host, endpoint, error, elapsed):
+        key = (host, endpoint, error)
+        with self._lock:
+            self._errors[key] = self._errors.get(key, 0) + 1
+            self._observe(host, endpoint, elapsed)
+
+    def _observe(self, host, endpoint, elapsed):
+        # 호출자가 self._lock을 잡고 있어야 함
+        histogram = self._durations.get((host, endpoint))
+        if histogram is None:
+            histogram = self._durations[(host, endpoint)] = _Histogram(len(self.buckets) + 1)
+        histogram.counts[bisect.bisect_left(self.buckets, elapsed)] += 1
+        histogram.sum += elapsed
+
+    def render(self):
+        """
+        모든 지표를 Prometheus 텍스트 형식으로 반환
+
+        Returns:
+            str: Prometheus 텍스트 형식 (버전 0.0.4)
+        """
+        families = {}
+
+        def family(name, kind, help_text):
+            name = f"{METRIC_PREFIX}_{name}"
+            if name not in families:
+                families[name] = (
+                    _HistogramFamily(name, help_text)
+                    if kind == "histogram"
+                    else _MetricFamily(name, kind, help_text)
+                )
+            return families[name]
+
+        self._collect_requests(family)
+        adapters = list(self._adapters)
+        self._collect_pools(family, adapters)
+        self._collect_handshakes(family, adapters)
+        self._collect_layers(family, adapters)
+
+        lines = []
+        for metric_family in families.values():
+            if metric_family.samples:
+                metric_family.render(lines)
+        return "\n".join(lines) + "\n"
+
+    def _collect_requests(self, family):
+        with self._lock:
+            requests_total = dict(self._requests)
+            errors = dict(self._errors)
+            durations = {
+                key: (list(histogram.counts), histogram.sum)
+                for key, histogram in self._durations.items()
+            }
+
+        counter = family("requests_total", "counter", "어댑터를 거친 호출 수 (최종 결과 기준)")
+        for (host, endpoint, status, result_code), value in requests_total.items():
+            counter.add(
+                {"host": host, "endpoint": endpoint, "status": status, "result_code": result_code},
+                value,
+            )
+        counter = family("request_errors_total", "counter", "응답 없이 예외로 끝난 호출 수")
+        for (host, endpoint, error), value in errors.items():
+            counter.add({"host": host, "endpoint": endpoint, "error": error}, value)
+
+        histogram = family("request_duration_seconds", "histogram", "호출 소요 시간 (초)")
+        bounds = self.buckets + (math.inf,)
+        for (host, endpoint), (counts, total) in durations.items():
+            histogram.add_histogram(
+                {"host": host, "endpoint": endpoint},
+                bounds,
+                list(itertools.accumulate(counts)),
+                total,
+            )
+
+    @staticmethod
+    def _collect_pools(family, adapters):
+        for adapter in adapters:
+            for pool, stats in adapter.pool_stats().items():
+                for field in PoolStats.FIELDS:
+                    # pool_timeouts는 이미 접두사가 있으므로 그대로 씀
+                    name = field if field.startswith("pool_") else f"pool_{field}"
+                    if field in _POOL_GAUGES:
+                        kind = "gauge"
+                    else:
+                        name, kind = f"{name}_total", "counter"
+                    family(name, kind, f"연결 풀 {field} (PoolStats 참고)").add(
+                        {"pool": pool}, stats[field], peak=field in PoolStats.PEAK_FIELDS
+                    )
+
+            for pool, phases in adapter.timing_stats().items():
+                histogram = family(
+                    "phase_duration_seconds",
+                    "histogram",
+                    "요청 단계별 소요 시간 (초, record_timings=True일 때)",
+                )
+                for phase, snapshot in phases.items():
+                    bounds, cumulative = zip(*snapshot["buckets"])
+                    histogram.add_histogram(
+                        {"pool": pool, "phase": phase}, bounds, cumulative, snapshot["sum"]
+                    )
+
+            for pool, suites in adapter.tls_stats(per_pool=True).items():
+                for (version, cipher), stats in suites.items():
+                    labels = {"pool": pool, "version": version, "cipher": cipher}
+                    family(
+                        "tls_connections_total", "counter", "협상된 TLS 버전/cipher별 연결 수"
+                    ).add(labels, stats["connections"])
+                    family(
+                        "tls_resumed_connections_total",
+                        "counter",
+                        "세션을 재개한 연결 수",
+                    ).add(labels, stats["resumed"])
+                    bounds, cumulative = zip(*stats["handshake_buckets"])
+                    family(
+                        "tls_handshake_seconds",
+                        "histogram",
+                        "TLS 핸드셰이크 소요 시간 (초)",
+                    ).add_histogram(labels, bounds, cumulative, stats["handshake_seconds"])
+                    family(
+                        "tls_weak", "gauge", "약한 프로토콜/cipher 여부 (is_weak_tls 참고)"
+                    ).add(labels, int(stats["weak"]))
+
+    @staticmethod
+    def _collect_handshakes(family, adapters):
+        # SSL 컨텍스트는 어댑터들이 공유하므로 한 번씩만 셈
+        contexts = {}
+        for adapter in adapters:
+            for ctx in adapter._ssl_contexts():
+                contexts[id(ctx)] = ctx
+        handshakes = family("handshakes_total", "counter", "TLS 핸드셰이크 수")
+        cached = family("tls_cached_sessions", "gauge", "재개용으로 보관 중인 TLS 세션 수")
+        for ctx in contexts.values():
+            stats = ctx.handshake_stats()
+            handshakes.add({"kind": "full"}, stats["full"])
+            handshakes.add({"kind": "resumed"}, stats["resumed"])
+            cached.add({}, stats["cached_sessions"])
+
+    @staticmethod
+    def _collect_layers(family, adapters):
+        # 캐시, 호출 한도 등은 여러 어댑터가 공유할 수 있으므로 한 번씩만 셈
+        layers = {}
+        for adapter in adapters:
+            for name in ("cache", "single_flight", "rate_limiter"):
+                layer = getattr(adapter, name, None)
+                if layer is not None:
+                    layers[id(layer)] = (name, layer)
+
+        for name, layer in layers.values():
+            if name == "cache":
+                for field, value in layer.stats().items():
+                    if not isinstance(value, (int, float)):
+                        continue  # 디스크 계층 통계(dict)
+                    if field in _CACHE_GAUGES:
+                        metric = family(f"cache_{field}", "gauge", f"응답 캐시 {field}")
+                    else:
+                        metric = family(f"cache_{field}_total", "counter", f"응답 캐시 {field}")
+                    metric.add({}, value)
+            elif name == "single_flight":
+                stats = layer.stats()
+                family("single_flight_leaders_total", "counter", "실제로 보낸 요청 수").add(
+                    {}, stats["leaders"]
+                )
+                family(
+                    "single_flight_coalesced_total", "counter", "다른 요청을 기다린 수"
+                ).add({}, stats["coalesced"])
+                family(
+                    "single_flight_refetched_total",
+                    "counter",
+                    "기다린 요청의 결과가 실패여서 직접 다시 보낸 수",
+                ).add({}, stats["refetched"])
+                family("single_flight_in_flight", "gauge", "진행 중인 요청 수").add(
+                    {}, stats["in_flight"]
+                )
+            else:
+                used = family("quota_used", "gauge", "오늘(KST) 사용한 호출 수")
+                limit = family("quota_limit", "gauge", "일일 호출 한도")
+                for (service_key, endpoint), usage in layer.usage().items():
+                    labels = {"key_id": service_key_id(service_key), "endpoint": endpoint or ""}
+                    used.add(labels, usage["used"])
+                    if usage["limit"] is not None:
+                        limit.add(labels, usage["limit"])
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    pairs = ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels)
+    return "{" + pairs + "}"
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value):
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        return repr(value)
+    return str(value)
+
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = self.server.metrics.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_http_server(metrics, port=DEFAULT_METRICS_PORT, host="127.0.0.1"):
+    """
+    GET /metrics로 지표를 내보내는 HTTP 서버를 백그라운드 스레드에서 시작
+
+    Args:
+        metrics (PublicDataApiMetrics): 내보낼 지표
+        port (int): 바인드할 포트 (0이면 임의 포트)
+        host (str): 바인드할 주소. 외부에서 수집하려면 "0.0.0.0"
+
+    Returns:
+        http.server.ThreadingHTTPServer: 실행 중인 서버 (server_address로
+            포트 확인, shutdown()과 server_close()로 종료)
+
+    Example:
+        >>> server = start_http_server(metrics, port=9464)
+        >>> # curl http://127.0.0.1:9464/metrics
+    """
+    server = ThreadingHTTPServer((host, port), _MetricsRequestHandler)
+    server.daemon_threads = True
+    server.metrics = metrics
+    thread = threading.Thread(
+        target=server.serve_forever, name="public-data-api-metrics", daemon=True
+    )
+    thread.start()
+    return server
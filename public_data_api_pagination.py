@@ -0,0 +1,180 @@
+"""
+Public Data API Pagination
+
+pageNo/numOfRows/totalCount로 페이지를 나누는 공공데이터 API의 자동 페이지 순회
+첫 페이지에서 totalCount를 읽은 뒤 나머지 페이지는 제한된 스레드 풀로 동시에 가져옵니다.
+"""
+
+import collections
+import itertools
+import math
+import xml.etree.ElementTree as ET
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import requests
+
+from public_data_api_response import (
+    RESULT_QUOTA,
+    PublicDataApiError,
+    PublicDataApiQuotaExceededError,
+    classify_result_code,
+    parse_page,
+)
+from public_data_api_ssl_adapter import PublicDataApiClient
+
+# 첫 페이지 이후 페이지를 동시에 가져올 스레드 수
+DEFAULT_MAX_WORKERS = 4
+
+
+def fetch_page(session, url, params, **kwargs):
+    """
+    페이지 하나를 요청하고 해석
+
+    Args:
+        session (requests.Session | PublicDataApiClient): 공공데이터 API 세션
+        url (str): 요청할 URL
+        params (dict): 쿼리 파라미터 (pageNo, numOfRows 포함)
+        **kwargs: session.get()에 전달할 추가 인자들
+
+    Returns:
+        PublicDataApiPage: 해석된 페이지
+
+    Raises:
+        requests.HTTPError: HTTP 오류 응답
+        PublicDataApiQuotaExceededError: 호출 한도 초과 resultCode (21, 22)
+        PublicDataApiError: 응답 봉투의 resultCode가 오류이거나 본문을 해석할 수 없는 경우
+    """
+    response = session.get(url, params=params, **kwargs)
+    response.raise_for_status()
+    try:
+        page = parse_page(response)
+    except (ValueError, ET.ParseError) as e:
+        # 게이트웨이 HTML 오류 페이지, 잘린 본문 등
+        raise PublicDataApiError(
+            f"응답 봉투를 해석할 수 없습니다: {e}", response=response
+        ) from e
+    classification = classify_result_code(page.result_code)
+    if classification is not None:
+        error_class = (
+            PublicDataApiQuotaExceededError
+            if classification == RESULT_QUOTA
+            else PublicDataApiError
+        )
+        raise error_class(
+            result_code=page.result_code, result_msg=page.result_msg, response=response
+        )
+    return page
+
+
+def paginate(
+    session, url, params=None, max_workers=DEFAULT_MAX_WORKERS, ordered=True, **kwargs
+):
+    """
+    모든 페이지의 item을 차례로 반환하는 제너레이터
+
+    첫 페이지(params의 pageNo, 기본 1)를 먼저 요청하여 totalCount를 읽고,
+    나머지 페이지는 max_workers개의 스레드로 동시에 요청합니다. 동시에
+    진행 중인 요청은 max_workers의 두 배를 넘지 않으므로 totalCount가
+    커도 메모리에 쌓이는 페이지 수는 일정합니다. 제너레이터를 중간에
+    닫으면 아직 시작하지 않은 요청은 취소됩니다.
+
+    requests.Session은 스레드 안전이 보장되지 않으므로, 세션을 주면
+    PublicDataApiClient.from_session()으로 감싸 스레드마다 세션을 복사하고
+    연결 풀(어댑터)만 공유합니다. 이때 응답이 설정한 쿠키는 원래 세션에
+    반영되지 않습니다.
+
+    Args:
+        session (PublicDataApiClient | requests.Session): 공공데이터 API 클라이언트
+            또는 세션
+        url (str): 요청할 URL
+        params (dict | None): 쿼리 파라미터 (serviceKey, numOfRows 등)
+        max_workers (int): 동시에 페이지를 가져올 스레드 수
+        ordered (bool): True면 페이지 순서대로, False면 도착하는 순서대로 반환
+        **kwargs: session.get()에 전달할 추가 인자들
+
+    Yields:
+        dict: 응답의 item
+
+    Raises:
+        requests.HTTPError: HTTP 오류 응답
+        PublicDataApiError: 응답 봉투의 resultCode가 오류인 경우
+
+    Example:
+        >>> with PublicDataApiClient() as client:
+        ...     for item in paginate(client, url, {"serviceKey": key, "numOfRows": 100}):
+        ...         print(item)
+    """
+    if isinstance(session, requests.Session):
+        session = PublicDataApiClient.from_session(session)
+    params = dict(params or {})
+    first_page_no = int(params.get("pageNo", 1))
+
+    first_page = fetch_page(session, url, {**params, "pageNo": first_page_no}, **kwargs)
+    yield from first_page.items
+
+    page_nos = remaining_page_nos(first_page, first_page_no, params.get("numOfRows"))
+    for page in _fetch_pages(
+        session, url, params, page_nos, max_workers, ordered, kwargs
+    ):
+        yield from page.items
+
+
+def remaining_page_nos(first_page, first_page_no=1, num_of_rows=None):
+    """
+    첫 페이지의 totalCount로 나머지 페이지 번호를 계산
+
+    Args:
+        first_page (PublicDataApiPage): 먼저 받은 페이지
+        first_page_no (int): 먼저 받은 페이지의 번호
+        num_of_rows (int | str | None): 요청한 numOfRows. 서버가 페이지당 행 수를
+            줄여서 응답할 수 있으므로 응답의 numOfRows가 있으면 그 값을 씁니다.
+
+    Returns:
+        range: first_page_no 다음부터 마지막 페이지까지의 번호.
+            totalCount를 알 수 없으면 빈 range
+
+    Example:
+        >>> remaining_page_nos(first_page, 1, 100)  # totalCount 250
+        range(2, 4)
+    """
+    num_of_rows = int(first_page.num_of_rows or num_of_rows or len(first_page.items))
+    if not first_page.total_count or not num_of_rows:
+        return range(0)
+    last_page_no = math.ceil(first_page.total_count / num_of_rows)
+    return range(first_page_no + 1, last_page_no + 1)
+
+
+def _fetch_pages(session, url, params, page_nos, max_workers, ordered, kwargs):
+    if not page_nos:
+        return
+
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="public-data-api-page"
+    )
+    remaining = iter(page_nos)
+    pending = collections.deque()
+
+    def submit(count):
+        for page_no in itertools.islice(remaining, count):
+            pending.append(
+                executor.submit(
+                    fetch_page, session, url, {**params, "pageNo": page_no}, **kwargs
+                )
+            )
+
+    try:
+        submit(max_workers * 2)
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+            submit(len(done))
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
@@ -0,0 +1,504 @@
+"""
+Public Data API TLS Probe
+
+서버가 지원하는 TLS 설정을 직접 확인하여 가장 빠른 프로필을 고르는 모듈
+SSL Labs를 손으로 돌려 cipher 목록을 고치는 대신, 빠른 프로필부터 호환성이
+높은 프로필 순으로 핸드셰이크를 시도하고 처음 성공한 프로필을 호스트별로
+보관합니다. SQLiteProbeStore를 붙이면 결과가 재시작 사이에 유지됩니다.
+"""
+
+import collections
+import os
+import socket
+import sqlite3
+import ssl
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+from public_data_api_cache import SingleFlight
+from public_data_api_ssl_adapter import (
+    LEGACY_OPTIONS,
+    LEGACY_TLS_PROFILE,
+    TLSProfile,
+    create_public_data_api_ssl_context,
+    resolve_tls_profile,
+)
+
+# 확인 결과를 보관하는 기본 시간 (초). 서버 설정은 자주 바뀌지 않음
+DEFAULT_PROBE_TTL = 7 * 24 * 3600.0
+
+# 모든 프로필이 실패한 결과를 (메모리에만) 보관하는 시간 (초)
+DEFAULT_PROBE_FAILURE_TTL = 60.0
+
+# 핸드셰이크 하나를 기다리는 시간 (초)
+DEFAULT_PROBE_TIMEOUT = 5.0
+
+# 요청 경로(profile_for)에서 확인이 끝나기를 기다리는 최대 시간 (초)
+DEFAULT_PROBE_WAIT = 1.0
+
+ProbeCandidate = collections.namedtuple("ProbeCandidate", ["name", "tls_profile"])
+ProbeCandidate.__doc__ = """
+시도할 TLS 프로필 (name은 결과 보관에 쓰는 고유 이름)
+"""
+
+
+def _legacy_candidate(name, ciphers):
+    # 구형 서버용: TLS 1.0~1.2, 레거시 호환 옵션
+    return ProbeCandidate(
+        name, LEGACY_TLS_PROFILE._replace(ciphers=ciphers + ":!aNULL:!eNULL")
+    )
+
+
+# 빠른 프로필부터 호환성이 높은 프로필 순
+PROBE_CANDIDATES = (
+    ProbeCandidate(
+        "tls13",
+        TLSProfile(
+            minimum_version=ssl.TLSVersion.TLSv1_3,
+            maximum_version=ssl.TLSVersion.TLSv1_3,
+            ciphers="ECDHE+AESGCM:ECDHE+CHACHA20:!aNULL:!eNULL",
+            options=0,
+            check_hostname=False,
+            verify_mode=ssl.CERT_NONE,
+        ),
+    ),
+    ProbeCandidate(
+        "tls12-ecdhe-gcm",
+        TLSProfile(
+            minimum_version=ssl.TLSVersion.TLSv1_2,
+            maximum_version=ssl.TLSVersion.TLSv1_2,
+            ciphers="ECDHE+AESGCM:!aNULL:!eNULL",
+            options=LEGACY_OPTIONS,
+            check_hostname=False,
+            verify_mode=ssl.CERT_NONE,
+        ),
+    ),
+    _legacy_candidate("tls12-rsa-cbc", "AES128-SHA:AES256-SHA"),
+    _legacy_candidate("dhe", "DHE-RSA-AES128-SHA:DHE-RSA-AES256-SHA"),
+    _legacy_candidate("3des", "DES-CBC3-SHA"),
+)
+
+ProbeAttempt = collections.namedtuple("ProbeAttempt", ["name", "ok", "handshake_time", "error"])
+ProbeAttempt.__doc__ = """
+프로필 하나의 시도 결과 (handshake_time은 TCP 연결을 뺀 TLS 핸드셰이크 시간)
+"""
+
+ProbeResult = collections.namedtuple(
+    "ProbeResult",
+    [
+        "host",
+        "port",
+        "name",
+        "tls_profile",
+        "handshake_time",
+        "version",
+        "cipher",
+        "probed_at",
+        "attempts",
+    ],
+)
+ProbeResult.__doc__ = """
+호스트 하나의 확인 결과
+
+name/tls_profile은 처음 성공한 프로필이며, 모두 실패하면 None입니다.
+attempts는 시도한 순서대로의 ProbeAttempt 목록입니다 (보관소에서 읽은
+결과는 빈 튜플).
+"""
+
+
+def probe_host(
+    host,
+    port=443,
+    candidates=PROBE_CANDIDATES,
+    timeout=DEFAULT_PROBE_TIMEOUT,
+    time_func=time.time,
+):
+    """
+    후보 프로필을 차례로 시도하여 처음 성공한 프로필을 찾음
+
+    각 후보마다 새 연결을 열어 핸드셰이크만 하고 닫습니다. 지원 여부만
+    확인하므로 인증서는 검증하지 않으며, 실제 요청의 인증서 검증은 요청의
+    verify 설정을 따릅니다. TCP 연결 자체가 실패하면 남은 후보는 시도하지
+    않습니다. 이 파이썬의 OpenSSL이 지원하지 않는 후보(예: 3DES)는 실패로
+    기록하고 건너뜁니다.
+
+    Args:
+        host (str): 호스트 이름
+        port (int): 포트
+        candidates (tuple): ProbeCandidate 목록 (앞에서부터 시도)
+        timeout (float): 연결과 핸드셰이크 하나를 기다리는 시간 (초)
+        time_func (callable): 현재 유닉스 시각 (테스트용)
+
+    Returns:
+        ProbeResult: 확인 결과
+
+    Example:
+        >>> probe_host("apis.data.go.kr").name
+        'tls12-rsa-cbc'
+    """
+    attempts = []
+    for candidate in candidates:
+        try:
+            ctx = create_public_data_api_ssl_context(
+                resolve_tls_profile(candidate.tls_profile, False)
+            )
+        except ssl.SSLError as exc:
+            attempts.append(ProbeAttempt(candidate.name, False, None, f"unsupported: {exc}"))
+            continue
+        try:
+            sock = socket.create_connection((host, port), timeout)
+        except OSError as exc:
+            attempts.append(ProbeAttempt(candidate.name, False, None, str(exc)))
+            break
+        try:
+            start = time.perf_counter()
+            with ctx.wrap_socket(sock, server_hostname=host) as tls_sock:
+                handshake_time = time.perf_counter() - start
+                version, cipher = tls_sock.version(), tls_sock.cipher()[0]
+        except OSError as exc:  # ssl.SSLError, 핸드셰이크 중 끊김이나 시간 초과
+            attempts.append(ProbeAttempt(candidate.name, False, None, str(exc)))
+            continue
+        finally:
+            sock.close()
+        attempts.append(ProbeAttempt(candidate.name, True, handshake_time, None))
+        return ProbeResult(
+            host=host,
+            port=port,
+            name=candidate.name,
+            tls_profile=candidate.tls_profile,
+            handshake_time=handshake_time,
+            version=version,
+            cipher=cipher,
+            probed_at=time_func(),
+            attempts=tuple(attempts),
+        )
+    return ProbeResult(
+        host=host,
+        port=port,
+        name=None,
+        tls_profile=None,
+        handshake_time=None,
+        version=None,
+        cipher=None,
+        probed_at=time_func(),
+        attempts=tuple(attempts),
+    )
+
+
+class SQLiteProbeStore:
+    """
+    확인 결과를 재시작과 프로세스 사이에 공유하는 보관소
+
+    TLSProfileProber의 store로 사용합니다. 성공한 결과만 보관하며, 연결은
+    스레드와 프로세스마다 따로 엽니다.
+
+    Usage:
+        store = SQLiteProbeStore("/var/cache/public-data-api/probe.db")
+        prober = TLSProfileProber(store=store)
+    """
+
+    def __init__(self, path, busy_timeout=5.0):
+        """
+        Args:
+            path (str | os.PathLike): SQLite 파일 경로
+            busy_timeout (float): 다른 프로세스의 쓰기 잠금을 기다릴 최대 시간 (초)
+        """
+        self.path = os.fspath(path)
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._connection()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def get(self, host, port):
+        """
+        Returns:
+            tuple | None: (name, handshake_time, version, cipher, probed_at)
+        """
+        return self._connection().execute(
+            "SELECT name, handshake_time, version, cipher, probed_at FROM probes"
+            " WHERE host = ? AND port = ?",
+            (host, port),
+        ).fetchone()
+
+    def put(self, result):
+        """
+        Args:
+            result (ProbeResult): 성공한 확인 결과
+        """
+        self._connection().execute(
+            "INSERT OR REPLACE INTO probes VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                result.host,
+                result.port,
+                result.name,
+                result.handshake_time,
+                result.version,
+                result.cipher,
+                result.probed_at,
+            ),
+        )
+
+    def delete(self, host, port):
+        """호스트의 결과를 지움"""
+        self._connection().execute(
+            "DELETE FROM probes WHERE host = ? AND port = ?", (host, port)
+        )
+
+    def clear(self):
+        """모든 결과를 지움"""
+        self._connection().execute("DELETE FROM probes")
+
+    def close(self):
+        """현재 스레드의 SQLite 연결을 닫음"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None and self._local.pid == os.getpid():
+            connection.close()
+        self._local.__dict__.clear()
+
+    def _connection(self):
+        local = self._local
+        if getattr(local, "pid", None) != os.getpid():
+            # fork 이전에 열린 연결은 자식 프로세스에서 쓰거나 닫지 않음
+            local.connection = self._connect()
+            local.pid = os.getpid()
+        return local.connection
+
+    def _connect(self):
+        connection = sqlite3.connect(
+            self.path, timeout=self.busy_timeout, isolation_level=None
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS probes ("
+            " host TEXT NOT NULL,"
+            " port INTEGER NOT NULL,"
+            " name TEXT NOT NULL,"
+            " handshake_time REAL NOT NULL,"
+            " version TEXT,"
+            " cipher TEXT,"
+            " probed_at REAL NOT NULL,"
+            " PRIMARY KEY (host, port)"
+            ") WITHOUT ROWID"
+        )
+        return connection
+
+
+class TLSProfileProber:
+    """
+    호스트별로 가장 빠른 TLS 프로필을 확인하고 보관
+
+    처음 요청하는 호스트는 probe_host()로 확인하고, 결과를 ttl 동안
+    보관합니다. 같은 호스트를 여러 스레드가 동시에 요청해도 확인은 한 번만
+    합니다. 어댑터의 prober 인자로 넘기면 host_profiles에 TLS 프로필을
+    지정하지 않은 호스트에 자동으로 적용됩니다.
+
+    확인은 후보마다 timeout까지 걸릴 수 있으므로, 요청 경로의 profile_for()는
+    확인을 백그라운드 스레드에서 실행하고 wait초까지만 기다립니다. 그 안에
+    끝나지 않으면 그 요청은 어댑터 기본 프로필을 쓰고, 확인이 끝난 뒤의
+    요청부터 확인된 프로필을 씁니다. 첫 요청부터 확인된 프로필을 쓰려면
+    시작할 때 result()로 미리 확인하세요.
+
+    후보 목록은 빠르지만 호환성이 낮은 프로필부터 시도하므로, 연결을
+    가로챈 공격자가 약한 프로필을 고르게 할 수 있습니다. 허용할 가장 약한
+    수준은 candidates로 제한하세요.
+
+    Usage:
+        prober = TLSProfileProber(store=SQLiteProbeStore("probe.db"))
+        session = create_public_data_api_session(prober=prober)
+        print(prober.results())
+    """
+
+    def __init__(
+        self,
+        store=None,
+        ttl=DEFAULT_PROBE_TTL,
+        failure_ttl=DEFAULT_PROBE_FAILURE_TTL,
+        candidates=PROBE_CANDIDATES,
+        timeout=DEFAULT_PROBE_TIMEOUT,
+        wait=DEFAULT_PROBE_WAIT,
+        time_func=time.time,
+    ):
+        """
+        Args:
+            store (SQLiteProbeStore | None): 결과를 유지할 보관소
+            ttl (float): 성공한 결과를 보관하는 시간 (초)
+            failure_ttl (float): 모든 프로필이 실패한 결과를 보관하는 시간 (초).
+                그동안은 다시 확인하지 않고 어댑터 기본 프로필을 씀
+            candidates (tuple): ProbeCandidate 목록 (앞에서부터 시도)
+            timeout (float): 핸드셰이크 하나를 기다리는 시간 (초)
+            wait (float | None): profile_for()가 확인을 기다리는 최대 시간 (초).
+                None이면 확인이 끝날 때까지 기다림
+            time_func (callable): 현재 유닉스 시각 (테스트용)
+        """
+        self.store = store
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        self.candidates = tuple(candidates)
+        self.timeout = timeout
+        self.wait = wait
+        self.time_func = time_func
+        self._init_state()
+
+    def _init_state(self):
+        self._lock = threading.Lock()
+        self._results = {}  # (host, port) -> ProbeResult
+        self._single_flight = SingleFlight()
+        self._probing = {}  # (host, port) -> 백그라운드 확인의 Future
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in ("_lock", "_results", "_single_flight", "_probing"):
+            del state[name]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_state()
+
+    def profile_for(self, host, port=443):
+        """
+        호스트에 쓸 TLS 프로필 (어댑터가 요청마다 호출)
+
+        보관된 결과가 없으면 백그라운드에서 확인하고 wait초까지 기다립니다.
+
+        Args:
+            host (str): 호스트 이름
+            port (int): 포트
+
+        Returns:
+            TLSProfile | None: 가장 빠른 프로필 (모두 실패했거나 wait초 안에
+                확인이 끝나지 않으면 None)
+        """
+        key = (host.lower(), port)
+        result = self._cached(key)
+        if result is None:
+            try:
+                result = self._probe_in_background(key).result(timeout=self.wait)
+            except FutureTimeoutError:
+                return None
+        return result.tls_profile
+
+    def result(self, host, port=443):
+        """
+        보관된 결과를 반환하고, 없거나 만료되었으면 확인
+
+        Returns:
+            ProbeResult: 확인 결과
+        """
+        key = (host.lower(), port)
+        result = self._cached(key)
+        if result is None:
+            result = self._single_flight.do(key, lambda: self._probe_if_missing(key))
+        return result
+
+    def probe(self, host, port=443):
+        """
+        보관된 결과와 상관없이 다시 확인하고 결과를 보관
+
+        Returns:
+            ProbeResult: 확인 결과
+        """
+        key = (host.lower(), port)
+        result = probe_host(key[0], port, self.candidates, self.timeout, self.time_func)
+        with self._lock:
+            self._results[key] = result
+        if self.store is not None and result.name is not None:
+            self.store.put(result)
+        return result
+
+    def forget(self, host, port=443):
+        """호스트의 결과를 지워 다음 요청에서 다시 확인하게 함"""
+        key = (host.lower(), port)
+        with self._lock:
+            self._results.pop(key, None)
+        if self.store is not None:
+            self.store.delete(*key)
+
+    def results(self):
+        """
+        Returns:
+            dict: (host, port) -> ProbeResult (메모리에 있는 결과)
+        """
+        with self._lock:
+            return dict(self._results)
+
+    def tls_profiles(self):
+        """
+        Returns:
+            list: 지금까지 선택된 TLSProfile 목록 (중복 없음)
+        """
+        with self._lock:
+            profiles = [result.tls_profile for result in self._results.values()]
+        return list(dict.fromkeys(p for p in profiles if p is not None))
+
+    def _probe_in_background(self, key):
+        # 호스트마다 확인 스레드 하나를 띄우고 그 Future를 공유
+        with self._lock:
+            future = self._probing.get(key)
+            if future is None:
+                future = self._probing[key] = Future()
+                threading.Thread(
+                    target=self._run_probe,
+                    args=(key, future),
+                    name="public-data-api-probe",
+                    daemon=True,
+                ).start()
+        return future
+
+    def _run_probe(self, key, future):
+        try:
+            future.set_result(self.result(*key))
+        except BaseException as exc:
+            future.set_exception(exc)
+        finally:
+            with self._lock:
+                self._probing.pop(key, None)
+
+    def _probe_if_missing(self, key):
+        # 기다리는 동안 다른 스레드가 확인했을 수 있음
+        return self._cached(key) or self.probe(*key)
+
+    def _cached(self, key):
+        now = self.time_func()
+        with self._lock:
+            result = self._results.get(key)
+        if result is not None and not self._expired(result, now):
+            return result
+        if self.store is None:
+            return None
+        row = self.store.get(*key)
+        if row is None:
+            return None
+        name, handshake_time, version, cipher, probed_at = row
+        candidates = {candidate.name: candidate for candidate in self.candidates}
+        if name not in candidates:
+            return None
+        result = ProbeResult(
+            host=key[0],
+            port=key[1],
+            name=name,
+            tls_profile=candidates[name].tls_profile,
+            handshake_time=handshake_time,
+            version=version,
+            cipher=cipher,
+            probed_at=probed_at,
+            attempts=(),
+        )
+        if self._expired(result, now):
+            return None
+        with self._lock:
+            self._results[key] = result
+        return result
+
+    def _expired(self, result, now):
+        ttl = self.ttl if result.name is not None else self.failure_ttl
+        return now - result.probed_at >= ttl
@@ -0,0 +1,451 @@
+"""
+Public Data API Rate Limiter
+
+서비스키별 호출 속도 제한과 일일 호출 한도 관리
+(serviceKey, 엔드포인트)마다 토큰 버킷과 한국 시간 자정에 초기화되는 일일 카운터를 둡니다.
+SQLiteRateLimiter는 같은 상태를 SQLite(WAL) 파일에 두어 여러 프로세스가 한도를 공유합니다.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import parse_qsl, urlsplit
+
+from public_data_api_response import PublicDataApiQuotaExceededError
+
+# 한국 표준시 (UTC+9, 일광 절약 시간 없음)
+KST_OFFSET = 9 * 60 * 60
+
+# 초당 기본 호출 수
+DEFAULT_PER_SECOND = 10.0
+
+# 이보다 짧은 대기는 허가로 간주 (벽시계 값이 커서 아주 짧은 대기로는
+# 시각이 바뀌지 않아 대기가 끝없이 반복되는 부동소수점 문제 방지)
+_MIN_WAIT = 1e-6
+
+
+def kst_day(timestamp):
+    """
+    유닉스 시각을 한국 시간 기준 날짜 번호로 변환
+
+    같은 KST 날짜의 시각은 같은 번호를 가지며, KST 자정에 1 증가합니다.
+
+    Args:
+        timestamp (float): 유닉스 시각 (time.time())
+
+    Returns:
+        int: 1970-01-01 KST부터 지난 일수
+    """
+    return int((timestamp + KST_OFFSET) // 86400)
+
+
+def rate_limit_key(url):
+    """
+    요청 URL에서 (serviceKey, 엔드포인트)를 추출
+
+    Args:
+        url (str): 쿼리 파라미터를 포함한 요청 URL
+
+    Returns:
+        tuple: (service_key, endpoint). serviceKey가 없으면 service_key는 None,
+            endpoint는 "호스트/경로" 형태
+    """
+    url_parts = urlsplit(url)
+    service_key = None
+    for name, value in parse_qsl(url_parts.query, keep_blank_values=True):
+        if name.lower() == "servicekey":
+            service_key = value
+            break
+    return service_key, f"{url_parts.netloc}{url_parts.path}"
+
+
+class TokenBucket:
+    """
+    토큰 버킷 (스레드 안전하지 않음, 호출자가 잠금을 관리)
+
+    초당 rate개의 토큰이 채워지고 최대 capacity개까지 쌓입니다.
+    """
+
+    def __init__(self, rate, capacity=None, now=0.0):
+        """
+        Args:
+            rate (float): 초당 채워지는 토큰 수
+            capacity (float | None): 최대 토큰 수 (기본값은 rate, 최소 1)
+            now (float): 현재 시각 (단조 시계)
+        """
+        self.rate = rate
+        self.capacity = max(capacity if capacity is not None else rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = now
+
+    def take(self, now):
+        """
+        토큰 하나를 꺼냄
+
+        Args:
+            now (float): 현재 시각 (단조 시계)
+
+        Returns:
+            float: 꺼냈으면 0, 아니면 토큰이 생길 때까지 기다릴 시간 (초)
+        """
+        elapsed = max(now - self.updated, 0.0)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated = now
+        wait = (1.0 - self.tokens) / self.rate
+        if wait <= _MIN_WAIT:
+            self.tokens = max(self.tokens - 1.0, 0.0)
+            return 0.0
+        return wait
+
+
+class _KeyState:
+    def __init__(self, bucket, daily_limit, day):
+        self.bucket = bucket
+        self.daily_limit = daily_limit
+        self.day = day
+        self.used = 0
+
+
+class ServiceKeyRateLimiter:
+    """
+    서비스키별 호출 속도 제한 및 일일 호출 한도 관리 계층
+
+    (serviceKey, 엔드포인트)마다 토큰 버킷으로 초당 호출 수를 맞추고,
+    한국 시간 자정에 초기화되는 일일 카운터로 일일 한도를 관리합니다.
+    한도를 넘긴 요청은 서버로 보내지 않고 PublicDataApiQuotaExceededError를
+    발생시키므로, 한도 초과(resultCode 22)로 그날의 호출이 막히는 일을
+    미리 막을 수 있습니다.
+
+    어댑터 계층으로 마운트하면 세션의 모든 요청에 적용되며,
+    acquire()/acquire_async()로 직접 사용할 수도 있습니다.
+
+    Usage:
+        limiter = ServiceKeyRateLimiter(per_second=30, daily_limit=10000)
+        session = create_public_data_api_session(rate_limiter=limiter)
+        response = session.get(url, params={"serviceKey": key})
+    """
+
+    def __init__(
+        self,
+        per_second=DEFAULT_PER_SECOND,
+        daily_limit=None,
+        burst=None,
+        endpoint_limits=None,
+        clock=time.monotonic,
+        time_func=time.time,
+        sleep=time.sleep,
+    ):
+        """
+        Args:
+            per_second (float): (serviceKey, 엔드포인트)별 초당 호출 수
+            daily_limit (int | None): (serviceKey, 엔드포인트)별 일일 호출 한도
+            burst (float | None): 순간적으로 허용할 최대 호출 수 (기본값 per_second)
+            endpoint_limits (dict | None): 엔드포인트("호스트/경로")별
+                (per_second, daily_limit) 덮어쓰기
+            clock (callable): 단조 시계 (테스트용)
+            time_func (callable): 현재 유닉스 시각 (테스트용)
+            sleep (callable): 대기 함수 (테스트용)
+        """
+        self.per_second = per_second
+        self.daily_limit = daily_limit
+        self.burst = burst
+        self.endpoint_limits = dict(endpoint_limits or {})
+        self.clock = clock
+        self.time_func = time_func
+        self.sleep = sleep
+
+        self._lock = threading.Lock()
+        self._states = {}
+
+    def acquire(self, service_key, endpoint, blocking=True, timeout=None):
+        """
+        호출 한 번을 허가받음 (필요하면 토큰이 생길 때까지 대기)
+
+        Args:
+            service_key (str | None): 서비스키
+            endpoint (str): 엔드포인트 ("호스트/경로")
+            blocking (bool): False면 기다리지 않고 바로 결과를 반환
+            timeout (float | None): 최대 대기 시간 (초)
+
+        Returns:
+            bool: 허가받았으면 True, 대기하지 않거나 시간이 초과되면 False
+
+        Raises:
+            PublicDataApiQuotaExceededError: 일일 한도를 모두 쓴 경우
+        """
+        deadline = None if timeout is None else self.clock() + timeout
+        while True:
+            wait = self._try_acquire(service_key, endpoint)
+            if wait == 0:
+                return True
+            if not blocking:
+                return False
+            if deadline is not None:
+                remaining = deadline - self.clock()
+                if remaining < wait:
+                    return False
+            self.sleep(wait)
+
+    async def acquire_async(self, service_key, endpoint, timeout=None):
+        """
+        acquire()의 asyncio 버전 (이벤트 루프를 막지 않고 대기)
+
+        Args:
+            service_key (str | None): 서비스키
+            endpoint (str): 엔드포인트 ("호스트/경로")
+            timeout (float | None): 최대 대기 시간 (초)
+
+        Returns:
+            bool: 허가받았으면 True, 시간이 초과되면 False
+
+        Raises:
+            PublicDataApiQuotaExceededError: 일일 한도를 모두 쓴 경우
+        """
+        deadline = None if timeout is None else self.clock() + timeout
+        while True:
+            wait = self._try_acquire(service_key, endpoint)
+            if wait == 0:
+                return True
+            if deadline is not None and deadline - self.clock() < wait:
+                return False
+            await asyncio.sleep(wait)
+
+    def send(self, next_send, request, **kwargs):
+        """
+        어댑터 계층 인터페이스: 호출을 허가받은 뒤 요청을 전달
+
+        Args:
+            next_send (callable): 다음 계층의 send 함수
+            request (requests.PreparedRequest): 보낼 요청
+            **kwargs: HTTPAdapter.send()의 인자들
+
+        Returns:
+            requests.Response: 응답
+
+        Raises:
+            PublicDataApiQuotaExceededError: 일일 한도를 모두 쓴 경우
+        """
+        service_key, endpoint = rate_limit_key(request.url)
+        try:
+            self.acquire(service_key, endpoint)
+        except PublicDataApiQuotaExceededError as e:
+            e.request = request
+            raise
+        return next_send(request, **kwargs)
+
+    def usage(self):
+        """
+        오늘(KST) 사용한 호출 수
+
+        Returns:
+            dict: (service_key, endpoint) -> {"used": 사용 수, "limit": 일일 한도}
+        """
+        today = kst_day(self.time_func())
+        with self._lock:
+            return {
+                key: {
+                    "used": state.used if state.day == today else 0,
+                    "limit": state.daily_limit,
+                }
+                for key, state in self._states.items()
+            }
+
+    def _try_acquire(self, service_key, endpoint):
+        # 허가하면 0, 아니면 기다릴 시간을 반환 (일일 한도 초과 시 예외)
+        now = self.clock()
+        today = kst_day(self.time_func())
+        with self._lock:
+            state = self._state(service_key, endpoint, now, today)
+            if state.day != today:
+                state.day = today
+                state.used = 0
+            if state.daily_limit is not None and state.used >= state.daily_limit:
+                raise self._quota_exceeded(endpoint, state.used, state.daily_limit)
+            wait = state.bucket.take(now)
+            if wait == 0:
+                state.used += 1
+            return wait
+
+    def _limits(self, endpoint):
+        return self.endpoint_limits.get(endpoint, (self.per_second, self.daily_limit))
+
+    @staticmethod
+    def _quota_exceeded(endpoint, used, daily_limit):
+        return PublicDataApiQuotaExceededError(
+            f"일일 호출 한도 초과 ({endpoint}: {used}/{daily_limit})",
+            result_code="22",
+            result_msg="LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR",
+        )
+
+    def _state(self, service_key, endpoint, now, today):
+        # 호출자가 self._lock을 잡고 있어야 함
+        key = (service_key, endpoint)
+        state = self._states.get(key)
+        if state is None:
+            per_second, daily_limit = self._limits(endpoint)
+            state = _KeyState(TokenBucket(per_second, self.burst, now), daily_limit, today)
+            self._states[key] = state
+        return state
+
+
+class SQLiteRateLimiter(ServiceKeyRateLimiter):
+    """
+    여러 프로세스가 공유하는 서비스키별 호출 속도 제한 및 일일 한도 장부
+
+    gunicorn/Celery처럼 한 호스트에서 여러 프로세스가 같은 serviceKey를 쓰면
+    프로세스마다 따로 세는 ServiceKeyRateLimiter는 프로세스 수만큼 한도를
+    넘겨 허가합니다. 이 클래스는 토큰 버킷과 일일 카운터를 WAL 모드의
+    SQLite 파일에 두고, 허가 여부를 BEGIN IMMEDIATE 트랜잭션 안에서 결정하여
+    모든 프로세스가 하나의 한도를 원자적으로 나눠 씁니다. 파일에 남으므로
+    프로세스를 다시 시작해도 오늘 사용한 호출 수가 유지됩니다.
+
+    프로세스 사이에는 단조 시계를 공유할 수 없으므로 버킷은 time_func
+    (기본 time.time)으로 계산합니다. 연결은 스레드와 프로세스마다 따로 열며,
+    fork된 자식 프로세스는 부모의 연결을 쓰지 않고 새로 엽니다.
+
+    Usage:
+        limiter = SQLiteRateLimiter("/var/run/public-data-api/ratelimit.db",
+                                    per_second=30, daily_limit=10000)
+        session = create_public_data_api_session(rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        path,
+        per_second=DEFAULT_PER_SECOND,
+        daily_limit=None,
+        burst=None,
+        endpoint_limits=None,
+        time_func=time.time,
+        sleep=time.sleep,
+        busy_timeout=5.0,
+    ):
+        """
+        Args:
+            path (str | os.PathLike): SQLite 파일 경로 (프로세스들이 공유)
+            per_second (float): (serviceKey, 엔드포인트)별 초당 호출 수
+            daily_limit (int | None): (serviceKey, 엔드포인트)별 일일 호출 한도
+            burst (float | None): 순간적으로 허용할 최대 호출 수 (기본값 per_second)
+            endpoint_limits (dict | None): 엔드포인트("호스트/경로")별
+                (per_second, daily_limit) 덮어쓰기
+            time_func (callable): 현재 유닉스 시각 (테스트용)
+            sleep (callable): 대기 함수 (테스트용)
+            busy_timeout (float): 다른 프로세스의 쓰기 잠금을 기다릴 최대 시간 (초)
+        """
+        super().__init__(
+            per_second=per_second,
+            daily_limit=daily_limit,
+            burst=burst,
+            endpoint_limits=endpoint_limits,
+            clock=time_func,
+            time_func=time_func,
+            sleep=sleep,
+        )
+        self.path = os.fspath(path)
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        # 스키마를 미리 만들어 두어 첫 요청에서 잠금 경합이 생기지 않게 함
+        self._connection()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"], state["_local"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def usage(self):
+        """
+        오늘(KST) 사용한 호출 수 (모든 프로세스 합계)
+
+        Returns:
+            dict: (service_key, endpoint) -> {"used": 사용 수, "limit": 일일 한도}
+        """
+        today = kst_day(self.time_func())
+        rows = self._connection().execute(
+            "SELECT service_key, endpoint, day, used FROM rate_limits"
+        )
+        return {
+            (service_key or None, endpoint): {
+                "used": used if day == today else 0,
+                "limit": self._limits(endpoint)[1],
+            }
+            for service_key, endpoint, day, used in rows
+        }
+
+    def close(self):
+        """현재 스레드의 SQLite 연결을 닫음"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None and self._local.pid == os.getpid():
+            connection.close()
+        self._local.__dict__.clear()
+
+    def _try_acquire(self, service_key, endpoint):
+        now = self.time_func()
+        today = kst_day(now)
+        per_second, daily_limit = self._limits(endpoint)
+        key = (service_key or "", endpoint)
+
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                "SELECT tokens, updated, day, used FROM rate_limits"
+                " WHERE service_key = ? AND endpoint = ?",
+                key,
+            ).fetchone()
+            bucket = TokenBucket(per_second, self.burst, now)
+            used = 0
+            if row is not None:
+                bucket.tokens = min(row[0], bucket.capacity)
+                bucket.updated = row[1]
+                if row[2] == today:
+                    used = row[3]
+            if daily_limit is not None and used >= daily_limit:
+                raise self._quota_exceeded(endpoint, used, daily_limit)
+
+            wait = bucket.take(now)
+            if wait == 0:
+                # 허가하지 않은 경우는 저장된 상태에서 같은 값이 다시 계산되므로 쓰지 않음
+                connection.execute(
+                    "INSERT OR REPLACE INTO rate_limits VALUES (?, ?, ?, ?, ?, ?)",
+                    (*key, bucket.tokens, bucket.updated, today, used + 1),
+                )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return wait
+
+    def _connection(self):
+        local = self._local
+        if getattr(local, "pid", None) != os.getpid():
+            # fork 이전에 열린 연결은 자식 프로세스에서 쓰거나 닫지 않음
+            local.connection = self._connect()
+            local.pid = os.getpid()
+        return local.connection
+
+    def _connect(self):
+        connection = sqlite3.connect(
+            self.path, timeout=self.busy_timeout, isolation_level=None
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        # WAL 모드에서는 NORMAL이어도 프로세스가 죽었을 때 커밋이 유실되지 않음
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limits ("
+            " service_key TEXT NOT NULL,"
+            " endpoint TEXT NOT NULL,"
+            " tokens REAL NOT NULL,"
+            " updated REAL NOT NULL,"
+            " day INTEGER NOT NULL,"
+            " used INTEGER NOT NULL,"
+            " PRIMARY KEY (service_key, endpoint)"
+            ") WITHOUT ROWID"
+        )
+        return connection
@@ -0,0 +1,569 @@
+"""
+Public Data API Response
+
+공공데이터 API 응답 봉투(response > header/body) 해석
+JSON과 XML 형식 모두에서 resultCode, totalCount, item 목록을 꺼내며,
+큰 XML 응답은 본문을 조금씩 읽는 스트리밍 파서로 처리합니다.
+"""
+
+import collections
+import itertools
+import json
+import random
+import re
+import time
+import xml.etree.ElementTree as ET
+
+import requests
+
+# 정상 응답으로 보는 resultCode
+SUCCESS_RESULT_CODES = frozenset({"00", "0", "000"})
+
+# 데이터가 없다는 의미의 resultCode (NODATA_ERROR, 오류가 아닌 빈 페이지로 취급)
+NO_DATA_RESULT_CODES = frozenset({"03"})
+
+# 스트리밍 파싱 시 한 번에 읽을 본문 크기 (bytes)
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# 오류 분류
+RESULT_RETRYABLE = "retryable"  # 잠시 후 재시도하면 성공할 수 있음
+RESULT_QUOTA = "quota"  # 호출 한도 초과 (재시도해도 한도만 소모)
+RESULT_FATAL = "fatal"  # 요청이나 서비스키를 고치기 전에는 실패
+
+# resultCode(또는 returnReasonCode)별 분류
+RESULT_CODE_CLASSES = {
+    "01": RESULT_RETRYABLE,  # APPLICATION_ERROR
+    "02": RESULT_RETRYABLE,  # DB_ERROR
+    "04": RESULT_RETRYABLE,  # HTTP_ERROR
+    "05": RESULT_RETRYABLE,  # SERVICETIMEOUT_ERROR
+    "10": RESULT_FATAL,  # INVALID_REQUEST_PARAMETER_ERROR
+    "11": RESULT_FATAL,  # NO_MANDATORY_REQUEST_PARAMETERS_ERROR
+    "12": RESULT_FATAL,  # NO_OPENAPI_SERVICE_ERROR
+    "20": RESULT_FATAL,  # SERVICE_ACCESS_DENIED_ERROR
+    "21": RESULT_QUOTA,  # TEMPORARILY_DISABLE_THE_SERVICEKEY_ERROR
+    "22": RESULT_QUOTA,  # LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR
+    "23": RESULT_RETRYABLE,  # LIMITED_NUMBER_OF_SERVICE_REQUESTS_PER_SECOND_EXCEEDS_ERROR
+    "30": RESULT_FATAL,  # SERVICE_KEY_IS_NOT_REGISTERED_ERROR
+    "31": RESULT_FATAL,  # DEADLINE_HAS_EXPIRED_ERROR
+    "32": RESULT_FATAL,  # UNREGISTERED_IP_ERROR
+    "33": RESULT_FATAL,  # UNSIGNED_CALL_ERROR
+    "99": RESULT_RETRYABLE,  # UNKNOWN_ERROR
+}
+
+# 재시도할 HTTP 상태 코드
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# 응답 봉투 앞부분에서 resultCode를 찾을 범위 (bytes)
+_ENVELOPE_HEAD_SIZE = 2048
+_RESULT_CODE_PATTERN = re.compile(
+    rb"<(?:resultCode|returnReasonCode)>\s*([^<\s]+)"
+    rb"|\"resultCode\"\s*:\s*\"?([^\",}\s]+)"
+)
+_RESULT_MSG_PATTERN = re.compile(
+    rb"<(?:resultMsg|returnAuthMsg)>\s*([^<]*?)\s*<"
+    rb"|\"resultMsg\"\s*:\s*\"([^\"]*)\""
+)
+
+
+PublicDataApiPage = collections.namedtuple(
+    "PublicDataApiPage",
+    ["result_code", "result_msg", "total_count", "page_no", "num_of_rows", "items"],
+)
+PublicDataApiPage.__doc__ = """
+공공데이터 API 응답 한 페이지
+
+result_code/result_msg는 header에서, total_count/page_no/num_of_rows/items는
+body에서 읽은 값입니다. 숫자 필드는 응답에 없으면 None입니다.
+"""
+
+
+class PublicDataApiError(requests.exceptions.RequestException):
+    """
+    HTTP 200이지만 응답 봉투에 오류 resultCode가 담긴 경우
+
+    Attributes:
+        result_code (str | None): 응답의 resultCode (또는 returnReasonCode)
+        result_msg (str | None): 응답의 resultMsg (또는 returnAuthMsg)
+    """
+
+    def __init__(self, *args, result_code=None, result_msg=None, **kwargs):
+        self.result_code = result_code
+        self.result_msg = result_msg
+        if not args:
+            args = (f"공공데이터 API 오류 {result_code}: {result_msg}",)
+        super().__init__(*args, **kwargs)
+
+
+class PublicDataApiQuotaExceededError(PublicDataApiError):
+    """서비스키의 호출 한도를 초과한 경우 (resultCode 22 등)"""
+
+
+def normalize_result_code(result_code):
+    """
+    숫자 resultCode를 두 자리로 맞춤 ("0", "000" -> "00", "3" -> "03")
+
+    게이트웨이에 따라 앞의 0을 빼거나 더 붙여서 돌려주므로 비교 전에 맞춥니다.
+
+    Args:
+        result_code (str | None): 응답의 resultCode
+
+    Returns:
+        str | None: 숫자 코드는 두 자리 이상의 문자열, 그 밖에는 앞뒤 공백만 제거한 값
+    """
+    if result_code is None:
+        return None
+    result_code = result_code.strip()
+    if result_code.isdigit():
+        return result_code.lstrip("0").zfill(2)
+    return result_code
+
+
+def is_success_result_code(result_code):
+    """
+    resultCode가 정상(또는 데이터 없음)인지 확인
+
+    Args:
+        result_code (str | None): 응답의 resultCode. None이면 봉투에
+            resultCode가 없는 응답이므로 정상으로 봅니다.
+
+    Returns:
+        bool: 정상 응답이면 True
+    """
+    if result_code is None:
+        return True
+    result_code = normalize_result_code(result_code)
+    return result_code in SUCCESS_RESULT_CODES or result_code in NO_DATA_RESULT_CODES
+
+
+def peek_result_code(content):
+    """
+    응답 본문 앞부분만 보고 resultCode와 resultMsg를 찾음
+
+    header는 봉투의 맨 앞에 있으므로 전체를 파싱하지 않고 앞부분에서
+    정규식으로 찾습니다. JSON, XML, OpenAPI_ServiceResponse 형식을 지원합니다.
+
+    Args:
+        content (bytes): 응답 본문
+
+    Returns:
+        tuple: (result_code, result_msg). 찾지 못하면 None
+    """
+    head = content[:_ENVELOPE_HEAD_SIZE]
+    code_match = _RESULT_CODE_PATTERN.search(head)
+    if code_match is None:
+        return None, None
+    msg_match = _RESULT_MSG_PATTERN.search(head)
+    result_code = (code_match.group(1) or code_match.group(2)).decode("utf-8", "replace")
+    result_msg = None
+    if msg_match is not None:
+        result_msg = (msg_match.group(1) or msg_match.group(2) or b"").decode(
+            "utf-8", "replace"
+        ) or None
+    return result_code, result_msg
+
+
+def classify_result_code(result_code):
+    """
+    resultCode를 재시도 가능/한도 초과/치명적 오류로 분류
+
+    Args:
+        result_code (str | None): 응답의 resultCode
+
+    Returns:
+        str | None: RESULT_RETRYABLE, RESULT_QUOTA, RESULT_FATAL 중 하나.
+            정상 응답이면 None. 알 수 없는 오류 코드는 RESULT_FATAL
+    """
+    if is_success_result_code(result_code):
+        return None
+    return RESULT_CODE_CLASSES.get(normalize_result_code(result_code), RESULT_FATAL)
+
+
+def classify_response(response):
+    """
+    응답의 HTTP 상태와 봉투 resultCode로 오류를 분류
+
+    Args:
+        response (requests.Response): 본문을 읽은 응답
+
+    Returns:
+        tuple: (분류, result_code, result_msg). 분류는 classify_result_code()와
+            같으며, 재시도할 HTTP 상태 코드(429, 5xx 일부)는 RESULT_RETRYABLE
+    """
+    if response.status_code in RETRYABLE_STATUS_CODES:
+        return RESULT_RETRYABLE, None, None
+    result_code, result_msg = peek_result_code(response.content)
+    return classify_result_code(result_code), result_code, result_msg
+
+
+class ResultCodeRetryPolicy:
+    """
+    resultCode를 보고 필요한 경우에만 재시도하는 어댑터 계층
+
+    공공데이터 API는 오류도 HTTP 200과 오류 봉투로 돌려주므로, 응답
+    본문 앞부분의 resultCode를 분류하여 일시적인 오류(RESULT_RETRYABLE)만
+    지터가 있는 지수 백오프로 재시도합니다. 한도 초과나 서비스키 오류처럼
+    재시도해도 성공할 수 없는 응답은 곧바로 예외로 알려 호출 한도와 연결을
+    낭비하지 않습니다.
+
+    stream=True 요청은 본문을 미리 읽을 수 없으므로 재시도하지 않습니다.
+    이 경우 XmlItemStream의 raise_on_error로 오류를 확인하세요.
+
+    Usage:
+        policy = ResultCodeRetryPolicy(max_retries=3, backoff_factor=0.5)
+        session = create_public_data_api_session(retry_policy=policy)
+        response = session.get("https://apis.data.go.kr/your-endpoint")
+    """
+
+    def __init__(
+        self,
+        max_retries=3,
+        backoff_factor=0.5,
+        backoff_max=30.0,
+        raise_on_error=True,
+        sleep=time.sleep,
+    ):
+        """
+        Args:
+            max_retries (int): 최대 재시도 횟수
+            backoff_factor (float): 백오프 기본 시간 (초).
+                n번째 재시도 전에 최대 backoff_factor * 2**n초를 기다림
+            backoff_max (float): 한 번에 기다리는 최대 시간 (초)
+            raise_on_error (bool): 봉투 오류를 예외로 알릴지 여부.
+                False면 마지막 응답을 그대로 반환합니다.
+            sleep (callable): 대기 함수 (테스트용)
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.raise_on_error = raise_on_error
+        self.sleep = sleep
+
+    def send(self, next_send, request, **kwargs):
+        """
+        어댑터 계층 인터페이스: 요청을 보내고 필요하면 재시도
+
+        Args:
+            next_send (callable): 다음 계층의 send 함수
+            request (requests.PreparedRequest): 보낼 요청
+            **kwargs: HTTPAdapter.send()의 인자들
+
+        Returns:
+            requests.Response: 정상 응답 (또는 재시도가 끝난 마지막 응답)
+
+        Raises:
+            PublicDataApiQuotaExceededError: 호출 한도 초과
+            PublicDataApiError: 치명적 오류이거나 재시도 후에도 실패한 경우
+        """
+        attempt = 0
+        while True:
+            response = next_send(request, **kwargs)
+            if kwargs.get("stream"):
+                return response
+
+            classification, result_code, result_msg = classify_response(response)
+            if classification is None:
+                return response
+            if classification == RESULT_RETRYABLE and attempt < self.max_retries:
+                self.sleep(self.get_backoff_time(attempt, response))
+                attempt += 1
+                continue
+
+            if not self.raise_on_error or result_code is None:
+                # HTTP 상태 코드 오류는 raise_for_status()에 맡김
+                return response
+            error_class = (
+                PublicDataApiQuotaExceededError
+                if classification == RESULT_QUOTA
+                else PublicDataApiError
+            )
+            raise error_class(
+                result_code=result_code,
+                result_msg=result_msg,
+                request=request,
+                response=response,
+            )
+
+    def get_backoff_time(self, attempt, response=None):
+        """
+        재시도 전 대기 시간 계산 (full jitter 지수 백오프)
+
+        Retry-After 헤더가 있으면 그 값을 우선합니다.
+
+        Args:
+            attempt (int): 지금까지 재시도한 횟수
+            response (requests.Response | None): 마지막 응답
+
+        Returns:
+            float: 대기 시간 (초)
+        """
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return min(float(retry_after), self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_factor * 2**attempt))
+
+
+def parse_page(response):
+    """
+    응답을 해석하여 PublicDataApiPage로 반환
+
+    XML 응답은 XmlItemStream으로 본문을 조금씩 읽으며 해석하므로 문서 전체의
+    DOM을 만들지 않습니다. stream=True로 받은 응답도 그대로 넘길 수 있습니다.
+
+    Args:
+        response (requests.Response): 공공데이터 API 응답 (JSON 또는 XML)
+
+    Returns:
+        PublicDataApiPage: 해석된 페이지
+
+    Example:
+        >>> page = parse_page(session.get(url, params={"pageNo": 1}))
+        >>> page.total_count, len(page.items)
+        (1234, 10)
+    """
+    chunks = _iter_chunks(response, DEFAULT_CHUNK_SIZE)
+    first = b""
+    for first in chunks:
+        if first.strip():
+            break
+    chunks = itertools.chain([first], chunks)
+
+    if first.lstrip()[:1] in (b"{", b"["):
+        return _parse_json_page(json.loads(b"".join(chunks)))
+
+    stream = XmlItemStream(chunks, raise_on_error=False)
+    items = list(stream)
+    return PublicDataApiPage(
+        result_code=stream.result_code,
+        result_msg=stream.result_msg,
+        total_count=stream.total_count,
+        page_no=stream.page_no,
+        num_of_rows=stream.num_of_rows,
+        items=items,
+    )
+
+
+def iter_xml_items(source, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    XML 응답의 item을 하나씩 반환하는 제너레이터 (XmlItemStream 편의 함수)
+
+    Args:
+        source: stream=True로 받은 requests.Response, urllib3 응답,
+            파일 객체, 또는 bytes 조각의 iterable
+        chunk_size (int): 한 번에 읽을 크기
+
+    Yields:
+        dict: 응답의 item
+
+    Raises:
+        PublicDataApiError: header의 resultCode가 오류인 경우 (item을 읽기 전)
+
+    Example:
+        >>> response = session.get(url, params=params, stream=True)
+        >>> for item in iter_xml_items(response):
+        ...     print(item)
+    """
+    return iter(XmlItemStream(source, chunk_size=chunk_size))
+
+
+class XmlItemStream:
+    """
+    XML 응답 본문을 조금씩 읽으며 item을 하나씩 반환하는 스트리밍 파서
+
+    response.text와 DOM 파서로 큰 페이지(numOfRows가 수천~수만)를 해석하면
+    같은 문서가 메모리에 여러 벌 올라갑니다. 이 파서는 본문을 chunk_size씩
+    읽어 XMLPullParser에 넣고, 완성된 <item>을 dict로 바꾼 즉시 요소를
+    비우므로 numOfRows와 관계없이 메모리 사용량이 일정합니다.
+
+    header는 body보다 앞에 오므로 read_header()로 item을 읽기 전에
+    resultCode/resultMsg를 확인할 수 있습니다. totalCount, pageNo,
+    numOfRows는 보통 items 뒤에 오므로 item을 모두 읽은 뒤 채워집니다.
+
+    Usage:
+        response = session.get(url, params=params, stream=True)
+        stream = XmlItemStream(response)
+        result_code, result_msg = stream.read_header()
+        for item in stream:
+            print(item)
+        print(stream.total_count)
+    """
+
+    def __init__(self, source, chunk_size=DEFAULT_CHUNK_SIZE, raise_on_error=True):
+        """
+        Args:
+            source: stream=True로 받은 requests.Response, urllib3 응답,
+                파일 객체, 또는 bytes 조각의 iterable
+            chunk_size (int): 한 번에 읽을 크기
+            raise_on_error (bool): header의 resultCode가 오류이면
+                PublicDataApiError를 발생시킬지 여부
+        """
+        self.result_code = None
+        self.result_msg = None
+        self.total_count = None
+        self.page_no = None
+        self.num_of_rows = None
+        self.raise_on_error = raise_on_error
+
+        self._source = source
+        self._chunks = _iter_chunks(source, chunk_size)
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._path = []
+        self._items_element = None
+        self._header_done = False
+        self._pending = collections.deque()
+        self._finished = False
+
+    def read_header(self):
+        """
+        header를 읽을 때까지 본문을 읽음
+
+        Returns:
+            tuple: (result_code, result_msg)
+
+        Raises:
+            PublicDataApiError: raise_on_error이고 resultCode가 오류인 경우
+        """
+        while not self._header_done and self._feed():
+            pass
+        return self.result_code, self.result_msg
+
+    def __iter__(self):
+        try:
+            while True:
+                while self._pending:
+                    yield self._pending.popleft()
+                if not self._feed():
+                    break
+        finally:
+            if not self._finished:
+                # 끝까지 읽지 않은 응답의 연결은 재사용할 수 없으므로 닫음
+                self.close()
+
+    def close(self):
+        """본문 읽기를 중단하고 원본 응답을 닫음"""
+        self._finished = True
+        close = getattr(self._source, "close", None)
+        if close is not None:
+            close()
+
+    def _feed(self):
+        # 조각 하나를 파서에 넣고 이벤트를 처리. 더 읽을 것이 없으면 False
+        if self._finished:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._parser.close()
+            self._finished = True
+            self._header_done = True
+            return False
+        self._parser.feed(chunk)
+        for event, element in self._parser.read_events():
+            if event == "start":
+                self._path.append(element.tag)
+                if self._path[1:] == ["body", "items"]:
+                    self._items_element = element
+            else:
+                self._handle_end(element)
+                self._path.pop()
+        return True
+
+    def _handle_end(self, element):
+        path = self._path[1:]
+        if path == ["body", "items", "item"]:
+            self._pending.append(element_to_dict(element))
+            # 처리한 item을 부모에서 떼어내 메모리를 일정하게 유지
+            self._items_element.clear()
+        elif path in (["header", "resultCode"], ["cmmMsgHeader", "returnReasonCode"]):
+            self.result_code = _text_or_none(element.text)
+        elif path in (["header", "resultMsg"], ["cmmMsgHeader", "returnAuthMsg"]):
+            self.result_msg = _text_or_none(element.text)
+        elif path in (["header"], ["cmmMsgHeader"]):
+            self._header_done = True
+            element.clear()
+            if self.raise_on_error and not is_success_result_code(self.result_code):
+                self.close()
+                raise PublicDataApiError(
+                    result_code=self.result_code,
+                    result_msg=self.result_msg,
+                    response=self._source
+                    if isinstance(self._source, requests.Response)
+                    else None,
+                )
+        elif path == ["body", "totalCount"]:
+            self.total_count = _int_or_none(element.text)
+        elif path == ["body", "pageNo"]:
+            self.page_no = _int_or_none(element.text)
+        elif path == ["body", "numOfRows"]:
+            self.num_of_rows = _int_or_none(element.text)
+
+
+def _iter_chunks(source, chunk_size):
+    if isinstance(source, requests.Response):
+        # 이미 읽은 본문과 stream=True 응답 모두 처리 (gzip 등은 해제됨)
+        return iter(source.iter_content(chunk_size))
+    if hasattr(source, "stream"):
+        return iter(source.stream(chunk_size, decode_content=True))
+    if hasattr(source, "read"):
+        return iter(lambda: source.read(chunk_size), b"")
+    return iter(source)
+
+
+def _parse_json_page(document):
+    envelope = document.get("response", document)
+    header = envelope.get("header") or {}
+    body = envelope.get("body") or {}
+
+    items = body.get("items") or []
+    if isinstance(items, dict):
+        items = items.get("item") or []
+    if isinstance(items, dict):
+        # 항목이 하나뿐이면 리스트가 아닌 dict로 오는 API가 있음
+        items = [items]
+
+    return PublicDataApiPage(
+        result_code=_text_or_none(header.get("resultCode")),
+        result_msg=_text_or_none(header.get("resultMsg")),
+        total_count=_int_or_none(body.get("totalCount")),
+        page_no=_int_or_none(body.get("pageNo")),
+        num_of_rows=_int_or_none(body.get("numOfRows")),
+        items=items,
+    )
+
+
+def element_to_dict(element):
+    """
+    XML 요소를 dict로 변환
+
+    자식이 없는 요소는 텍스트로, 같은 태그가 반복되는 자식은 리스트로
+    변환합니다.
+
+    Args:
+        element (xml.etree.ElementTree.Element): 변환할 요소
+
+    Returns:
+        dict | str | None: 변환 결과
+    """
+    if len(element) == 0:
+        return element.text
+    result = {}
+    for child in element:
+        value = element_to_dict(child)
+        if child.tag in result:
+            if not isinstance(result[child.tag], list):
+                result[child.tag] = [result[child.tag]]
+            result[child.tag].append(value)
+        else:
+            result[child.tag] = value
+    return result
+
+
+def _text_or_none(value):
+    if value is None:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+def _int_or_none(value):
+    value = _text_or_none(value)
+    return int(value) if value is not None else None
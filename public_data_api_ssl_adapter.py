@@ -5,10 +5,1321 @@ Public Data API SSL Adapter
 SSL Labs 분석 결과를 기반으로 최적화된 SSL 컨텍스트를 제공합니다.
 """
 
+import atexit
+import bisect
+import collections
+import contextlib
+import copy
+import functools
+import http.cookiejar
+import itertools
+import math
+import os
+import queue
+import socket
 import ssl
+import sys
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.ssl_ import create_urllib3_context
+from requests.adapters import DEFAULT_POOLBLOCK, HTTPAdapter
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool, PoolManager
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.exceptions import (
+    ConnectTimeoutError,
+    EmptyPoolError,
+    HTTPError,
+    LocationParseError,
+    NameResolutionError,
+    NewConnectionError,
+)
+from urllib3.util.connection import (
+    allowed_gai_family,
+    create_connection,
+    is_connection_dropped,
+)
+
+# Python 3.12 미만에서는 ssl 모듈에 상수가 없으므로 OpenSSL 값을 직접 사용
+_OP_LEGACY_SERVER_CONNECT = getattr(ssl, "OP_LEGACY_SERVER_CONNECT", 0x4)
+
+# 공유 세션을 사용하지 않은 채로 유지할 최대 시간 (초)
+DEFAULT_SESSION_IDLE_TIMEOUT = 300.0
+
+# PublicDataApiClient의 호스트별 기본 연결 수
+DEFAULT_CLIENT_POOL_MAXSIZE = 32
+
+# prewarm()과 백그라운드 연결 갱신에서 연결 하나를 기다리는 시간 (초)
+DEFAULT_CONNECT_TIMEOUT = 10.0
+
+# idle_timeout이 있는 풀이 없을 때 백그라운드 연결 갱신이 다시 확인하는 간격 (초)
+DEFAULT_IDLE_REFRESH_INTERVAL = 30.0
+
+# 단계별 소요 시간 히스토그램의 구간 상한 (초)
+TIMING_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+# 서버가 지원하는 약한 cipher suite
+# SSL Labs 결과에서 확인된 지원 암호화 방식
+LEGACY_CIPHERS = (
+    "AES128-SHA",  # TLS_RSA_WITH_AES_128_CBC_SHA
+    "AES256-SHA",  # TLS_RSA_WITH_AES_256_CBC_SHA
+    "DHE-RSA-AES128-SHA",  # TLS_DHE_RSA_WITH_AES_128_CBC_SHA
+    "DHE-RSA-AES256-SHA",  # TLS_DHE_RSA_WITH_AES_256_CBC_SHA
+    "DES-CBC3-SHA",  # TLS_RSA_WITH_3DES_EDE_CBC_SHA (매우 약함)
+)
+
+# 서버가 지원하면 LEGACY_CIPHERS보다 먼저 고를 cipher suite (비용이 낮은 순)
+# benchmark.py ciphers 측정 결과 (OpenSSL 3.0, AES-NI, RSA 2048 인증서):
+# - 핸드셰이크: ECDHE/RSA 키 교환 약 1.3ms, DHE 약 10ms (7~8배)
+# - 전송 속도: AES-GCM이 AES-CBC-SHA1보다 2~2.5배 빠름, ChaCha20은
+#   AES-NI가 없는 CPU에서만 유리하므로 AES-GCM 뒤에 둠
+PREFERRED_CIPHERS = (
+    "ECDHE-RSA-AES128-GCM-SHA256",
+    "ECDHE-RSA-AES256-GCM-SHA384",
+    "AES128-GCM-SHA256",  # TLS_RSA_WITH_AES_128_GCM_SHA256
+    "AES256-GCM-SHA384",  # TLS_RSA_WITH_AES_256_GCM_SHA384
+    "ECDHE-RSA-CHACHA20-POLY1305",
+    "ECDHE-RSA-AES128-SHA",  # TLS_ECDHE_RSA_WITH_AES_128_CBC_SHA
+)
+
+# 레거시 서버 재협상 등 구형 서버 호환성 옵션
+LEGACY_OPTIONS = _OP_LEGACY_SERVER_CONNECT | getattr(
+    ssl, "OP_DONT_INSERT_EMPTY_FRAGMENTS", 0
+)
+
+# 공공데이터 API 요청 헤더 (일부 공공데이터 사이트에서 요구)
+PUBLIC_DATA_API_HEADERS = {
+    "User-Agent": ("User-Agent"),
+    "Accept": "application/json, application/xml, text/plain, */*",
+    "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Referer": "https://www.data.go.kr",
+}
+
+
+def build_cipher_string(preferred=PREFERRED_CIPHERS, fallback=LEGACY_CIPHERS):
+    """
+    선호 순서대로 cipher 문자열을 만듦
+
+    OpenSSL 클라이언트는 이 순서대로 cipher를 제시하므로, 클라이언트
+    순서를 따르는 서버는 목록 앞의 (비용이 낮은) suite를 고릅니다.
+    LEGACY_CIPHERS는 서버가 빠른 suite를 지원하지 않을 때만 쓰이도록
+    뒤에 둡니다. 이 파이썬의 OpenSSL이 지원하지 않는 이름(예: 3DES)은
+    무시됩니다.
+
+    ECDHE suite를 제시하면 ClientHello에 타원 곡선 확장이 추가됩니다.
+    이를 거부하는 서버에는 preferred=()로 예전 목록만 쓰세요.
+
+    Args:
+        preferred (tuple): 먼저 제시할 suite (OpenSSL 이름)
+        fallback (tuple): 그 뒤에 제시할 suite
+
+    Returns:
+        str: TLSProfile.ciphers에 쓸 cipher 문자열
+
+    Example:
+        >>> profile = LEGACY_TLS_PROFILE._replace(
+        ...     ciphers=build_cipher_string(preferred=("AES128-GCM-SHA256",)))
+    """
+    names = dict.fromkeys((*preferred, *fallback))
+    return ":".join(names) + ":!aNULL:!eNULL"
+
+
+TLSProfile = collections.namedtuple(
+    "TLSProfile",
+    [
+        "minimum_version",
+        "maximum_version",
+        "ciphers",
+        "options",
+        "check_hostname",
+        "verify_mode",
+    ],
+)
+TLSProfile.__doc__ = """
+SSL 컨텍스트를 결정하는 TLS 설정 묶음
+
+해시 가능한 불변 값이므로 get_public_data_api_ssl_context()의 캐시 키로
+사용됩니다. 같은 프로필은 프로세스 안에서 같은 SSL 컨텍스트를 공유합니다.
+"""
+
+# SSL Labs 분석 결과를 기반으로 한 공공데이터 API 서버 스펙
+LEGACY_TLS_PROFILE = TLSProfile(
+    # 1. TLS 버전 설정 (서버가 1.0, 1.2만 지원)
+    minimum_version=ssl.TLSVersion.TLSv1,  # 서버 호환성을 위해 1.0 허용
+    maximum_version=ssl.TLSVersion.TLSv1_2,  # 서버가 1.3 미지원
+    # 2. 빠른 suite를 먼저 제시하고, 약한 암호화는 호환성을 위해 뒤에 포함
+    ciphers=build_cipher_string(),
+    # 4. 레거시 호환성 옵션
+    options=LEGACY_OPTIONS,
+    # 3. 추가 호환성 옵션들
+    check_hostname=False,  # SNI 문제 해결
+    verify_mode=ssl.CERT_NONE,  # 인증서 검증 우회 (필요시)
+)
+
+# TLS 1.2/1.3과 ECDHE + AEAD cipher만 쓰는 최신 서버용 프로필
+MODERN_TLS_PROFILE = TLSProfile(
+    minimum_version=ssl.TLSVersion.TLSv1_2,
+    maximum_version=ssl.TLSVersion.MAXIMUM_SUPPORTED,
+    # TLS 1.3 cipher suite는 set_ciphers()와 무관하게 OpenSSL 기본값 사용
+    ciphers="ECDHE+AESGCM:ECDHE+CHACHA20:!aNULL:!eNULL",
+    options=0,
+    check_hostname=True,
+    verify_mode=ssl.CERT_REQUIRED,
+)
+
+
+class PublicDataApiSSLContext(ssl.SSLContext):
+    """
+    여러 어댑터와 연결 풀이 공유하는 SSL 컨텍스트
+
+    urllib3는 새 연결을 만들 때마다 CA 번들을 컨텍스트에 다시 로드합니다.
+    공유 컨텍스트에서는 이미 로드한 번들을 다시 파싱할 필요가 없으므로
+    같은 인자의 load_verify_locations() 호출을 한 번만 수행합니다.
+
+    또한 핸드셰이크가 끝난 연결의 SSLSession을 host:port별로 보관했다가
+    같은 서버로 새 연결을 열 때 제시하여, DHE처럼 비싼 전체 핸드셰이크
+    대신 세션 재개(session ID / ticket)를 시도합니다. 재개 여부는
+    handshake_stats()로 확인할 수 있습니다.
+    """
+
+    def __init__(self, protocol=ssl.PROTOCOL_TLS_CLIENT):
+        self._verify_locations_lock = threading.Lock()
+        self._loaded_verify_locations = set()
+        self._sessions_lock = threading.Lock()
+        self._sessions = {}  # (host, port) -> ssl.SSLSession
+        self._handshakes = {"full": 0, "resumed": 0}
+
+    def load_verify_locations(self, cafile=None, capath=None, cadata=None):
+        key = (cafile, capath, cadata)
+        with self._verify_locations_lock:
+            if key in self._loaded_verify_locations:
+                return
+            super().load_verify_locations(cafile, capath, cadata)
+            self._loaded_verify_locations.add(key)
+
+    def wrap_socket(self, sock, *args, **kwargs):
+        if kwargs.get("server_side") or args:
+            return super().wrap_socket(sock, *args, **kwargs)
+
+        key = self._session_key(sock, kwargs.get("server_hostname"))
+        if kwargs.get("session") is None:
+            kwargs["session"] = self._cached_session(key)
+
+        start = time.perf_counter()
+        ssl_sock = super().wrap_socket(sock, **kwargs)
+        # 핸드셰이크 시간 (PublicDataApiHTTPSConnection.tls_info에서 사용)
+        ssl_sock.handshake_time = time.perf_counter() - start
+
+        # do_handshake_on_connect=False이면 아직 세션이 없으므로 기록하지 않음
+        if ssl_sock.version() is not None:
+            self._record_handshake(key, ssl_sock)
+        return ssl_sock
+
+    def handshake_stats(self):
+        """
+        이 컨텍스트로 수행한 핸드셰이크 통계
+
+        Returns:
+            dict: full(전체 핸드셰이크), resumed(세션 재개),
+                cached_sessions(보관 중인 세션 수)
+        """
+        with self._sessions_lock:
+            stats = dict(self._handshakes)
+            stats["cached_sessions"] = len(self._sessions)
+        return stats
+
+    def update_session(self, ssl_sock):
+        """
+        연결의 현재 세션으로 보관 중인 세션을 바꿈
+
+        TLS 1.3은 핸드셰이크가 끝난 뒤 세션 티켓을 보내므로, 핸드셰이크
+        직후에 보관한 세션으로는 재개할 수 없습니다. 응답을 읽은 연결을
+        풀에 반납할 때 호출하여 티켓이 있는 세션을 보관합니다.
+        """
+        if ssl_sock.version() != "TLSv1.3":
+            return
+        session = ssl_sock.session
+        if session is None or not session.has_ticket:
+            return
+        key = self._session_key(ssl_sock, ssl_sock.server_hostname)
+        if key is not None:
+            with self._sessions_lock:
+                self._sessions[key] = session
+
+    def clear_sessions(self):
+        """보관 중인 TLS 세션을 모두 버림"""
+        with self._sessions_lock:
+            self._sessions.clear()
+
+    @staticmethod
+    def _session_key(sock, server_hostname):
+        try:
+            peer_host, peer_port = sock.getpeername()[:2]
+        except OSError:
+            return None
+        return (server_hostname or peer_host, peer_port)
+
+    def _cached_session(self, key):
+        if key is None:
+            return None
+        with self._sessions_lock:
+            session = self._sessions.get(key)
+            if session is not None and session.time + session.timeout < time.time():
+                del self._sessions[key]
+                session = None
+        return session
+
+    def _record_handshake(self, key, ssl_sock):
+        session = ssl_sock.session
+        with self._sessions_lock:
+            self._handshakes["resumed" if ssl_sock.session_reused else "full"] += 1
+            if key is not None and session is not None:
+                self._sessions[key] = session
+
+
+def create_public_data_api_ssl_context(tls_profile=None):
+    """
+    TLS 프로필로 새 SSL 컨텍스트를 생성 (캐시하지 않음)
+
+    대부분의 경우 공유 컨텍스트를 반환하는
+    get_public_data_api_ssl_context()를 사용하세요. 이 함수는 사용자 CA
+    번들을 로드하는 등 공유 컨텍스트와 분리된 컨텍스트가 필요할 때 씁니다.
+
+    Args:
+        tls_profile (TLSProfile | None): TLS 설정. 기본값은 LEGACY_TLS_PROFILE
+
+    Returns:
+        PublicDataApiSSLContext: 새 SSL 컨텍스트
+    """
+    tls_profile = tls_profile or LEGACY_TLS_PROFILE
+    ctx = PublicDataApiSSLContext(ssl.PROTOCOL_TLS_CLIENT)
+
+    # urllib3 기본 컨텍스트와 같은 기본 옵션
+    # 단, 세션 재개에 ticket을 쓸 수 있도록 OP_NO_TICKET은 설정하지 않음
+    ctx.options |= ssl.OP_NO_COMPRESSION
+    ctx.options &= ~ssl.OP_NO_TICKET
+    ctx.post_handshake_auth = True
+    sslkeylogfile = os.environ.get("SSLKEYLOGFILE")
+    if sslkeylogfile:
+        ctx.keylog_filename = sslkeylogfile
+
+    ctx.minimum_version = tls_profile.minimum_version
+    ctx.maximum_version = tls_profile.maximum_version
+    ctx.set_ciphers(tls_profile.ciphers)
+    ctx.options |= tls_profile.options
+
+    # check_hostname이 켜져 있으면 CERT_NONE으로 바꿀 수 없으므로 먼저 끔
+    ctx.check_hostname = False
+    ctx.verify_mode = tls_profile.verify_mode
+    ctx.check_hostname = tls_profile.check_hostname
+    if tls_profile.verify_mode != ssl.CERT_NONE:
+        ctx.load_verify_locations(requests.certs.where())
+    return ctx
+
+
+_shared_ssl_context = functools.lru_cache(maxsize=None)(
+    create_public_data_api_ssl_context
+)
+
+
+def get_public_data_api_ssl_context(tls_profile=None):
+    """
+    TLS 프로필에 해당하는 공유 SSL 컨텍스트를 반환
+
+    컨텍스트는 프로필별로 한 번만 만들어지고 이후에는 캐시된 객체가
+    반환되므로, 어댑터와 세션을 많이 만드는 프로세스에서도 컨텍스트
+    생성과 cipher 설정 비용을 반복하지 않습니다. 반환된 컨텍스트는
+    프로세스 전체가 공유하므로 직접 수정하지 마세요. 설정을 바꾸려면
+    새로운 TLSProfile을 사용하세요.
+
+    Args:
+        tls_profile (TLSProfile | None): TLS 설정. 기본값은 LEGACY_TLS_PROFILE
+
+    Returns:
+        PublicDataApiSSLContext: 공유 SSL 컨텍스트
+
+    Example:
+        >>> ctx = get_public_data_api_ssl_context()
+        >>> ctx is get_public_data_api_ssl_context(LEGACY_TLS_PROFILE)
+        True
+    """
+    return _shared_ssl_context(tls_profile or LEGACY_TLS_PROFILE)
+
+
+def resolve_tls_profile(tls_profile, verify, check_hostname=None):
+    """
+    인증서 검증 여부를 반영한 TLS 프로필 반환
+
+    공유 컨텍스트의 verify_mode를 요청마다 바꾸면 다른 스레드의 연결에
+    영향을 주므로, 검증 설정별로 별도 프로필(=별도 공유 컨텍스트)을 사용합니다.
+
+    Args:
+        tls_profile (TLSProfile | None): 기준 TLS 설정
+        verify (bool | str): requests의 verify 인자와 같은 의미.
+            False면 검증하지 않고, 그 외에는 인증서를 검증합니다.
+        check_hostname (bool | None): 검증 시 SSL 계층에서 호스트 이름을
+            확인할지 여부. None이면 기준 프로필 값을 따릅니다.
+
+    Returns:
+        TLSProfile: 검증 설정이 반영된 프로필
+    """
+    tls_profile = tls_profile or LEGACY_TLS_PROFILE
+    if verify is False:
+        return tls_profile._replace(check_hostname=False, verify_mode=ssl.CERT_NONE)
+    if check_hostname is None:
+        check_hostname = tls_profile.check_hostname
+    return tls_profile._replace(
+        check_hostname=check_hostname, verify_mode=ssl.CERT_REQUIRED
+    )
+
+
+HostProfile = collections.namedtuple(
+    "HostProfile",
+    ["tls_profile", "pool_maxsize", "timeout", "pool_timeout", "idle_timeout"],
+    defaults=(None, None, None, None, None),
+)
+HostProfile.__doc__ = """
+호스트 하나의 연결 설정
+
+tls_profile은 SSL 컨텍스트, pool_maxsize는 연결 풀 크기, timeout은 요청에
+timeout을 주지 않았을 때의 기본값 (requests의 timeout 인자와 같은 형식),
+pool_timeout과 idle_timeout은 PublicDataApiSSLAdapter의 같은 이름 인자와
+같습니다. None인 항목은 어댑터의 설정을 따릅니다.
+"""
+
+
+class HostProfileRegistry:
+    """
+    호스트별 연결 설정(HostProfile) 목록 (스레드 안전)
+
+    호스트 이름은 대소문자를 구분하지 않으며, "*.go.kr"처럼 시작하는
+    와일드카드는 모든 하위 도메인에 적용됩니다. 정확히 일치하는 항목과
+    더 긴 와일드카드가 우선합니다.
+
+    Usage:
+        profiles = HostProfileRegistry({
+            "api.odcloud.kr": HostProfile(tls_profile=MODERN_TLS_PROFILE),
+            "apis.data.go.kr": HostProfile(pool_maxsize=8, timeout=(5, 30)),
+        })
+        session = create_public_data_api_session(host_profiles=profiles)
+    """
+
+    def __init__(self, profiles=None):
+        """
+        Args:
+            profiles (dict | None): 호스트 -> HostProfile
+        """
+        self._lock = threading.Lock()
+        self._profiles = {}
+        for host, profile in (profiles or {}).items():
+            self.register(host, profile)
+
+    def register(self, host, profile=None, **fields):
+        """
+        호스트의 연결 설정 등록 (이미 있으면 바꿈)
+
+        이미 만들어진 연결 풀의 풀 크기는 바뀌지 않으므로, 세션을 만들기
+        전에 등록하세요.
+
+        Args:
+            host (str): 호스트 이름 또는 "*.도메인"
+            profile (HostProfile | None): 연결 설정
+            **fields: profile 대신 HostProfile 항목을 직접 지정
+
+        Returns:
+            HostProfile: 등록된 설정
+        """
+        profile = (profile or HostProfile())._replace(**fields)
+        with self._lock:
+            self._profiles[host.lower()] = profile
+        return profile
+
+    def unregister(self, host):
+        """호스트의 연결 설정 삭제"""
+        with self._lock:
+            self._profiles.pop(host.lower(), None)
+
+    def lookup(self, host):
+        """
+        호스트에 적용할 연결 설정
+
+        Args:
+            host (str): 호스트 이름
+
+        Returns:
+            HostProfile | None: 등록된 설정 (없으면 None)
+        """
+        labels = host.lower().rstrip(".").split(".")
+        with self._lock:
+            profile = self._profiles.get(".".join(labels))
+            for i in range(1, len(labels)):
+                if profile is not None:
+                    break
+                profile = self._profiles.get("*." + ".".join(labels[i:]))
+        return profile
+
+    def tls_profiles(self):
+        """
+        Returns:
+            list: 등록된 설정들이 사용하는 TLSProfile 목록 (중복 없음)
+        """
+        with self._lock:
+            profiles = [p.tls_profile for p in self._profiles.values()]
+        return list(dict.fromkeys(p for p in profiles if p is not None))
+
+    def __len__(self):
+        with self._lock:
+            return len(self._profiles)
+
+    def __getstate__(self):
+        with self._lock:
+            return {"profiles": dict(self._profiles)}
+
+    def __setstate__(self, state):
+        self._lock = threading.Lock()
+        self._profiles = state["profiles"]
+
+
+PrewarmResult = collections.namedtuple(
+    "PrewarmResult", ["pool", "requested", "connected", "already_connected", "failed", "elapsed"]
+)
+PrewarmResult.__doc__ = """
+prewarm() 결과
+
+pool은 "scheme://host:port", connected는 새로 핸드셰이크한 연결 수,
+already_connected는 이미 열려 있던 연결 수, failed는 실패한 연결 수,
+elapsed는 걸린 시간(초)입니다. 다른 요청이 쓰고 있어 풀에서 꺼내지 못한
+연결은 세 수 어디에도 포함되지 않습니다.
+"""
+
+
+class PoolStats:
+    """
+    연결 풀 하나의 사용 통계 (스레드 안전)
+
+    checkouts: 풀에서 연결을 꺼낸 횟수
+    created: 새로 연 연결 수 (= TCP 연결 + TLS 핸드셰이크 수)
+    saturated: 꺼낼 때 풀에 남은 연결이 없었던 횟수
+    wait_seconds: blocking 모드에서 연결이 반납되기를 기다린 전체 시간
+    pool_timeouts: 기다리다 pool_timeout이 지나 실패한 횟수
+    discarded: 풀이 가득 차서 반납하지 못하고 닫은 연결 수
+    idle_discards: idle_timeout보다 오래 쉬어 꺼낼 때 닫고 다시 연 연결 수
+    refreshed: 백그라운드에서 닫고 다시 연 연결 수
+    stale_failures: 재사용한 연결이 서버 쪽에서 끊겨 요청이 실패한 횟수
+    in_use / max_in_use: 지금 사용 중인 연결 수와 그 최댓값
+    """
+
+    FIELDS = (
+        "checkouts",
+        "created",
+        "saturated",
+        "wait_seconds",
+        "pool_timeouts",
+        "discarded",
+        "idle_discards",
+        "refreshed",
+        "stale_failures",
+        "in_use",
+        "max_in_use",
+    )
+
+    # 여러 풀을 합칠 때 더하지 않고 가장 큰 값을 쓰는 항목 (풀마다 최댓값에
+    # 이른 시각이 다르므로 더하면 실제보다 커짐)
+    PEAK_FIELDS = frozenset({"max_in_use"})
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = dict.fromkeys(self.FIELDS, 0)
+
+    def record(self, **increments):
+        """카운터 증가"""
+        with self._lock:
+            for name, value in increments.items():
+                self._values[name] += value
+
+    def checkout(self, saturated, waited):
+        """연결을 꺼냄"""
+        with self._lock:
+            values = self._values
+            values["checkouts"] += 1
+            values["saturated"] += saturated
+            values["wait_seconds"] += waited
+            values["in_use"] += 1
+            values["max_in_use"] = max(values["max_in_use"], values["in_use"])
+
+    def checkin(self):
+        """연결을 반납함"""
+        with self._lock:
+            self._values["in_use"] = max(self._values["in_use"] - 1, 0)
+
+    def snapshot(self):
+        """
+        Returns:
+            dict: FIELDS별 현재 값
+        """
+        with self._lock:
+            return dict(self._values)
+
+
+TLSConnectionInfo = collections.namedtuple(
+    "TLSConnectionInfo", ["version", "cipher", "bits", "session_reused", "handshake_time"]
+)
+TLSConnectionInfo.__doc__ = """
+연결 하나에서 협상된 TLS 설정
+
+version은 ssl_object.version() (예: "TLSv1.2"), cipher와 bits는 cipher()의
+이름과 비밀키 길이, session_reused는 세션을 재개했는지 여부,
+handshake_time은 핸드셰이크에 걸린 시간(초, 알 수 없으면 None)입니다.
+연결의 tls_info 속성으로 확인할 수 있습니다.
+"""
+
+# 약한 것으로 보는 프로토콜과 cipher 이름의 일부
+WEAK_TLS_VERSIONS = frozenset({"SSLv3", "TLSv1", "TLSv1.1"})
+WEAK_CIPHER_MARKERS = ("DES-CBC3", "3DES", "RC4", "NULL", "EXPORT")
+
+
+def is_weak_tls(version, cipher):
+    """
+    협상된 프로토콜이나 cipher suite가 약한지 여부
+
+    Args:
+        version (str): TLS 버전 (예: "TLSv1")
+        cipher (str): cipher suite 이름 (예: "DES-CBC3-SHA")
+
+    Returns:
+        bool: TLS 1.1 이하이거나 3DES/RC4/NULL/EXPORT cipher이면 True
+    """
+    return version in WEAK_TLS_VERSIONS or any(
+        marker in cipher for marker in WEAK_CIPHER_MARKERS
+    )
+
+
+class TLSStats:
+    """
+    협상된 (TLS 버전, cipher suite)별 연결 통계 (스레드 안전)
+
+    연결을 열 때 한 번만 기록하므로 요청 경로에는 비용이 없습니다.
+
+    connections: 새로 연 연결 수
+    resumed: 그중 세션을 재개한 연결 수
+    handshake_seconds / max_handshake_seconds: 핸드셰이크 시간의 합과 최댓값
+    handshake_buckets: 핸드셰이크 시간의 구간별 누적 연결 수
+    """
+
+    FIELDS = ("connections", "resumed", "handshake_seconds", "max_handshake_seconds")
+
+    def __init__(self, buckets=TIMING_BUCKETS):
+        """
+        Args:
+            buckets (sequence): 핸드셰이크 시간의 오름차순 구간 상한 (초)
+        """
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        # (version, cipher) -> [FIELDS 값..., bits, 구간별 연결 수]
+        self._values = {}
+
+    def record(self, info):
+        """
+        새 연결 하나를 기록
+
+        Args:
+            info (TLSConnectionInfo): 연결의 TLS 설정
+        """
+        key = (info.version, info.cipher)
+        handshake_time = info.handshake_time or 0.0
+        with self._lock:
+            values = self._values.get(key)
+            if values is None:
+                values = self._values[key] = [
+                    0, 0, 0.0, 0.0, info.bits, [0] * (len(self.buckets) + 1)
+                ]
+            values[0] += 1
+            values[1] += info.session_reused
+            values[2] += handshake_time
+            values[3] = max(values[3], handshake_time)
+            values[5][bisect.bisect_left(self.buckets, handshake_time)] += 1
+
+    def merge(self, other):
+        """다른 TLSStats의 값을 더함 (같은 buckets여야 함)"""
+        with other._lock:
+            items = [
+                (key, values[:5] + [list(values[5])])
+                for key, values in other._values.items()
+            ]
+        with self._lock:
+            for key, theirs in items:
+                values = self._values.get(key)
+                if values is None:
+                    self._values[key] = theirs
+                    continue
+                for i in range(3):
+                    values[i] += theirs[i]
+                values[3] = max(values[3], theirs[3])
+                for i, count in enumerate(theirs[5]):
+                    values[5][i] += count
+
+    def snapshot(self):
+        """
+        Returns:
+            dict: (version, cipher) -> FIELDS별 값, bits, weak(is_weak_tls()),
+                share(전체 연결 중 비율), handshake_buckets((상한, 누적 연결 수)
+                목록. 마지막 상한은 math.inf)
+        """
+        with self._lock:
+            items = [
+                (key, values[:5] + [list(values[5])])
+                for key, values in self._values.items()
+            ]
+        total = sum(values[0] for _, values in items)
+        bounds = self.buckets + (math.inf,)
+        snapshot = {}
+        for (version, cipher), values in items:
+            entry = dict(zip(self.FIELDS, values))
+            entry["bits"] = values[4]
+            entry["handshake_buckets"] = list(
+                zip(bounds, itertools.accumulate(values[5]))
+            )
+            entry["weak"] = is_weak_tls(version, cipher)
+            entry["share"] = values[0] / total if total else 0.0
+            snapshot[(version, cipher)] = entry
+        return snapshot
+
+
+class RequestTimings:
+    """
+    요청 하나의 단계별 소요 시간 (초)
+
+    dns: 호스트 이름 조회
+    connect: TCP 연결
+    tls: TLS 핸드셰이크
+    ttfb: 요청 전송부터 응답 헤더 수신까지 (서버 처리 시간 포함)
+    body: 응답 헤더 수신부터 본문을 다 읽거나 응답을 닫을 때까지
+    reused: keep-alive 연결을 재사용했는지 여부
+
+    재사용한 연결은 dns/connect/tls가 None이고, stream=True로 받아 본문을
+    아직 다 읽지 않은 응답은 body가 None입니다.
+    """
+
+    __slots__ = ("dns", "connect", "tls", "ttfb", "body", "reused", "_headers_at")
+
+    PHASES = ("dns", "connect", "tls", "ttfb", "body")
+
+    def __init__(self, reused):
+        self.dns = self.connect = self.tls = self.ttfb = self.body = None
+        self.reused = reused
+        self._headers_at = None
+
+    @property
+    def total(self):
+        """측정된 단계의 합 (초)"""
+        # 요청마다 본문 단계와 함께 기록되므로 getattr 반복 없이 더함
+        return (
+            (self.dns or 0.0)
+            + (self.connect or 0.0)
+            + (self.tls or 0.0)
+            + (self.ttfb or 0.0)
+            + (self.body or 0.0)
+        )
+
+    def as_dict(self):
+        """
+        Returns:
+            dict: PHASES별 소요 시간, total, reused
+        """
+        values = {phase: getattr(self, phase) for phase in self.PHASES}
+        values["total"] = self.total
+        values["reused"] = self.reused
+        return values
+
+    def __repr__(self):
+        phases = ", ".join(
+            f"{phase}={getattr(self, phase) * 1000:.2f}ms"
+            for phase in self.PHASES
+            if getattr(self, phase) is not None
+        )
+        return f"<RequestTimings {phases} reused={self.reused}>"
+
+
+class TimingHistograms:
+    """
+    단계별 소요 시간 히스토그램 (스레드 안전)
+
+    RequestTimings의 단계와 total마다 buckets 구간별 요청 수와 합계를
+    누적합니다. 요청 경로의 record()는 큐에 추가만 하고, 구간 계산과 누적은
+    큐가 BATCH_SIZE만큼 찼을 때나 merge()/snapshot() 때 모아서 합니다.
+    따라서 메모리 사용량은 요청 수와 관계없이 일정합니다. 연결 풀(호스트)마다
+    하나씩 만들어집니다.
+    """
+
+    PHASES = RequestTimings.PHASES + ("total",)
+
+    # 모아서 누적할 기록 수
+    BATCH_SIZE = 256
+
+    def __init__(self, buckets=TIMING_BUCKETS):
+        """
+        Args:
+            buckets (sequence): 오름차순 구간 상한 (초). 마지막 구간 뒤에
+                상한이 없는 구간이 하나 더 있음
+        """
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._counts = {phase: [0] * (len(self.buckets) + 1) for phase in self.PHASES}
+        self._sums = dict.fromkeys(self.PHASES, 0.0)
+        self._pending = collections.deque()  # 아직 누적하지 않은 (timings, phases)
+
+    def record(self, timings, phases=PHASES):
+        """
+        RequestTimings에서 측정된 단계들을 기록
+
+        Args:
+            timings (RequestTimings): 요청의 단계별 소요 시간
+            phases (sequence): 기록할 단계 이름 (None인 단계는 건너뜀)
+        """
+        pending = self._pending
+        pending.append((timings, phases))
+        if len(pending) >= self.BATCH_SIZE:
+            self._flush()
+
+    def _flush(self):
+        # 쌓인 기록을 누적 (deque의 append/popleft는 스레드 안전)
+        buckets = self.buckets
+        counts = self._counts
+        sums = self._sums
+        pending = self._pending
+        with self._lock:
+            while pending:
+                try:
+                    timings, phases = pending.popleft()
+                except IndexError:
+                    break
+                for phase in phases:
+                    value = getattr(timings, phase)
+                    if value is not None:
+                        counts[phase][bisect.bisect_left(buckets, value)] += 1
+                        sums[phase] += value
+
+    def merge(self, other):
+        """다른 히스토그램의 값을 더함 (같은 buckets여야 함)"""
+        other._flush()
+        with other._lock:
+            counts = {phase: list(values) for phase, values in other._counts.items()}
+            sums = dict(other._sums)
+        with self._lock:
+            for phase in self.PHASES:
+                mine = self._counts[phase]
+                for i, count in enumerate(counts[phase]):
+                    mine[i] += count
+                self._sums[phase] += sums[phase]
+
+    def snapshot(self):
+        """
+        Returns:
+            dict: 단계 -> count, sum, mean, p50/p95/p99 (구간 안에서 선형
+                보간한 추정값), buckets ((상한, 누적 요청 수) 목록.
+                마지막 상한은 math.inf)
+        """
+        self._flush()
+        with self._lock:
+            counts = {phase: list(values) for phase, values in self._counts.items()}
+            sums = dict(self._sums)
+        bounds = self.buckets + (math.inf,)
+        snapshot = {}
+        for phase in self.PHASES:
+            cumulative = list(itertools.accumulate(counts[phase]))
+            total = cumulative[-1]
+            snapshot[phase] = {
+                "count": total,
+                "sum": sums[phase],
+                "mean": sums[phase] / total if total else None,
+                "p50": self._quantile(cumulative, 0.50),
+                "p95": self._quantile(cumulative, 0.95),
+                "p99": self._quantile(cumulative, 0.99),
+                "buckets": list(zip(bounds, cumulative)),
+            }
+        return snapshot
+
+    def _quantile(self, cumulative, fraction):
+        # Prometheus histogram_quantile과 같은 방식. 상한이 없는 구간은 마지막 상한
+        total = cumulative[-1]
+        if not total:
+            return None
+        rank = fraction * total
+        index = bisect.bisect_left(cumulative, rank)
+        if index >= len(self.buckets):
+            return self.buckets[-1]
+        lower = self.buckets[index - 1] if index else 0.0
+        previous = cumulative[index - 1] if index else 0
+        in_bucket = cumulative[index] - previous
+        return lower + (self.buckets[index] - lower) * (rank - previous) / in_bucket
+
+
+class _TimedConnectionMixin:
+    # 단계별 시간을 기록할 요청의 RequestTimings (풀이 요청마다 설정, 기본값 None)
+    _timings = None
+    # TCP 연결이 끝난 시각 (TLS 핸드셰이크 시간 계산용)
+    _connected_at = None
+    # 협상된 TLS 설정 (HTTPS 연결)과 이를 기록할 풀의 TLSStats
+    tls_info = None
+    tls_stats = None
+
+    def _new_conn(self):
+        timings = self._timings
+        if timings is None:
+            return super()._new_conn()
+
+        # 이름은 여기서 한 번만 조회하고, 조회한 주소로 차례로 연결함. 주소가
+        # 숫자 형식이므로 urllib3의 create_connection은 다시 조회하지 않음.
+        # 예외는 urllib3의 HTTPConnection._new_conn과 같은 방식으로 변환함
+        start = time.perf_counter()
+        host = self._dns_host.strip("[]")
+        try:
+            addresses = socket.getaddrinfo(
+                host, self.port, allowed_gai_family(), socket.SOCK_STREAM
+            )
+        except UnicodeError:
+            raise LocationParseError(f"'{host}', label empty or too long") from None
+        except socket.gaierror as e:
+            raise NameResolutionError(self.host, self, e) from e
+        resolved = time.perf_counter()
+        timings.dns = resolved - start
+
+        try:
+            sock = self._connect_addresses(addresses)
+        except socket.timeout as e:
+            raise ConnectTimeoutError(
+                self,
+                f"Connection to {self.host} timed out. (connect timeout={self.timeout})",
+            ) from e
+        except OSError as e:
+            raise NewConnectionError(
+                self, f"Failed to establish a new connection: {e}"
+            ) from e
+        sys.audit("http.client.connect", self, self.host, self.port)
+        self._connected_at = time.perf_counter()
+        timings.connect = self._connected_at - resolved
+        return sock
+
+    def _connect_addresses(self, addresses):
+        """조회한 주소에 차례로 연결하고 처음 성공한 소켓을 반환"""
+        error = OSError("getaddrinfo returns an empty list")
+        for address in addresses:
+            try:
+                return create_connection(
+                    address[4][:2],
+                    self.timeout,
+                    source_address=self.source_address,
+                    socket_options=self.socket_options,
+                )
+            except OSError as e:
+                error = e
+        raise error
+
+
+class PublicDataApiHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    """연결 단계별 소요 시간을 기록할 수 있는 HTTP 연결"""
+
+
+class PublicDataApiHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    """
+    협상된 TLS 설정(tls_info)과 연결 단계별 소요 시간을 기록하는 HTTPS 연결
+    """
+
+    def connect(self):
+        super().connect()
+        if self._timings is not None:
+            self._timings.tls = time.perf_counter() - self._connected_at
+        sock = self.sock
+        if isinstance(sock, ssl.SSLSocket):
+            name, _, bits = sock.cipher()
+            self.tls_info = TLSConnectionInfo(
+                sock.version(),
+                name,
+                bits,
+                sock.session_reused,
+                getattr(sock, "handshake_time", None),
+            )
+            if self.tls_stats is not None:
+                self.tls_stats.record(self.tls_info)
+
+
+class _InstrumentedPoolMixin:
+    # PublicDataApiPoolManager가 풀을 만든 뒤 설정
+    pool_timeout = None
+    idle_timeout = None
+    timing_histograms = None  # None이면 단계별 시간을 기록하지 않음
+
+    def __init__(self, *args, **kwargs):
+        self.stats = PoolStats()
+        self.tls_stats = TLSStats()
+        super().__init__(*args, **kwargs)
+
+    def _new_conn(self):
+        conn = super()._new_conn()
+        conn.tls_stats = self.tls_stats
+        self.stats.record(created=1)
+        return conn
+
+    def _get_conn(self, timeout=None):
+        if timeout is None:
+            timeout = self.pool_timeout
+        pool = self.pool
+        saturated = pool is not None and pool.empty()
+        # 기다린 시간은 풀이 비어 있을 때만 잼
+        start = time.perf_counter() if saturated else None
+        try:
+            conn = super()._get_conn(timeout)
+        except EmptyPoolError:
+            waited = time.perf_counter() - start if saturated else 0.0
+            self.stats.record(saturated=1, pool_timeouts=1, wait_seconds=waited)
+            raise
+        waited = time.perf_counter() - start if saturated and self.block else 0.0
+        self.stats.checkout(saturated, waited)
+        # 서버가 조용히 끊었을 수 있는 연결은 보내기 전에 닫음 (요청할 때 다시 연결)
+        if conn.sock is not None and self._is_idle(conn, time.monotonic()):
+            conn.close()
+            self.stats.record(idle_discards=1)
+        return conn
+
+    def _put_conn(self, conn):
+        pool = self.pool
+        if conn is not None:
+            timings = getattr(conn, "_timings", None)
+            if timings is not None:
+                # 본문을 다 읽거나 응답을 닫아 연결이 반납됨: 모든 단계를 한 번에 기록
+                conn._timings = None
+                timings.body = time.perf_counter() - timings._headers_at
+                self.timing_histograms.record(timings)
+            self._mark_released(conn)
+            if pool is not None and pool.full():
+                self.stats.record(discarded=1)
+        self.stats.checkin()
+        super()._put_conn(conn)
+
+    def _mark_released(self, conn):
+        # 반납 시각을 남기고, 핸드셰이크 뒤에 받은 TLS 세션 티켓을 캐시에 반영
+        conn._last_used = time.monotonic()
+        sock = conn.sock
+        if sock is not None and isinstance(getattr(sock, "context", None), PublicDataApiSSLContext):
+            sock.context.update_session(sock)
+
+    def _take_idle_conn(self):
+        """
+        prewarm()용: 기다리지 않고 풀에서 연결을 꺼냄 (사용 통계에 기록하지 않음)
+
+        urllib3의 _get_conn()은 non-blocking 풀이 비어 있으면 풀 크기를 넘는
+        새 연결을 만들고, 이 연결은 반납할 때 버려집니다. 따라서 큐에서 직접
+        꺼내고, 빈 자리(None)가 있을 때만 새 연결을 만듭니다.
+
+        Returns:
+            HTTPConnection | None: 꺼낸 연결. 모두 사용 중이면 None
+        """
+        pool = self.pool
+        if pool is None:
+            return None
+        try:
+            conn = pool.get(block=False)
+        except queue.Empty:
+            return None
+        if conn is None:
+            return self._new_conn()
+        if is_connection_dropped(conn):
+            conn.close()
+        return conn
+
+    def _return_idle_conn(self, conn):
+        """_take_idle_conn()으로 꺼낸 연결을 반납 (사용 통계에 기록하지 않음)"""
+        self._mark_released(conn)
+        super()._put_conn(conn)
+
+    def _make_request(self, conn, *args, **kwargs):
+        if self.timing_histograms is not None:
+            return self._make_timed_request(conn, *args, **kwargs)
+        reused = conn.sock is not None
+        try:
+            return super()._make_request(conn, *args, **kwargs)
+        except ConnectionError:
+            # 재사용한 연결에서 보내자마자 끊김(RST, 빈 응답)을 받은 경우
+            if reused:
+                self.stats.record(stale_failures=1)
+            raise
+
+    def _make_timed_request(self, conn, *args, **kwargs):
+        # record_timings=True일 때의 _make_request
+        reused = conn.sock is not None
+        conn._timings = timings = RequestTimings(reused)
+        start = time.perf_counter()
+        try:
+            response = super()._make_request(conn, *args, **kwargs)
+        except ConnectionError:
+            if reused:
+                self.stats.record(stale_failures=1)
+            conn._timings = None
+            raise
+        except BaseException:
+            conn._timings = None
+            raise
+        timings._headers_at = now = time.perf_counter()
+        if reused:
+            timings.ttfb = now - start
+        else:
+            timings.ttfb = (
+                now - start - (timings.dns or 0) - (timings.connect or 0) - (timings.tls or 0)
+            )
+        response.timings = timings
+        return response
+
+    def _is_idle(self, conn, now):
+        last_used = getattr(conn, "_last_used", None)
+        return (
+            self.idle_timeout is not None
+            and last_used is not None
+            and now - last_used > self.idle_timeout
+        )
+
+    def refresh_idle(self, reconnect=True):
+        """
+        풀에 보관된 연결 중 idle_timeout보다 오래 쉰 연결을 닫고 다시 엶
+
+        요청 경로 밖에서 연결을 갱신하여, 다음 요청이 끊긴 연결이나 새
+        핸드셰이크를 만나지 않게 합니다. 갱신하는 동안 해당 연결은 풀에서
+        빠져 있습니다.
+
+        Args:
+            reconnect (bool): False이면 닫기만 함 (다음 요청이 다시 연결)
+
+        Returns:
+            int: 닫은 연결 수
+        """
+        pool = self.pool
+        if pool is None or self.idle_timeout is None:
+            return 0
+        now = time.monotonic()
+        with pool.mutex:
+            idle = [
+                conn
+                for conn in pool.queue
+                if conn is not None and conn.sock is not None and self._is_idle(conn, now)
+            ]
+            for conn in idle:
+                pool.queue.remove(conn)
+        for conn in idle:
+            conn.close()
+            if reconnect:
+                _connect(conn, DEFAULT_CONNECT_TIMEOUT)
+            conn._last_used = time.monotonic()
+            super()._put_conn(conn)
+        if reconnect:
+            self.stats.record(refreshed=len(idle))
+        else:
+            self.stats.record(idle_discards=len(idle))
+        return len(idle)
+
+
+class PublicDataApiHTTPConnectionPool(_InstrumentedPoolMixin, HTTPConnectionPool):
+    """사용 통계를 기록하는 HTTP 연결 풀"""
+
+    ConnectionCls = PublicDataApiHTTPConnection
+
+
+class PublicDataApiHTTPSConnectionPool(_InstrumentedPoolMixin, HTTPSConnectionPool):
+    """사용 통계를 기록하는 HTTPS 연결 풀"""
+
+    ConnectionCls = PublicDataApiHTTPSConnection
+
+
+class PublicDataApiPoolManager(PoolManager):
+    """
+    사용 통계를 기록하는 연결 풀을 만드는 PoolManager
+
+    blocking 모드(block=True)에서 pool_timeout을 지정하면 연결이 반납되기를
+    그 시간까지만 기다리고 EmptyPoolError를 발생시킵니다.
+
+    idle_timeout(호스트별로는 host_idle_timeouts)보다 오래 쉰 연결은 꺼낼 때
+    닫고 다시 엽니다. idle_refresh=True이면 백그라운드 스레드가 그 전에
+    연결을 다시 열어 둡니다.
+
+    host_profiles(HostProfileRegistry)에 등록된 호스트는 그 설정의
+    pool_timeout과 idle_timeout을 우선 사용합니다.
+
+    record_timings=True이면 풀마다 TimingHistograms를 두고 요청의 단계별
+    소요 시간을 기록합니다 (timing_stats() 참고).
+    """
+
+    def __init__(
+        self,
+        *args,
+        pool_timeout=None,
+        idle_timeout=None,
+        host_idle_timeouts=None,
+        idle_refresh=False,
+        host_profiles=None,
+        record_timings=False,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.pool_timeout = pool_timeout
+        self.record_timings = record_timings
+        self.idle_timeout = idle_timeout
+        self.host_profiles = host_profiles or HostProfileRegistry()
+        self.host_idle_timeouts = {
+            host.lower(): seconds for host, seconds in (host_idle_timeouts or {}).items()
+        }
+        self.idle_refresh = idle_refresh
+        self._refresher = None
+        self._refresher_stop = None
+        self._refresher_lock = threading.Lock()
+        self.pool_classes_by_scheme = {
+            "http": PublicDataApiHTTPConnectionPool,
+            "https": PublicDataApiHTTPSConnectionPool,
+        }
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context)
+        profile = self.host_profiles.lookup(host) or HostProfile()
+        pool.pool_timeout = (
+            profile.pool_timeout if profile.pool_timeout is not None else self.pool_timeout
+        )
+        pool.idle_timeout = (
+            profile.idle_timeout
+            if profile.idle_timeout is not None
+            else self.host_idle_timeouts.get(host.lower(), self.idle_timeout)
+        )
+        if self.record_timings:
+            pool.timing_histograms = TimingHistograms()
+        if self.idle_refresh and pool.idle_timeout is not None:
+            self._start_refresher()
+        return pool
+
+    def _refresh_interval(self):
+        # 풀들의 idle_timeout 중 가장 짧은 값의 절반. 호스트별 idle_timeout만
+        # 지정했고 그 풀들이 모두 밀려났으면 기본 간격으로 다시 확인
+        timeouts = [self.idle_timeout]
+        for key in self.pools.keys():
+            pool = self.pools.get(key)
+            if pool is not None:
+                timeouts.append(pool.idle_timeout)
+        timeouts = [t for t in timeouts if t is not None]
+        return min(timeouts) / 2 if timeouts else DEFAULT_IDLE_REFRESH_INTERVAL
+
+    def _start_refresher(self):
+        with self._refresher_lock:
+            if self._refresher is not None:
+                return
+            self._refresher_stop = threading.Event()
+            # 스레드가 풀 관리자를 붙잡아 두지 않도록 약한 참조를 넘김
+            self._refresher = threading.Thread(
+                target=_refresh_idle_connections,
+                args=(weakref.ref(self), self._refresher_stop),
+                name="public-data-api-idle-refresh",
+                daemon=True,
+            )
+            self._refresher.start()
+
+    def refresh_idle(self, reconnect=True):
+        """
+        모든 풀에서 오래 쉰 연결을 갱신 (_InstrumentedPoolMixin.refresh_idle 참고)
+
+        Returns:
+            int: 갱신한 연결 수
+        """
+        refreshed = 0
+        for key in self.pools.keys():
+            pool = self.pools.get(key)
+            if pool is not None:
+                refreshed += pool.refresh_idle(reconnect)
+        return refreshed
+
+    def clear(self):
+        with self._refresher_lock:
+            refresher, self._refresher = self._refresher, None
+            if refresher is not None:
+                self._refresher_stop.set()
+        if refresher is not None and refresher is not threading.current_thread():
+            refresher.join()
+        super().clear()
+
+    def pool_stats(self):
+        """
+        호스트별 연결 풀 통계
+
+        같은 호스트에 인증서 검증 설정별로 풀이 여러 개 있으면 합산합니다
+        (max_in_use는 가장 큰 값).
+
+        Returns:
+            dict: "scheme://host:port" -> PoolStats.snapshot()
+        """
+        stats = {}
+        for key in self.pools.keys():
+            pool = self.pools.get(key)
+            if pool is None:
+                continue
+            name = f"{key.key_scheme}://{key.key_host}:{key.key_port}"
+            snapshot = pool.stats.snapshot()
+            if name in stats:
+                merged = stats[name]
+                for field, value in snapshot.items():
+                    if field in PoolStats.PEAK_FIELDS:
+                        merged[field] = max(merged[field], value)
+                    else:
+                        merged[field] += value
+            else:
+                stats[name] = snapshot
+        return stats
+
+    def timing_stats(self):
+        """
+        호스트별 단계별 소요 시간 히스토그램
+
+        같은 호스트에 인증서 검증 설정별로 풀이 여러 개 있으면 합산합니다.
+        요청은 연결이 풀로 반납될 때(본문을 다 읽거나 응답을 닫을 때) 모든
+        단계가 한 번에 기록되므로, 아직 닫지 않은 stream=True 응답은 포함되지
+        않습니다.
+
+        Returns:
+            dict: "scheme://host:port" -> TimingHistograms.snapshot()
+                (record_timings=False이면 빈 dict)
+        """
+        merged = {}
+        for key in self.pools.keys():
+            pool = self.pools.get(key)
+            if pool is None or pool.timing_histograms is None:
+                continue
+            name = f"{key.key_scheme}://{key.key_host}:{key.key_port}"
+            if name not in merged:
+                merged[name] = TimingHistograms(pool.timing_histograms.buckets)
+            merged[name].merge(pool.timing_histograms)
+        return {name: histograms.snapshot() for name, histograms in merged.items()}
+
+    def tls_stats(self, per_pool=False):
+        """
+        협상된 (TLS 버전, cipher suite)별 연결 통계
+
+        Args:
+            per_pool (bool): True면 "scheme://host:port"별로 나눠 반환
+
+        Returns:
+            dict: (version, cipher) -> TLSStats.snapshot() 항목.
+                per_pool=True면 "scheme://host:port" -> 그 dict
+        """
+        merged = {}
+        for key in self.pools.keys():
+            pool = self.pools.get(key)
+            if pool is None or not hasattr(pool, "tls_stats"):
+                continue
+            name = f"{key.key_scheme}://{key.key_host}:{key.key_port}" if per_pool else None
+            merged.setdefault(name, TLSStats()).merge(pool.tls_stats)
+        if per_pool:
+            return {name: stats.snapshot() for name, stats in merged.items()}
+        return merged[None].snapshot() if merged else {}
 
 
 class PublicDataApiSSLAdapter(HTTPAdapter):
@@ -21,13 +1332,148 @@ class PublicDataApiSSLAdapter(HTTPAdapter):
     - SNI (Server Name Indication) 문제
     - 인증서 체인 검증 문제
 
+    요청 처리에 기능을 덧붙이는 계층(호출 속도 제한, 재시도 정책, 응답
+    캐시 등)은 생성자 인자로 마운트합니다. 각 계층은
+    send(next_send, request, **kwargs) 메서드를 가지며, 다음 계층의 send
+    함수를 호출하여 요청을 전달합니다.
+
     Usage:
         adapter = PublicDataApiSSLAdapter()
         session = adapter.create_public_data_api_session()
         response = session.get("https://apis.data.go.kr/your-endpoint")
     """
 
-    def init_poolmanager(self, *args, **kwargs):
+    __attrs__ = HTTPAdapter.__attrs__ + [
+        "tls_profile",
+        "retry_policy",
+        "rate_limiter",
+        "single_flight",
+        "cache",
+        "pool_timeout",
+        "idle_timeout",
+        "host_idle_timeouts",
+        "idle_refresh",
+        "host_profiles",
+        "prober",
+        "record_timings",
+        "metrics",
+    ]
+
+    def __init__(
+        self,
+        tls_profile=None,
+        retry_policy=None,
+        rate_limiter=None,
+        single_flight=None,
+        cache=None,
+        pool_timeout=None,
+        idle_timeout=None,
+        host_idle_timeouts=None,
+        idle_refresh=False,
+        host_profiles=None,
+        prober=None,
+        record_timings=False,
+        metrics=None,
+        **kwargs,
+    ):
+        """
+        Args:
+            tls_profile (TLSProfile | None): 사용할 TLS 설정.
+                기본값은 LEGACY_TLS_PROFILE
+            retry_policy (ResultCodeRetryPolicy | None): resultCode 기반
+                재시도 계층 (public_data_api_response 참고)
+            rate_limiter (ServiceKeyRateLimiter | None): 서비스키별 호출 속도
+                제한 계층 (public_data_api_ratelimit 참고). 재시도도 한 번의
+                호출로 계산되도록 재시도 계층 안쪽에 마운트됨
+            single_flight (SingleFlight | None): 동시에 진행 중인 같은 요청을
+                합치는 계층 (public_data_api_cache 참고). 캐시 안쪽에
+                마운트되어 캐시에 없는 요청만 합침
+            cache (ResponseCache | None): 응답 캐시 계층
+                (public_data_api_cache 참고). 가장 바깥에 마운트되어
+                캐시된 요청은 호출 한도를 쓰지 않음
+            pool_timeout (float | None): pool_block=True일 때 연결이 반납되기를
+                기다릴 최대 시간 (초). 지나면 urllib3.exceptions.EmptyPoolError,
+                None이면 계속 기다림
+            idle_timeout (float | None): 이보다 오래 (초) 쉰 연결은 보내기
+                전에 닫고 다시 엶. 서버/로드밸런서의 keep-alive 제한 시간보다
+                짧게 지정. None이면 확인하지 않음
+            host_idle_timeouts (dict | None): 호스트별 idle_timeout
+                (예: {"apis.data.go.kr": 4})
+            idle_refresh (bool): True이면 백그라운드 스레드가 idle_timeout의
+                절반 간격으로 오래 쉰 연결을 미리 다시 열어 둠
+            host_profiles (HostProfileRegistry | dict | None): 호스트별
+                TLS 프로필, 풀 크기, 제한 시간. 등록되지 않은 호스트와
+                None인 항목은 위의 설정을 따름
+            prober (TLSProfileProber | None): host_profiles에 TLS 프로필이
+                없는 호스트의 가장 빠른 프로필을 확인하여 사용
+                (public_data_api_probe 참고). 확인에 실패하면 tls_profile 사용
+            record_timings (bool): True이면 요청마다 DNS 조회, TCP 연결, TLS
+                핸드셰이크, 첫 바이트까지, 본문 수신 시간을 재어
+                response.timings(RequestTimings)에 담고 호스트별 히스토그램에
+                누적함 (timing_stats() 참고). False이면 response.timings는 None
+            metrics (PublicDataApiMetrics | None): 요청 지표 계층
+                (public_data_api_metrics 참고). 가장 바깥에 마운트되어 캐시와
+                재시도를 거친 최종 결과를 기록하고, 이 어댑터의 풀/캐시/호출
+                한도 통계도 함께 내보냄
+            **kwargs: HTTPAdapter()에 전달할 추가 인자들
+                (pool_connections, pool_maxsize, max_retries, pool_block)
+        """
+        self.tls_profile = tls_profile or LEGACY_TLS_PROFILE
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.single_flight = single_flight
+        self.cache = cache
+        self.pool_timeout = pool_timeout
+        self.idle_timeout = idle_timeout
+        self.host_idle_timeouts = host_idle_timeouts
+        self.idle_refresh = idle_refresh
+        if not isinstance(host_profiles, HostProfileRegistry):
+            host_profiles = HostProfileRegistry(host_profiles)
+        self.host_profiles = host_profiles
+        self.prober = prober
+        self.record_timings = record_timings
+        self.metrics = metrics
+        super().__init__(**kwargs)
+        if metrics is not None:
+            metrics.add_adapter(self)
+
+    def send(self, request, **kwargs):
+        """
+        마운트된 계층을 거쳐 요청을 전송
+
+        바깥 계층부터 순서대로 호출되며, 가장 안쪽에서 HTTPAdapter.send()가
+        실제 요청을 보냅니다.
+        """
+        send = self._send
+        for layer in self._send_layers():
+            send = functools.partial(layer.send, send)
+        return send(request, **kwargs)
+
+    def _send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            profile = self._host_profile(urlparse(request.url).hostname or "")
+            if profile.timeout is not None:
+                kwargs["timeout"] = profile.timeout
+        return super().send(request, **kwargs)
+
+    def _host_profile(self, host):
+        # 등록된 설정이 없는 호스트는 모든 항목이 None인 기본 설정
+        return self.host_profiles.lookup(host) or HostProfile()
+
+    def _send_layers(self):
+        # 전송에 가까운 안쪽 계층부터 나열
+        layers = (
+            self.rate_limiter,
+            self.retry_policy,
+            self.single_flight,
+            self.cache,
+            self.metrics,
+        )
+        return [layer for layer in layers if layer is not None]
+
+    def init_poolmanager(
+        self, connections, maxsize, block=DEFAULT_POOLBLOCK, **pool_kwargs
+    ):
         """
         SSL 컨텍스트를 공공데이터 API 서버 스펙에 맞게 초기화
 
@@ -35,39 +1481,221 @@ class PublicDataApiSSLAdapter(HTTPAdapter):
         - TLS 버전: 1.0, 1.2 (1.3 미지원 서버 대응)
         - Cipher Suite: 구형 암호화 방식 포함
         - 레거시 호환성 옵션
+
+        컨텍스트는 tls_profile별로 캐시되어 모든 어댑터가 공유합니다.
+        연결 풀은 사용 통계를 기록합니다 (pool_stats() 참고).
         """
-        # SSL 컨텍스트 생성
-        ctx = create_urllib3_context()
-
-        # 1. TLS 버전 설정 (서버가 1.0, 1.2만 지원)
-        ctx.minimum_version = ssl.TLSVersion.TLSv1  # 서버 호환성을 위해 1.0 허용
-        ctx.maximum_version = ssl.TLSVersion.TLSv1_2  # 서버가 1.3 미지원
-
-        # 2. 서버가 지원하는 약한 cipher suite 허용
-        # SSL Labs 결과에서 확인된 지원 암호화 방식
-        weak_ciphers = [
-            "AES128-SHA",  # TLS_RSA_WITH_AES_128_CBC_SHA
-            "AES256-SHA",  # TLS_RSA_WITH_AES_256_CBC_SHA
-            "DHE-RSA-AES128-SHA",  # TLS_DHE_RSA_WITH_AES_128_CBC_SHA
-            "DHE-RSA-AES256-SHA",  # TLS_DHE_RSA_WITH_AES_256_CBC_SHA
-            "DES-CBC3-SHA",  # TLS_RSA_WITH_3DES_EDE_CBC_SHA (매우 약함)
-        ]
+        # pickle 복원 시 HTTPAdapter.__setstate__가 사용하는 값
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+
+        pool_kwargs["ssl_context"] = get_public_data_api_ssl_context(self.tls_profile)
+        self.poolmanager = PublicDataApiPoolManager(
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            pool_timeout=self.pool_timeout,
+            idle_timeout=self.idle_timeout,
+            host_idle_timeouts=self.host_idle_timeouts,
+            idle_refresh=self.idle_refresh,
+            host_profiles=self.host_profiles,
+            record_timings=self.record_timings,
+            **pool_kwargs,
+        )
+
+    def prewarm(self, host, n, verify=True, timeout=DEFAULT_CONNECT_TIMEOUT):
+        """
+        연결 N개를 미리 열어 풀에 넣어 둠
+
+        배포 직후 첫 요청들이 구형 TLS 핸드셰이크를 차례로 기다리지 않도록,
+        시작할 때 연결을 동시에 열고 핸드셰이크까지 마쳐 연결 풀에 보관합니다.
+        첫 연결의 핸드셰이크를 먼저 끝낸 뒤 나머지를 동시에 열어, 나머지
+        연결은 첫 연결의 TLS 세션을 재개합니다.
 
-        # 약한 암호화 포함하여 설정 (정부 서버 호환성을 위해)
-        cipher_string = ":".join(weak_ciphers) + ":!aNULL:!eNULL"
-        ctx.set_ciphers(cipher_string)
+        n은 풀 크기(pool_maxsize)를 넘을 수 없습니다. 연결 풀은 요청의
+        verify 설정별로 다르므로, 이후 요청과 같은 verify 값을 넘겨야 합니다.
+        풀에서 연결을 꺼낼 때 기다리지 않으므로, 다른 요청이 쓰고 있는 연결은
+        건너뜁니다. 꺼내고 반납하는 것은 pool_stats()의 사용 통계(checkouts,
+        saturated, wait_seconds)에 기록되지 않습니다.
 
-        # 3. 추가 호환성 옵션들
-        ctx.check_hostname = False  # SNI 문제 해결
-        ctx.verify_mode = ssl.CERT_NONE  # 인증서 검증 우회 (필요시)
+        Args:
+            host (str): 호스트 이름 또는 URL (스킴이 없으면 https)
+            n (int): 열어 둘 연결 수
+            verify (bool | str): 이후 요청에서 사용할 인증서 검증 설정
+            timeout (float): 연결 하나의 연결 제한 시간 (초)
 
-        # 4. 레거시 호환성 옵션
-        ctx.options |= ssl.OP_LEGACY_SERVER_CONNECT
-        if hasattr(ssl, "OP_DONT_INSERT_EMPTY_FRAGMENTS"):
-            ctx.options |= ssl.OP_DONT_INSERT_EMPTY_FRAGMENTS
+        Returns:
+            PrewarmResult: 열린 연결 수와 걸린 시간
+
+        Example:
+            >>> adapter.prewarm("apis.data.go.kr", 8)
+            PrewarmResult(pool='https://apis.data.go.kr:443', requested=8, connected=8, ...)
+        """
+        url = host if "://" in host else f"https://{host}"
+        request = requests.Request("GET", url).prepare()
+        host_params, pool_kwargs = self.build_connection_pool_key_attributes(
+            request, verify
+        )
+        pool = self.poolmanager.connection_from_host(**host_params, pool_kwargs=pool_kwargs)
+        name = f"{host_params['scheme']}://{pool.host}:{pool.port}"
+        n = min(n, pool.pool.maxsize if pool.pool is not None else 0)
+
+        start = time.perf_counter()
+        # 핸드셰이크하는 동안 다른 요청이 같은 연결을 꺼내지 않도록 먼저 모두 꺼냄
+        # (blocking 풀에서 pool_timeout=None이어도 기다리지 않음)
+        conns = []
+        for _ in range(n):
+            conn = pool._take_idle_conn()
+            if conn is None:
+                break
+            conns.append(conn)
+        try:
+            cold = [conn for conn in conns if not conn.is_connected]
+            failed = 0
+            if cold:
+                failed += not _connect(cold[0], timeout)
+            if len(cold) > 1:
+                with ThreadPoolExecutor(
+                    max_workers=len(cold) - 1, thread_name_prefix="public-data-api-prewarm"
+                ) as executor:
+                    failed += sum(
+                        not ok for ok in executor.map(lambda c: _connect(c, timeout), cold[1:])
+                    )
+        finally:
+            for conn in conns:
+                pool._return_idle_conn(conn)
+
+        return PrewarmResult(
+            pool=name,
+            requested=n,
+            connected=len(cold) - failed,
+            already_connected=len(conns) - len(cold),
+            failed=failed,
+            elapsed=time.perf_counter() - start,
+        )
 
-        kwargs["ssl_context"] = ctx
-        return super().init_poolmanager(*args, **kwargs)
+    def pool_stats(self):
+        """
+        호스트별 연결 풀 사용 통계
+
+        Returns:
+            dict: "scheme://host:port" -> PoolStats 값 (checkouts, created,
+                saturated, wait_seconds, pool_timeouts, discarded, in_use,
+                max_in_use)
+
+        Example:
+            >>> adapter.pool_stats()["https://apis.data.go.kr:443"]["discarded"]
+            0
+        """
+        return self.poolmanager.pool_stats()
+
+    def timing_stats(self):
+        """
+        호스트별 단계별 소요 시간 히스토그램 (record_timings=True일 때)
+
+        Returns:
+            dict: "scheme://host:port" -> 단계(dns, connect, tls, ttfb, body,
+                total) -> count, sum, mean, p50, p95, p99, buckets
+
+        Example:
+            >>> adapter.timing_stats()["https://apis.data.go.kr:443"]["tls"]["p95"]
+            0.0213
+        """
+        return self.poolmanager.timing_stats()
+
+    def tls_stats(self, per_pool=False):
+        """
+        실제로 협상된 TLS 버전과 cipher suite별 연결 통계
+
+        연결을 열 때 한 번만 기록합니다. 구형 서버 호환을 위해 허용한 약한
+        suite(TLS 1.0, 3DES 등)로 맺은 연결의 비율을 확인하여 허용 목록을
+        줄일지 판단할 수 있습니다.
+
+        Args:
+            per_pool (bool): True면 "scheme://host:port"별로 나눠 반환
+
+        Returns:
+            dict: (version, cipher) -> connections, resumed, handshake_seconds,
+                max_handshake_seconds, bits, weak, share
+
+        Example:
+            >>> stats = adapter.tls_stats()
+            >>> sum(entry["share"] for entry in stats.values() if entry["weak"])
+            0.0
+        """
+        return self.poolmanager.tls_stats(per_pool)
+
+    def build_response(self, req, resp):
+        """urllib3 응답을 requests.Response로 변환하고 단계별 소요 시간을 붙임"""
+        response = super().build_response(req, resp)
+        response.timings = getattr(resp, "timings", None)
+        return response
+
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        """
+        요청의 호스트와 verify 설정에 맞는 공유 SSL 컨텍스트로 연결 풀을 선택
+
+        urllib3는 연결을 만들 때마다 컨텍스트의 verify_mode를 요청 설정으로
+        덮어씁니다. 검증 설정별로 다른 컨텍스트를 넘겨 공유 컨텍스트가
+        실제로는 바뀌지 않도록 합니다. host_profiles에 등록된 호스트는 그
+        호스트의 TLS 프로필과 풀 크기를 사용하고, TLS 프로필이 없으면
+        prober가 확인한 프로필을 사용합니다 (확인이 prober.wait초 안에 끝나지
+        않으면 어댑터 기본 프로필).
+        """
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(
+            request, verify, cert
+        )
+        profile = self._host_profile(host_params["host"])
+        if profile.pool_maxsize is not None:
+            pool_kwargs["maxsize"] = profile.pool_maxsize
+        if host_params["scheme"] == "https":
+            tls_profile = profile.tls_profile
+            if tls_profile is None and self.prober is not None:
+                tls_profile = self.prober.profile_for(
+                    host_params["host"], host_params["port"] or 443
+                )
+            pool_kwargs["ssl_context"] = get_public_data_api_ssl_context(
+                resolve_tls_profile(tls_profile or self.tls_profile, verify)
+            )
+        return host_params, pool_kwargs
+
+    def handshake_stats(self):
+        """
+        어댑터가 사용하는 SSL 컨텍스트들의 핸드셰이크 통계
+
+        컨텍스트는 같은 TLS 프로필을 쓰는 모든 어댑터가 공유하므로,
+        통계도 프로필 단위로 집계됩니다. 인증서 검증 여부별, 그리고
+        host_profiles에 등록되었거나 prober가 고른 프로필별 컨텍스트의
+        통계를 합산하여 반환합니다.
+
+        Returns:
+            dict: full, resumed, cached_sessions 카운터
+
+        Example:
+            >>> adapter.handshake_stats()
+            {'full': 1, 'resumed': 7, 'cached_sessions': 1}
+        """
+        stats = {"full": 0, "resumed": 0, "cached_sessions": 0}
+        for ctx in self._ssl_contexts():
+            for name, value in ctx.handshake_stats().items():
+                stats[name] += value
+        return stats
+
+    def _ssl_contexts(self):
+        # 인증서 검증 여부별로 이 어댑터가 사용할 수 있는 공유 컨텍스트들
+        contexts = []
+        tls_profiles = [self.tls_profile, *self.host_profiles.tls_profiles()]
+        if self.prober is not None:
+            tls_profiles.extend(self.prober.tls_profiles())
+        for tls_profile in tls_profiles:
+            for verify in (True, False):
+                ctx = get_public_data_api_ssl_context(
+                    resolve_tls_profile(tls_profile, verify)
+                )
+                if ctx not in contexts:
+                    contexts.append(ctx)
+        return contexts
 
     def create_public_data_api_session(self):
         """
@@ -84,30 +1712,51 @@ class PublicDataApiSSLAdapter(HTTPAdapter):
         session = requests.Session()
 
         # SSL 어댑터 적용
-        session.mount("https://", PublicDataApiSSLAdapter())
+        session.mount("https://", self)
 
         # 헤더 설정 (일부 공공데이터 사이트에서 요구)
         session.headers.clear()
-        session.headers.update(
-            {
-                "User-Agent": ("User-Agent"),
-                "Accept": "application/json, application/xml, text/plain, */*",
-                "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-                "Referer": "https://www.data.go.kr",
-            }
-        )
+        session.headers.update(PUBLIC_DATA_API_HEADERS)
 
         return session
 
 
+def _refresh_idle_connections(manager_ref, stop):
+    # PublicDataApiPoolManager의 백그라운드 연결 갱신 루프
+    while True:
+        manager = manager_ref()
+        if manager is None:
+            return
+        interval = manager._refresh_interval()
+        del manager
+        if stop.wait(interval):
+            return
+        manager = manager_ref()
+        if manager is None:
+            return
+        manager.refresh_idle()
+        del manager
+
+
+def _connect(conn, timeout):
+    # prewarm()용: 연결과 핸드셰이크를 수행하고 성공 여부를 반환
+    try:
+        conn.timeout = timeout
+        conn.connect()
+        return True
+    except (OSError, HTTPError):
+        conn.close()
+        return False
+
+
 # 편의를 위한 팩토리 함수들
-def create_public_data_api_session():
+def create_public_data_api_session(**adapter_kwargs):
     """
     공공데이터 API용 세션을 빠르게 생성하는 편의 함수
 
+    Args:
+        **adapter_kwargs: PublicDataApiSSLAdapter()에 전달할 추가 인자들
+
     Returns:
         requests.Session: 공공데이터 API 호출용 세션
 
@@ -115,14 +1764,395 @@ def create_public_data_api_session():
         >>> session = create_public_data_api_session()
         >>> response = session.get("https://apis.data.go.kr/endpoint")
     """
-    adapter = PublicDataApiSSLAdapter()
+    adapter = PublicDataApiSSLAdapter(**adapter_kwargs)
     return adapter.create_public_data_api_session()
 
 
+class PublicDataApiClient:
+    """
+    여러 스레드에서 함께 쓰는 공공데이터 API 클라이언트
+
+    requests.Session은 스레드 안전이 보장되지 않으므로(쿠키, 헤더 등 세션
+    상태를 요청마다 고침), 스레드마다 별도의 세션을 두고 연결 풀을 가진
+    하나의 어댑터를 모든 세션이 공유합니다. 연결 풀은 urllib3 큐로 관리되어
+    스레드 안전합니다.
+
+    기본값은 blocking 모드입니다. 풀의 연결을 모두 쓰고 있으면 새 연결을
+    열지 않고 반납을 기다리므로, 동시 요청이 많아도 "Connection pool is
+    full" 경고와 함께 연결을 버리고 핸드셰이크를 다시 하는 일이 없습니다.
+    풀이 얼마나 부족한지는 pool_stats()의 saturated, wait_seconds로 확인하여
+    pool_maxsize를 조정하세요.
+
+    Usage:
+        with PublicDataApiClient(pool_maxsize=16) as client:
+            with ThreadPoolExecutor(64) as executor:
+                responses = list(executor.map(client.get, urls))
+            print(client.pool_stats())
+    """
+
+    def __init__(
+        self,
+        pool_maxsize=DEFAULT_CLIENT_POOL_MAXSIZE,
+        pool_block=True,
+        pool_timeout=None,
+        **adapter_kwargs,
+    ):
+        """
+        Args:
+            pool_maxsize (int): 호스트별로 유지할 최대 연결 수
+            pool_block (bool): True면 연결을 모두 쓰고 있을 때 반납을 기다림.
+                False면 임시 연결을 새로 열고 반납 시 버림
+            pool_timeout (float | None): 반납을 기다릴 최대 시간 (초).
+                지나면 urllib3.exceptions.EmptyPoolError
+            **adapter_kwargs: PublicDataApiSSLAdapter()에 전달할 추가 인자들
+        """
+        self.adapter = PublicDataApiSSLAdapter(
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            pool_timeout=pool_timeout,
+            **adapter_kwargs,
+        )
+        self._local = threading.local()
+        self._closed = False
+
+    # from_session()으로 만든 경우 스레드별 세션의 원본 세션
+    _template = None
+
+    @classmethod
+    def from_session(cls, session):
+        """
+        기존 세션을 여러 스레드에서 함께 쓰기 위한 클라이언트를 만듦
+
+        스레드마다 session의 설정(헤더, 인증, 파라미터, 쿠키 등)을 복사한
+        세션을 따로 두고, 모든 세션이 session의 어댑터(연결 풀)를 그대로
+        마운트합니다. 복사한 세션이 받은 쿠키는 원본에 반영되지 않으며,
+        어댑터는 session의 소유이므로 close()는 어댑터를 닫지 않습니다.
+
+        Args:
+            session (requests.Session): 공공데이터 API 세션
+
+        Returns:
+            PublicDataApiClient: session의 어댑터를 공유하는 클라이언트
+        """
+        client = cls.__new__(cls)
+        client.adapter = session.get_adapter("https://")
+        client._local = threading.local()
+        client._closed = False
+        client._template = session
+        return client
+
+    @property
+    def session(self):
+        """현재 스레드의 세션 (공유 어댑터가 마운트됨)"""
+        if self._closed:
+            raise RuntimeError("PublicDataApiClient가 이미 닫혔습니다")
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self._new_session()
+        return session
+
+    def _new_session(self):
+        template = self._template
+        if template is None:
+            return self.adapter.create_public_data_api_session()
+        session = requests.Session()
+        for attr in (
+            "headers",
+            "auth",
+            "proxies",
+            "params",
+            "verify",
+            "cert",
+            "stream",
+            "trust_env",
+            "max_redirects",
+        ):
+            setattr(session, attr, copy.copy(getattr(template, attr)))
+        session.hooks = {event: list(hooks) for event, hooks in template.hooks.items()}
+        session.cookies = template.cookies.copy()
+        session.adapters = template.adapters.copy()
+        return session
+
+    def request(self, method, url, **kwargs):
+        """
+        요청을 보냄
+
+        Args:
+            method (str): HTTP 메서드
+            url (str): 요청할 URL
+            **kwargs: requests.Session.request()의 인자들
+
+        Returns:
+            requests.Response: 응답
+        """
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        """GET 요청 (인자는 requests.Session.get()과 같음)"""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, data=None, json=None, **kwargs):
+        """POST 요청 (인자는 requests.Session.post()와 같음)"""
+        return self.request("POST", url, data=data, json=json, **kwargs)
+
+    def prewarm(self, host, n, verify=True, timeout=DEFAULT_CONNECT_TIMEOUT):
+        """
+        연결 N개를 미리 열어 둠 (PublicDataApiSSLAdapter.prewarm() 참고)
+
+        Returns:
+            PrewarmResult: 열린 연결 수와 걸린 시간
+        """
+        return self.adapter.prewarm(host, n, verify=verify, timeout=timeout)
+
+    def pool_stats(self):
+        """
+        호스트별 연결 풀 사용 통계 (PublicDataApiSSLAdapter.pool_stats() 참고)
+
+        Returns:
+            dict: "scheme://host:port" -> 통계
+        """
+        return self.adapter.pool_stats()
+
+    def handshake_stats(self):
+        """
+        TLS 핸드셰이크 통계 (PublicDataApiSSLAdapter.handshake_stats() 참고)
+
+        Returns:
+            dict: full, resumed, cached_sessions 카운터
+        """
+        return self.adapter.handshake_stats()
+
+    def tls_stats(self, per_pool=False):
+        """
+        협상된 TLS 버전/cipher suite별 통계 (PublicDataApiSSLAdapter.tls_stats() 참고)
+
+        Returns:
+            dict: (version, cipher) -> 통계
+        """
+        return self.adapter.tls_stats(per_pool)
+
+    def close(self):
+        """공유 연결 풀을 닫음 (이후 요청은 RuntimeError)"""
+        self._closed = True
+        if self._template is None:
+            self.adapter.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _freeze(value):
+    # 어댑터 인자를 레지스트리 키로 쓸 수 있게 해시 가능한 값으로 바꿈
+    if isinstance(value, dict):
+        return tuple(sorted(((key, _freeze(item)) for key, item in value.items()), key=repr))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return (type(value).__qualname__, repr(value))
+    return value
+
+
+class PublicDataApiSessionRegistry:
+    """
+    어댑터 설정별로 세션을 공유하는 스레드 안전 레지스트리
+
+    편의 함수가 호출마다 세션을 새로 만들면 매번 TCP 연결과 구형 TLS
+    핸드셰이크(대부분 DHE)를 다시 수행하게 됩니다. 레지스트리는 같은
+    어댑터 설정에 대해 하나의 어댑터(연결 풀)를 재사용하여 keep-alive 연결을
+    살려 두고, idle_timeout 동안 사용되지 않은 설정은 닫아서 정리합니다.
+
+    requests.Session은 스레드 안전이 보장되지 않으므로 PublicDataApiClient와
+    같이 스레드마다 별도의 세션을 주고, 모든 세션이 같은 어댑터를 마운트합니다.
+    공유 세션은 서로 관계없는 호출이 함께 쓰므로, 한 호출이 받은 쿠키가 다른
+    호출에 보내지지 않도록 쿠키를 저장하지 않습니다 (요청의 cookies 인자는
+    그대로 보냄).
+
+    get_session()으로 받은 세션은 마지막으로 받은 뒤 idle_timeout이 지나면
+    닫힐 수 있으므로, 오래 붙잡고 쓰려면 checkout()을 사용하세요. checkout()
+    블록 안에서 쓰는 세션은 닫히지 않습니다.
+
+    Usage:
+        registry = PublicDataApiSessionRegistry(idle_timeout=60)
+        with registry.checkout() as session:
+            response = session.get("https://apis.data.go.kr/your-endpoint")
+        registry.close_all()
+    """
+
+    def __init__(self, idle_timeout=DEFAULT_SESSION_IDLE_TIMEOUT):
+        """
+        Args:
+            idle_timeout (float | None): 이 시간(초) 이상 사용되지 않은 세션을
+                닫습니다. None이면 유휴 세션을 정리하지 않습니다.
+        """
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        # 설정 키 -> [세션, 마지막 사용 시각, 사용 중인 checkout 수, 스레드별 세션]
+        # (세션은 처음 만든 세션으로, 닫으면 공유 어댑터가 닫힘)
+        self._sessions = {}
+
+    def __len__(self):
+        with self._lock:
+            return len(self._sessions)
+
+    def get_session(self, **adapter_kwargs):
+        """
+        어댑터 설정에 해당하는 공유 세션을 반환 (없으면 생성)
+
+        Args:
+            **adapter_kwargs: PublicDataApiSSLAdapter()에 전달할 인자들.
+                같은 인자 조합은 같은 세션을 공유합니다.
+
+        Returns:
+            requests.Session: 현재 스레드의 공유 세션 (같은 설정의 모든 스레드가
+                같은 어댑터를 공유)
+        """
+        return self._thread_session(self._acquire(adapter_kwargs, 0))
+
+    @contextlib.contextmanager
+    def checkout(self, **adapter_kwargs):
+        """
+        블록 안에서는 유휴 세션 정리로 닫히지 않는 공유 세션을 빌려 줌
+
+        Args:
+            **adapter_kwargs: PublicDataApiSSLAdapter()에 전달할 인자들
+
+        Yields:
+            requests.Session: 현재 스레드의 공유 세션
+
+        Example:
+            >>> with registry.checkout() as session:
+            ...     items = list(paginate(session, url, params))
+        """
+        entry = self._acquire(adapter_kwargs, 1)
+        try:
+            yield self._thread_session(entry)
+        finally:
+            with self._lock:
+                entry[1] = time.monotonic()
+                entry[2] -= 1
+
+    def _acquire(self, adapter_kwargs, checkouts):
+        key = _freeze(adapter_kwargs)
+        now = time.monotonic()
+
+        with self._lock:
+            expired = self._pop_idle_sessions(now)
+            entry = self._sessions.get(key)
+            if entry is None:
+                session = create_public_data_api_session(**adapter_kwargs)
+                _disable_cookies(session)
+                local = threading.local()
+                local.session = session
+                entry = [session, now, 0, local]
+                self._sessions[key] = entry
+            entry[1] = now
+            entry[2] += checkouts
+
+        # 세션 종료는 소켓 정리를 포함하므로 잠금 밖에서 수행
+        for session in expired:
+            session.close()
+        return entry
+
+    @staticmethod
+    def _thread_session(entry):
+        # 다른 스레드에서 처음 쓰면 같은 어댑터를 마운트한 세션을 새로 만듦
+        local = entry[3]
+        session = getattr(local, "session", None)
+        if session is None:
+            session = entry[0].get_adapter("https://").create_public_data_api_session()
+            _disable_cookies(session)
+            local.session = session
+        return session
+
+    def evict_idle(self):
+        """
+        idle_timeout을 넘긴 유휴 세션을 닫음
+
+        Returns:
+            int: 닫은 세션 수
+        """
+        with self._lock:
+            expired = self._pop_idle_sessions(time.monotonic())
+        for session in expired:
+            session.close()
+        return len(expired)
+
+    def close_all(self):
+        """등록된 모든 세션을 닫고 레지스트리를 비움"""
+        with self._lock:
+            sessions = [entry[0] for entry in self._sessions.values()]
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    def _pop_idle_sessions(self, now):
+        # 호출자가 self._lock을 잡고 있어야 함
+        if self.idle_timeout is None:
+            return []
+        idle_keys = [
+            key
+            for key, (_, last_used, checkouts, _) in self._sessions.items()
+            if not checkouts and now - last_used > self.idle_timeout
+        ]
+        return [self._sessions.pop(key)[0] for key in idle_keys]
+
+
+# 쿠키를 저장하지도 보내지도 않는 정책 (허용 도메인 없음)
+_NO_COOKIES_POLICY = http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+
+
+def _disable_cookies(session):
+    # 관계없는 호출이 함께 쓰는 공유 세션에 응답 쿠키가 남지 않게 함
+    session.cookies.set_policy(_NO_COOKIES_POLICY)
+
+
+# 편의 함수들이 공유하는 프로세스 전역 레지스트리
+_session_registry = PublicDataApiSessionRegistry()
+atexit.register(_session_registry.close_all)
+
+
+def get_shared_session(**adapter_kwargs):
+    """
+    프로세스 전역 레지스트리에서 공유 세션을 가져오는 편의 함수
+
+    Args:
+        **adapter_kwargs: PublicDataApiSSLAdapter()에 전달할 인자들
+
+    Returns:
+        requests.Session: 현재 스레드의 세션 (같은 설정끼리 어댑터를 공유)
+
+    Example:
+        >>> session = get_shared_session()
+        >>> session is get_shared_session()
+        True
+    """
+    return _session_registry.get_session(**adapter_kwargs)
+
+
+def close_all():
+    """
+    프로세스 전역 레지스트리의 모든 공유 세션을 닫음
+
+    인터프리터 종료 시 atexit으로 자동 호출되며, 워커를 fork하기 전처럼
+    열린 연결을 명시적으로 정리해야 할 때 직접 호출할 수 있습니다.
+    """
+    _session_registry.close_all()
+
+
 def public_data_api_get(url, **kwargs):
     """
     공공데이터 API에 GET 요청을 보내는 편의 함수
 
+    호출마다 세션을 새로 만들지 않고 get_shared_session()의 스레드별 세션을
+    재사용하므로, 연속 호출 시 keep-alive 연결과 TLS 핸드셰이크가 재활용됩니다.
+
     Args:
         url (str): 요청할 URL
         **kwargs: requests.get()에 전달할 추가 인자들
@@ -134,14 +2164,17 @@ def public_data_api_get(url, **kwargs):
         >>> response = public_data_api_get("https://apis.data.go.kr/endpoint")
         >>> print(response.json())
     """
-    session = create_public_data_api_session()
-    return session.get(url, **kwargs)
+    with _session_registry.checkout() as session:
+        return session.get(url, **kwargs)
 
 
 def public_data_api_post(url, **kwargs):
     """
     공공데이터 API에 POST 요청을 보내는 편의 함수
 
+    호출마다 세션을 새로 만들지 않고 get_shared_session()의 스레드별 세션을
+    재사용하므로, 연속 호출 시 keep-alive 연결과 TLS 핸드셰이크가 재활용됩니다.
+
     Args:
         url (str): 요청할 URL
         **kwargs: requests.post()에 전달할 추가 인자들
@@ -153,8 +2186,8 @@ def public_data_api_post(url, **kwargs):
         >>> response = public_data_api_post("https://apis.data.go.kr/endpoint",
         ...                          json={"key": "value"})
     """
-    session = create_public_data_api_session()
-    return session.post(url, **kwargs)
+    with _session_registry.checkout() as session:
+        return session.post(url, **kwargs)
 
 
 if __name__ == "__main__":
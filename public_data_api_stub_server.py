@@ -0,0 +1,454 @@
+"""
+Public Data API Stub Server
+
+공공데이터 API 서버를 흉내내는 로컬 TLS 스텁 서버
+네트워크 없이 어댑터의 실제 TLS 핸드셰이크와 연결 재사용을 테스트할 수 있습니다.
+"""
+
+import argparse
+import collections
+import json
+import os
+import random
+import socket
+import ssl
+import struct
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+from xml.sax.saxutils import escape
+
+from public_data_api_ssl_adapter import LEGACY_CIPHERS
+
+# 스텁 서버용 자체 서명 인증서 (CN=localhost, SAN: localhost, 127.0.0.1)
+# DHE cipher용 DH 파라미터(RFC 7919 ffdhe2048)도 같은 파일에 들어 있음
+STUB_CERTFILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "public_data_api_stub_server.pem"
+)
+
+
+def normal_service_response(method, path, query, body):
+    """
+    정상 응답(resultCode 00) JSON 봉투를 반환하는 기본 응답 함수
+
+    Args:
+        method (str): HTTP 메서드
+        path (str): 요청 경로
+        query (dict): 쿼리 파라미터
+        body (bytes): 요청 본문
+
+    Returns:
+        tuple: (상태 코드, 헤더 dict, 응답 본문 bytes)
+    """
+    payload = {
+        "response": {
+            "header": {"resultCode": "00", "resultMsg": "NORMAL SERVICE."},
+            "body": {"items": {"item": []}, "totalCount": 0},
+        }
+    }
+    return 200, {"Content-Type": "application/json"}, json.dumps(payload).encode()
+
+
+# resultCode별 resultMsg (공공데이터포털 OpenAPI 활용 가이드 기준)
+RESULT_MESSAGES = {
+    "00": "NORMAL SERVICE.",
+    "01": "APPLICATION_ERROR",
+    "02": "DB_ERROR",
+    "03": "NODATA_ERROR",
+    "04": "HTTP_ERROR",
+    "05": "SERVICETIMEOUT_ERROR",
+    "10": "INVALID_REQUEST_PARAMETER_ERROR",
+    "11": "NO_MANDATORY_REQUEST_PARAMETERS_ERROR",
+    "12": "NO_OPENAPI_SERVICE_ERROR",
+    "20": "SERVICE_ACCESS_DENIED_ERROR",
+    "21": "TEMPORARILY_DISABLE_THE_SERVICEKEY_ERROR",
+    "22": "LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR",
+    "23": "LIMITED_NUMBER_OF_SERVICE_REQUESTS_PER_SECOND_EXCEEDS_ERROR",
+    "30": "SERVICE_KEY_IS_NOT_REGISTERED_ERROR",
+    "31": "DEADLINE_HAS_EXPIRED_ERROR",
+    "32": "UNREGISTERED_IP_ERROR",
+    "33": "UNSIGNED_CALL_ERROR",
+    "99": "UNKNOWN_ERROR",
+}
+
+
+def default_item(n):
+    """n번째 item (PagedEnvelopeResponder의 기본 item_factory)"""
+    return {"seq": n, "name": f"item-{n}"}
+
+
+class PagedEnvelopeResponder:
+    """
+    공공데이터 API의 페이지 응답 봉투를 돌려주는 응답 함수
+
+    totalCount개의 item을 pageNo/numOfRows로 나눠 response/header/body 봉투에
+    담아 돌려줍니다. _type(또는 type, resultType) 파라미터가 json이면 JSON,
+    아니면 XML로 응답합니다. 지연 시간과 오류 응답을 주입할 수 있습니다.
+
+    오류 resultCode는 실제 서버처럼 두 가지 형식으로 응답합니다.
+    2x/3x(서비스 키, 호출 한도 등)는 API 게이트웨이가 돌려주는
+    OpenAPI_ServiceResponse XML로, 나머지는 요청한 형식의 봉투로 응답합니다.
+
+    Usage:
+        responder = PagedEnvelopeResponder(total_count=1234, latency=0.05)
+        with PublicDataApiStubServer(responder=responder) as server:
+            items = list(paginate(session, server.url("/getList"), verify=False))
+            print(responder.result_codes)
+    """
+
+    def __init__(
+        self,
+        total_count=100,
+        item_factory=default_item,
+        latency=0.0,
+        jitter=0.0,
+        errors=None,
+        error_rate=0.0,
+        error_codes=("99",),
+        seed=None,
+    ):
+        """
+        Args:
+            total_count (int): 전체 item 수 (totalCount)
+            item_factory (callable): 순번 n을 받아 item dict를 반환하는 함수
+            latency (float): 요청마다 응답 전에 기다릴 시간 (초)
+            jitter (float): latency에 더할 임의 시간의 최댓값 (초)
+            errors (dict | None): pageNo별 오류. resultCode 문자열이면 해당
+                오류 봉투로, int면 해당 HTTP 상태 코드로 응답
+            error_rate (float): errors에 없는 요청을 임의로 실패시킬 비율 (0~1)
+            error_codes (sequence): error_rate로 실패시킬 때 고를 resultCode
+                또는 HTTP 상태 코드 목록
+            seed (int | None): jitter와 error_rate에 쓸 난수 시드
+        """
+        self.total_count = total_count
+        self.item_factory = item_factory
+        self.latency = latency
+        self.jitter = jitter
+        self.errors = dict(errors or {})
+        self.error_rate = error_rate
+        self.error_codes = tuple(error_codes)
+        self.result_codes = collections.Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def __call__(self, method, path, query, body):
+        page_no = int(query.get("pageNo") or 1)
+        num_of_rows = int(query.get("numOfRows") or 10)
+        with self._lock:
+            delay = self.latency + self.jitter * self._random.random()
+            error = self.errors.get(page_no)
+            if error is None and self.error_rate and self._random.random() < self.error_rate:
+                error = self._random.choice(self.error_codes)
+            self.result_codes[error or "00"] += 1
+        if delay:
+            time.sleep(delay)
+
+        if isinstance(error, int):
+            return error, {"Content-Type": "text/plain"}, RESULT_MESSAGES["04"].encode()
+        if error and error[:1] in ("2", "3"):
+            return 200, {"Content-Type": "text/xml;charset=UTF-8"}, _gateway_error(error)
+
+        result_code = error or "00"
+        items = []
+        if result_code == "00":
+            start = (page_no - 1) * num_of_rows
+            end = min(start + num_of_rows, self.total_count)
+            items = [self.item_factory(n) for n in range(max(start, 0), end)]
+        envelope = {
+            "header": {
+                "resultCode": result_code,
+                "resultMsg": RESULT_MESSAGES.get(result_code, RESULT_MESSAGES["99"]),
+            },
+            "body": {
+                "items": {"item": items},
+                "numOfRows": num_of_rows,
+                "pageNo": page_no,
+                "totalCount": self.total_count,
+            },
+        }
+
+        response_type = query.get("_type") or query.get("type") or query.get("resultType")
+        if (response_type or "").lower() == "json":
+            content = json.dumps({"response": envelope}, ensure_ascii=False)
+            return 200, {"Content-Type": "application/json;charset=UTF-8"}, content.encode()
+        return 200, {"Content-Type": "text/xml;charset=UTF-8"}, _envelope_xml(envelope)
+
+
+def _gateway_error(result_code):
+    return (
+        "<OpenAPI_ServiceResponse><cmmMsgHeader>"
+        "<errMsg>SERVICE ERROR</errMsg>"
+        f"<returnAuthMsg>{RESULT_MESSAGES.get(result_code, '')}</returnAuthMsg>"
+        f"<returnReasonCode>{result_code}</returnReasonCode>"
+        "</cmmMsgHeader></OpenAPI_ServiceResponse>"
+    ).encode()
+
+
+def _xml_element(name, value):
+    if isinstance(value, dict):
+        inner = "".join(_xml_element(key, child) for key, child in value.items())
+    elif isinstance(value, list):
+        return "".join(_xml_element(name, child) for child in value)
+    else:
+        inner = escape(str(value))
+    return f"<{name}>{inner}</{name}>"
+
+
+def _envelope_xml(envelope):
+    content = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    return (content + _xml_element("response", envelope)).encode()
+
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 지원
+
+    def setup(self):
+        # idle_timeout 동안 다음 요청이 없으면 readline이 시간 초과되어 연결을 닫음 (FIN)
+        self.timeout = self.server.stub.idle_timeout
+        super().setup()
+        # 헤더와 본문을 따로 쓰므로 Nagle 알고리즘과 지연 ACK가 겹쳐 응답마다
+        # 수십 ms씩 늦어지지 않도록 함 (실제 서버와 같은 조건에서 측정)
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.idle_since = None
+
+    def parse_request(self):
+        stub = self.server.stub
+        if (
+            stub.keepalive_timeout is not None
+            and self.idle_since is not None
+            and time.monotonic() - self.idle_since > stub.keepalive_timeout
+        ):
+            # 로드밸런서처럼 오래 쉰 연결을 조용히 잊고, 다음 요청에 RST로 응답
+            self.connection.setsockopt(
+                socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0)
+            )
+            stub._count("dropped_connections")
+            self.close_connection = True
+            return False
+        return super().parse_request()
+
+    def do_GET(self):
+        self._respond()
+
+    def do_POST(self):
+        self._respond()
+
+    def _respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        url = urlsplit(self.path)
+        query = dict(parse_qsl(url.query, keep_blank_values=True))
+
+        status, headers, payload = self.server.stub.responder(
+            self.command, url.path, query, body
+        )
+        self.server.stub._count("requests")
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+        self.idle_since = time.monotonic()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _TLSHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def finish_request(self, request, client_address):
+        # 핸드셰이크를 accept 스레드가 아닌 요청 처리 스레드에서 수행
+        try:
+            tls_request = self.stub.ssl_context.wrap_socket(request, server_side=True)
+        except (ssl.SSLError, OSError):
+            self.stub._count("failed_handshakes")
+            return
+        self.stub._count(
+            "resumed_handshakes" if tls_request.session_reused else "full_handshakes"
+        )
+        try:
+            super().finish_request(tls_request, client_address)
+        finally:
+            tls_request.close()
+
+
+class PublicDataApiStubServer:
+    """
+    로컬 TLS 스텁 서버
+
+    백그라운드 스레드에서 HTTPS 서버를 실행하고, 핸드셰이크와 요청 수를
+    집계합니다. 응답은 responder 함수로 바꿀 수 있습니다.
+
+    Usage:
+        with PublicDataApiStubServer() as server:
+            session = create_public_data_api_session()
+            response = session.get(server.url("/endpoint"), verify=False)
+            print(server.stats())
+    """
+
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=0,
+        responder=None,
+        minimum_version=ssl.TLSVersion.TLSv1,
+        maximum_version=ssl.TLSVersion.TLSv1_2,
+        ciphers=":".join(LEGACY_CIPHERS),
+        certfile=STUB_CERTFILE,
+        keepalive_timeout=None,
+        dh_params=STUB_CERTFILE,
+        idle_timeout=None,
+    ):
+        """
+        Args:
+            host (str): 바인드할 주소
+            port (int): 바인드할 포트 (0이면 임의 포트)
+            responder (callable | None): (method, path, query, body)를 받아
+                (상태 코드, 헤더, 본문)을 반환하는 함수
+            minimum_version (ssl.TLSVersion): 허용할 최소 TLS 버전
+                (기본값은 공공데이터 API 서버처럼 TLS 1.0)
+            maximum_version (ssl.TLSVersion): 허용할 최대 TLS 버전
+            ciphers (str | None): 서버 cipher 문자열. 기본값은 SSL Labs에서
+                확인된 공공데이터 API 서버의 cipher 목록 (None이면 OpenSSL 기본값)
+            certfile (str): 개인키와 인증서가 함께 들어 있는 PEM 파일
+            keepalive_timeout (float | None): 응답 후 이보다 오래 (초) 쉰
+                연결에 요청이 오면 응답하지 않고 RST로 끊음
+                (keep-alive 연결을 조용히 끊는 로드밸런서 흉내)
+            dh_params (str | None): DHE cipher에 쓸 DH 파라미터 PEM 파일
+                (None이면 DHE cipher로 협상하지 않음)
+            idle_timeout (float | None): keep-alive 연결에 이 시간 (초) 동안
+                요청이 없으면 서버가 먼저 연결을 닫음 (None이면 닫지 않음)
+        """
+        self.responder = responder or normal_service_response
+        self.keepalive_timeout = keepalive_timeout
+        self.idle_timeout = idle_timeout
+
+        self.ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        self.ssl_context.minimum_version = minimum_version
+        self.ssl_context.maximum_version = maximum_version
+        if minimum_version < ssl.TLSVersion.TLSv1_2:
+            # OpenSSL 3의 기본 보안 수준(1)은 TLS 1.0/1.1 핸드셰이크를 거부함
+            ciphers = (ciphers or "DEFAULT") + ":@SECLEVEL=0"
+        if ciphers:
+            self.ssl_context.set_ciphers(ciphers)
+        self.ssl_context.load_cert_chain(certfile)
+        if dh_params is not None:
+            self.ssl_context.load_dh_params(dh_params)
+
+        self._counters_lock = threading.Lock()
+        self._counters = {}
+        self._httpd = _TLSHTTPServer((host, port), _StubRequestHandler)
+        self._httpd.stub = self
+        self._thread = None
+
+    @property
+    def address(self):
+        """(host, port) 튜플"""
+        return self._httpd.server_address[:2]
+
+    def url(self, path="/"):
+        """
+        스텁 서버의 URL 생성
+
+        Args:
+            path (str): 요청 경로 (쿼리 포함 가능)
+
+        Returns:
+            str: https://127.0.0.1:<port><path> 형태의 URL
+        """
+        host, port = self.address
+        return f"https://{host}:{port}{path}"
+
+    def start(self):
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="public-data-api-stub",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """서버 종료"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def stats(self):
+        """
+        집계된 카운터 반환
+
+        Returns:
+            dict: full_handshakes, resumed_handshakes, failed_handshakes,
+                requests, dropped_connections 카운터
+        """
+        with self._counters_lock:
+            stats = dict.fromkeys(
+                (
+                    "full_handshakes",
+                    "resumed_handshakes",
+                    "failed_handshakes",
+                    "requests",
+                    "dropped_connections",
+                ),
+                0,
+            )
+            stats.update(self._counters)
+            return stats
+
+    def _count(self, name):
+        with self._counters_lock:
+            self._counters[name] = self._counters.get(name, 0) + 1
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="공공데이터 API 로컬 TLS 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드할 주소")
+    parser.add_argument("--port", type=int, default=8443, help="바인드할 포트")
+    parser.add_argument("--total-count", type=int, default=100, help="전체 item 수")
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="추가 임의 지연 최댓값 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="오류 응답 비율 (0~1)")
+    parser.add_argument(
+        "--error-code", action="append", help="오류 응답 resultCode (여러 번 지정 가능, 기본값: 99)"
+    )
+    parser.add_argument("--idle-timeout", type=float, help="keep-alive 유휴 연결을 닫을 시간 (초)")
+    args = parser.parse_args(argv)
+
+    responder = PagedEnvelopeResponder(
+        total_count=args.total_count,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_codes=args.error_code or ("99",),
+    )
+    server = PublicDataApiStubServer(
+        host=args.host, port=args.port, responder=responder, idle_timeout=args.idle_timeout
+    )
+    with server:
+        print(f"스텁 서버 실행 중: {server.url()} (종료: Ctrl+C)")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+    print(dict(responder.result_codes))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
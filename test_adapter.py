@@ -7,11 +7,33 @@ Public Data API SSL Adapter - 테스트 스크립트
 """
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
+import socket
 import ssl
+import time
+import requests
+from urllib3.exceptions import EmptyPoolError
+from public_data_api_stub_server import PublicDataApiStubServer, normal_service_response
 from public_data_api_ssl_adapter import (
+    LEGACY_CIPHERS,
+    LEGACY_TLS_PROFILE,
+    MODERN_TLS_PROFILE,
+    HostProfile,
+    HostProfileRegistry,
+    PublicDataApiClient,
+    PublicDataApiSessionRegistry,
     PublicDataApiSSLAdapter,
+    RequestTimings,
+    TimingHistograms,
+    TLSConnectionInfo,
+    TLSStats,
+    build_cipher_string,
+    close_all,
     create_public_data_api_session,
+    get_public_data_api_ssl_context,
+    get_shared_session,
+    is_weak_tls,
     public_data_api_get,
     public_data_api_post,
 )
@@ -20,6 +42,13 @@ from public_data_api_ssl_adapter import (
 class TestPublicDataApiSSLAdapter(unittest.TestCase):
     """SSL 어댑터 테스트 클래스"""
 
+    def setUp(self):
+        # 편의 함수가 공유 세션을 캐시하므로 테스트마다 레지스트리를 비움
+        close_all()
+
+    def tearDown(self):
+        close_all()
+
     def test_adapter_initialization(self):
         """어댑터 초기화 테스트"""
         adapter = PublicDataApiSSLAdapter()
@@ -122,6 +151,709 @@ class TestPublicDataApiSSLAdapter(unittest.TestCase):
         self.assertIn("Safari", user_agent)
 
 
+class TestSSLContextFactory(unittest.TestCase):
+    """공유 SSL 컨텍스트 팩토리 테스트"""
+
+    def test_adapters_share_context(self):
+        """어댑터들이 같은 SSL 컨텍스트를 공유하는지 테스트"""
+        first = PublicDataApiSSLAdapter()
+        second = PublicDataApiSSLAdapter(pool_maxsize=4)
+        ctx = first.poolmanager.connection_pool_kw["ssl_context"]
+        self.assertIs(ctx, second.poolmanager.connection_pool_kw["ssl_context"])
+        self.assertIs(ctx, get_public_data_api_ssl_context())
+        self.assertIs(ctx, get_public_data_api_ssl_context(LEGACY_TLS_PROFILE))
+
+    def test_context_follows_profile(self):
+        """컨텍스트가 TLS 프로필 설정을 따르는지 테스트"""
+        ctx = get_public_data_api_ssl_context()
+        self.assertEqual(ctx.minimum_version, ssl.TLSVersion.TLSv1)
+        self.assertEqual(ctx.maximum_version, ssl.TLSVersion.TLSv1_2)
+        self.assertFalse(ctx.check_hostname)
+        self.assertEqual(ctx.verify_mode, ssl.CERT_NONE)
+        self.assertTrue(ctx.options & LEGACY_TLS_PROFILE.options)
+        cipher_names = [cipher["name"] for cipher in ctx.get_ciphers()]
+        self.assertIn("AES128-SHA", cipher_names)
+
+    def test_different_profile_gets_own_context(self):
+        """다른 프로필은 별도 컨텍스트를 받는지 테스트"""
+        verified = LEGACY_TLS_PROFILE._replace(
+            check_hostname=True, verify_mode=ssl.CERT_REQUIRED
+        )
+        ctx = get_public_data_api_ssl_context(verified)
+        self.assertIsNot(ctx, get_public_data_api_ssl_context())
+        self.assertTrue(ctx.check_hostname)
+        self.assertGreater(ctx.cert_store_stats()["x509_ca"], 0)
+
+        adapter = PublicDataApiSSLAdapter(tls_profile=verified)
+        self.assertIs(adapter.poolmanager.connection_pool_kw["ssl_context"], ctx)
+
+    def test_cipher_preference_order(self):
+        """빠른 suite를 먼저, 레거시 suite를 뒤에 제시하는지 테스트"""
+        names = [cipher["name"] for cipher in get_public_data_api_ssl_context().get_ciphers()]
+        tls12 = [name for name in names if not name.startswith("TLS_")]
+        self.assertEqual(tls12[0], "ECDHE-RSA-AES128-GCM-SHA256")
+        self.assertLess(tls12.index("AES256-GCM-SHA384"), tls12.index("AES128-SHA"))
+        self.assertEqual(tls12[-2:], ["DHE-RSA-AES128-SHA", "DHE-RSA-AES256-SHA"])
+        self.assertEqual(
+            build_cipher_string(preferred=()), ":".join(LEGACY_CIPHERS) + ":!aNULL:!eNULL"
+        )
+
+    def test_negotiates_ecdhe_gcm_when_offered(self):
+        """서버가 ECDHE-GCM을 지원하면 레거시 suite 대신 쓰는지 테스트"""
+        ciphers = "ECDHE-RSA-AES128-GCM-SHA256:" + ":".join(LEGACY_CIPHERS)
+        with PublicDataApiStubServer(ciphers=ciphers) as server:
+            ctx = get_public_data_api_ssl_context()
+            with socket.create_connection(server.address) as sock:
+                with ctx.wrap_socket(sock) as tls_sock:
+                    self.assertEqual(tls_sock.cipher()[0], "ECDHE-RSA-AES128-GCM-SHA256")
+
+    def test_verify_locations_loaded_once(self):
+        """같은 CA 번들은 한 번만 로드하는지 테스트"""
+        ctx = get_public_data_api_ssl_context()
+        ca_bundle = requests.certs.where()
+        ctx.load_verify_locations(ca_bundle)
+        with patch.object(ssl.SSLContext, "load_verify_locations") as mock_load:
+            ctx.load_verify_locations(ca_bundle)
+            mock_load.assert_not_called()
+
+    def test_verify_setting_selects_context(self):
+        """verify 설정별로 다른 공유 컨텍스트를 쓰는지 테스트"""
+        adapter = PublicDataApiSSLAdapter()
+        request = requests.Request("GET", "https://apis.data.go.kr/x").prepare()
+
+        _, verified = adapter.build_connection_pool_key_attributes(request, True)
+        _, unverified = adapter.build_connection_pool_key_attributes(request, False)
+
+        self.assertEqual(verified["ssl_context"].verify_mode, ssl.CERT_REQUIRED)
+        self.assertIs(unverified["ssl_context"], get_public_data_api_ssl_context())
+        self.assertEqual(unverified["ssl_context"].verify_mode, ssl.CERT_NONE)
+
+    def test_session_mounts_same_adapter(self):
+        """세션이 자기 자신의 어댑터를 마운트하는지 테스트"""
+        adapter = PublicDataApiSSLAdapter()
+        session = adapter.create_public_data_api_session()
+        self.assertIs(session.get_adapter("https://apis.data.go.kr/"), adapter)
+
+
+class TestTLSSessionResumption(unittest.TestCase):
+    """TLS 세션 재개 테스트 (로컬 스텁 서버 사용)"""
+
+    def setUp(self):
+        self.server = PublicDataApiStubServer().start()
+        get_public_data_api_ssl_context().clear_sessions()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_new_connections_resume_session(self):
+        """새 연결이 이전 연결의 세션을 재개하는지 테스트"""
+        adapter = PublicDataApiSSLAdapter()
+        session = adapter.create_public_data_api_session()
+        before = adapter.handshake_stats()
+
+        for _ in range(3):
+            response = session.get(self.server.url("/resume"), verify=False)
+            self.assertEqual(response.status_code, 200)
+            # 풀의 연결을 닫아 다음 요청이 새 연결을 열도록 함
+            adapter.poolmanager.clear()
+
+        after = adapter.handshake_stats()
+        self.assertEqual(after["full"] - before["full"], 1)
+        self.assertEqual(after["resumed"] - before["resumed"], 2)
+        self.assertEqual(self.server.stats()["resumed_handshakes"], 2)
+        session.close()
+
+    def test_sessions_shared_across_adapters(self):
+        """같은 프로필의 다른 어댑터도 세션을 재개하는지 테스트"""
+        for _ in range(2):
+            session = create_public_data_api_session()
+            response = session.get(self.server.url("/resume"), verify=False)
+            self.assertEqual(response.status_code, 200)
+            session.close()
+
+        stats = self.server.stats()
+        self.assertEqual(stats["full_handshakes"], 1)
+        self.assertEqual(stats["resumed_handshakes"], 1)
+
+
+class TestSessionRegistry(unittest.TestCase):
+    """공유 세션 레지스트리 테스트"""
+
+    def tearDown(self):
+        close_all()
+
+    def test_same_config_shares_session(self):
+        """같은 어댑터 설정은 같은 세션을 공유하는지 테스트"""
+        registry = PublicDataApiSessionRegistry()
+        first = registry.get_session()
+        second = registry.get_session()
+        self.assertIs(first, second)
+        self.assertEqual(len(registry), 1)
+        registry.close_all()
+
+    def test_different_config_gets_separate_session(self):
+        """다른 어댑터 설정은 별도 세션을 받는지 테스트"""
+        registry = PublicDataApiSessionRegistry()
+        default = registry.get_session()
+        larger_pool = registry.get_session(pool_maxsize=32)
+        self.assertIsNot(default, larger_pool)
+        self.assertIs(larger_pool, registry.get_session(pool_maxsize=32))
+        self.assertEqual(len(registry), 2)
+        registry.close_all()
+
+    def test_idle_sessions_are_evicted(self):
+        """유휴 세션 정리 테스트"""
+        registry = PublicDataApiSessionRegistry(idle_timeout=10)
+        with patch("public_data_api_ssl_adapter.time.monotonic", return_value=100.0):
+            session = registry.get_session()
+        with patch.object(session, "close") as mock_close:
+            with patch(
+                "public_data_api_ssl_adapter.time.monotonic", return_value=105.0
+            ):
+                self.assertEqual(registry.evict_idle(), 0)
+            with patch(
+                "public_data_api_ssl_adapter.time.monotonic", return_value=111.0
+            ):
+                self.assertEqual(registry.evict_idle(), 1)
+            mock_close.assert_called_once()
+        self.assertEqual(len(registry), 0)
+
+    def test_unhashable_adapter_kwargs(self):
+        """dict 같은 해시할 수 없는 어댑터 인자도 설정 키로 쓰는지 테스트"""
+        registry = PublicDataApiSessionRegistry()
+        profiles = {"apis.data.go.kr": HostProfile(pool_maxsize=4)}
+        first = registry.get_session(host_idle_timeouts={"apis.data.go.kr": 4})
+        self.assertIs(first, registry.get_session(host_idle_timeouts={"apis.data.go.kr": 4}))
+        self.assertIsNot(first, registry.get_session(host_idle_timeouts={"apis.data.go.kr": 5}))
+        self.assertIs(
+            registry.get_session(host_profiles=profiles),
+            registry.get_session(host_profiles=dict(profiles)),
+        )
+        self.assertEqual(len(registry), 3)
+        registry.close_all()
+
+    def test_checked_out_session_not_evicted(self):
+        """checkout() 중인 세션은 유휴 시간이 지나도 닫지 않는지 테스트"""
+        registry = PublicDataApiSessionRegistry(idle_timeout=10)
+        clock = "public_data_api_ssl_adapter.time.monotonic"
+        with patch(clock, return_value=100.0):
+            checkout = registry.checkout()
+            session = checkout.__enter__()
+        with patch.object(session, "close") as mock_close:
+            with patch(clock, return_value=200.0):
+                self.assertEqual(registry.evict_idle(), 0)
+                checkout.__exit__(None, None, None)
+            with patch(clock, return_value=205.0):
+                self.assertEqual(registry.evict_idle(), 0)
+            with patch(clock, return_value=211.0):
+                self.assertEqual(registry.evict_idle(), 1)
+            mock_close.assert_called_once()
+
+    def test_close_all_closes_sessions(self):
+        """close_all 테스트"""
+        registry = PublicDataApiSessionRegistry()
+        session = registry.get_session()
+        with patch.object(session, "close") as mock_close:
+            registry.close_all()
+            mock_close.assert_called_once()
+        self.assertEqual(len(registry), 0)
+        self.assertIsNot(session, registry.get_session())
+        registry.close_all()
+
+    def test_thread_sessions_share_adapter(self):
+        """스레드마다 다른 세션이 같은 어댑터를 공유하는지 테스트"""
+        registry = PublicDataApiSessionRegistry()
+        session = registry.get_session()
+        with ThreadPoolExecutor(1) as executor:
+            other = executor.submit(registry.get_session).result()
+        self.assertIsNot(other, session)
+        self.assertIs(other.get_adapter("https://"), session.get_adapter("https://"))
+        self.assertEqual(len(registry), 1)
+        registry.close_all()
+
+    def test_cookies_not_carried_between_calls(self):
+        """한 편의 함수 호출이 받은 쿠키를 다음 호출에 보내지 않는지 테스트"""
+        def set_cookie(*args):
+            status, headers, body = normal_service_response(*args)
+            return status, {**headers, "Set-Cookie": "JSESSIONID=abc; Path=/"}, body
+
+        with PublicDataApiStubServer(responder=set_cookie) as server:
+            first = public_data_api_get(server.url("/a"), verify=False)
+            second = public_data_api_get(server.url("/b"), verify=False)
+            explicit = public_data_api_get(
+                server.url("/c"), verify=False, cookies={"token": "x"}
+            )
+        self.assertEqual(first.cookies.get("JSESSIONID"), "abc")
+        self.assertNotIn("Cookie", second.request.headers)
+        self.assertEqual(len(get_shared_session().cookies), 0)
+        self.assertEqual(explicit.request.headers["Cookie"], "token=x")
+
+    @patch("public_data_api_ssl_adapter.create_public_data_api_session")
+    def test_convenience_functions_reuse_session(self, mock_create_session):
+        """GET/POST 편의 함수가 공유 세션을 재사용하는지 테스트"""
+        close_all()
+        mock_session = Mock()
+        mock_create_session.return_value = mock_session
+
+        public_data_api_get("https://example.com/a")
+        public_data_api_get("https://example.com/b")
+        public_data_api_post("https://example.com/c", data="x")
+
+        mock_create_session.assert_called_once_with()
+        self.assertEqual(mock_session.get.call_count, 2)
+        mock_session.post.assert_called_once_with("https://example.com/c", data="x")
+        self.assertIs(get_shared_session(), mock_session)
+
+
+def slow_response(*args):
+    """연결 풀이 부족해지도록 조금 늦게 응답하는 응답 함수"""
+    time.sleep(0.01)
+    return normal_service_response(*args)
+
+
+class TestPublicDataApiClient(unittest.TestCase):
+    """스레드 안전 클라이언트와 연결 풀 통계 테스트 (로컬 스텁 서버 사용)"""
+
+    def setUp(self):
+        self.server = PublicDataApiStubServer(responder=slow_response).start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def get_many(self, client, threads, requests_per_thread):
+        url = self.server.url("/getList")
+        with ThreadPoolExecutor(threads) as executor:
+            return list(
+                executor.map(
+                    lambda _: client.get(url, verify=False).status_code,
+                    range(threads * requests_per_thread),
+                )
+            )
+
+    def test_from_session(self):
+        """from_session()이 스레드마다 세션을 복사하고 어댑터는 닫지 않는지 테스트"""
+        with create_public_data_api_session() as session:
+            session.headers["X-Client"] = "test"
+            client = PublicDataApiClient.from_session(session)
+            with ThreadPoolExecutor(1) as executor:
+                other = executor.submit(lambda: client.session).result()
+            self.assertIsNot(other, client.session)
+            self.assertIsNot(client.session, session)
+            self.assertEqual(other.headers["X-Client"], "test")
+            self.assertIs(other.get_adapter("https://"), session.get_adapter("https://"))
+
+            client.close()
+            response = session.get(self.server.url("/getList"), verify=False)
+            self.assertEqual(response.status_code, 200)
+
+    def test_stress_blocking_pool(self):
+        """64개 스레드에서도 연결을 버리지 않고 풀 크기만큼만 여는지 테스트"""
+        with PublicDataApiClient(pool_maxsize=8) as client:
+            statuses = self.get_many(client, threads=64, requests_per_thread=5)
+            (stats,) = client.pool_stats().values()
+
+        self.assertEqual(statuses, [200] * 320)
+        self.assertEqual(stats["checkouts"], 320)
+        self.assertLessEqual(stats["created"], 8)
+        self.assertLessEqual(stats["max_in_use"], 8)
+        self.assertEqual(stats["discarded"], 0)
+        self.assertGreater(stats["saturated"], 0)
+        self.assertEqual(stats["in_use"], 0)
+        server_stats = self.server.stats()
+        self.assertEqual(server_stats["requests"], 320)
+        self.assertLessEqual(
+            server_stats["full_handshakes"] + server_stats["resumed_handshakes"], 8
+        )
+
+    def test_non_blocking_pool_discards(self):
+        """non-blocking 풀은 넘친 연결을 버리고 통계에 남기는지 테스트"""
+        with PublicDataApiClient(pool_maxsize=2, pool_block=False) as client:
+            self.get_many(client, threads=16, requests_per_thread=2)
+            (stats,) = client.pool_stats().values()
+        self.assertGreater(stats["created"], 2)
+        self.assertGreater(stats["discarded"], 0)
+
+    def test_pool_timeout(self):
+        """반납을 pool_timeout까지만 기다리는지 테스트"""
+        def slower_response(*args):
+            time.sleep(0.3)
+            return normal_service_response(*args)
+
+        self.server.responder = slower_response
+        with PublicDataApiClient(pool_maxsize=1, pool_timeout=0.05) as client:
+            with ThreadPoolExecutor(2) as executor:
+                futures = [
+                    executor.submit(client.get, self.server.url("/"), verify=False)
+                    for _ in range(2)
+                ]
+                errors = [future.exception() for future in futures]
+            (stats,) = client.pool_stats().values()
+        self.assertEqual(sum(isinstance(e, EmptyPoolError) for e in errors), 1)
+        self.assertEqual(stats["pool_timeouts"], 1)
+
+    def test_prewarm(self):
+        """미리 연 연결을 이후 요청이 새 핸드셰이크 없이 쓰는지 테스트"""
+        get_public_data_api_ssl_context().clear_sessions()
+        host = f"127.0.0.1:{self.server.address[1]}"
+        with PublicDataApiClient(pool_maxsize=4) as client:
+            result = client.prewarm(host, 8, verify=False)
+            self.assertEqual(result.pool, f"https://{host}")
+            self.assertEqual((result.requested, result.connected, result.failed), (4, 4, 0))
+            server_stats = self.server.stats()
+            self.assertEqual(server_stats["full_handshakes"], 1)
+            self.assertEqual(server_stats["resumed_handshakes"], 3)
+
+            self.get_many(client, threads=4, requests_per_thread=2)
+            (stats,) = client.pool_stats().values()
+            self.assertEqual(stats["created"], 4)
+            self.assertEqual(
+                self.server.stats()["full_handshakes"] + self.server.stats()["resumed_handshakes"], 4
+            )
+            self.assertEqual(client.prewarm(host, 4, verify=False).already_connected, 4)
+
+    def test_prewarm_skips_checked_out(self):
+        """사용 중인 연결은 기다리지 않고 건너뛰며 사용 통계를 바꾸지 않는지 테스트"""
+        host = f"127.0.0.1:{self.server.address[1]}"
+        with PublicDataApiClient(pool_maxsize=2) as client:
+            response = client.get(self.server.url("/"), verify=False, stream=True)
+            before = next(iter(client.pool_stats().values()))
+            with ThreadPoolExecutor(1) as executor:
+                result = executor.submit(client.prewarm, host, 2, verify=False).result(timeout=5)
+            after = next(iter(client.pool_stats().values()))
+            response.close()
+        self.assertEqual(result.requested, 2)
+        self.assertEqual((result.connected, result.already_connected, result.failed), (1, 0, 0))
+        for key in ("checkouts", "saturated", "wait_seconds", "in_use"):
+            self.assertEqual(after[key], before[key], key)
+
+    def test_prewarm_non_blocking_pool_full(self):
+        """non-blocking 풀의 연결이 모두 사용 중이면 풀 크기를 넘는 연결을 열지 않는지 테스트"""
+        host = f"127.0.0.1:{self.server.address[1]}"
+        with PublicDataApiClient(pool_maxsize=2, pool_block=False) as client:
+            responses = [
+                client.get(self.server.url("/"), verify=False, stream=True) for _ in range(2)
+            ]
+            result = client.prewarm(host, 2, verify=False)
+            (stats,) = client.pool_stats().values()
+            for response in responses:
+                response.close()
+        self.assertEqual((result.connected, result.already_connected, result.failed), (0, 0, 0))
+        self.assertEqual(stats["created"], 2)
+        self.assertEqual(stats["discarded"], 0)
+
+    def test_prewarm_failure(self):
+        """연결할 수 없는 호스트는 실패 수로 알리는지 테스트"""
+        self.server.stop()
+        with PublicDataApiClient() as client:
+            result = client.prewarm(f"https://127.0.0.1:{self.server.address[1]}", 2, timeout=1)
+        self.assertEqual((result.connected, result.failed), (0, 2))
+
+    def test_stale_connection_failure(self):
+        """서버가 조용히 끊은 연결을 재사용하면 실패로 세는지 테스트"""
+        self.server.keepalive_timeout = 0.05
+        url = self.server.url("/")
+        with PublicDataApiClient() as client:
+            client.get(url, verify=False)
+            time.sleep(0.15)
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                client.get(url, verify=False)
+            (stats,) = client.pool_stats().values()
+        self.assertEqual(stats["stale_failures"], 1)
+        self.assertEqual(self.server.stats()["dropped_connections"], 1)
+
+    def test_idle_timeout_discards_connection(self):
+        """idle_timeout보다 오래 쉰 연결은 보내기 전에 다시 여는지 테스트"""
+        self.server.keepalive_timeout = 0.05
+        url = self.server.url("/")
+        with PublicDataApiClient(idle_timeout=0.02) as client:
+            client.get(url, verify=False)
+            time.sleep(0.15)
+            self.assertEqual(client.get(url, verify=False).status_code, 200)
+            (stats,) = client.pool_stats().values()
+        self.assertEqual(stats["idle_discards"], 1)
+        self.assertEqual(stats["stale_failures"], 0)
+        self.assertEqual(self.server.stats()["dropped_connections"], 0)
+
+    def test_host_idle_timeouts(self):
+        """호스트별 idle_timeout이 해당 호스트의 풀에만 적용되는지 테스트"""
+        adapter = PublicDataApiSSLAdapter(
+            idle_timeout=30, host_idle_timeouts={"APIS.data.go.kr": 4}
+        )
+        manager = adapter.poolmanager
+        self.assertEqual(manager.connection_from_url("https://apis.data.go.kr/").idle_timeout, 4)
+        self.assertEqual(manager.connection_from_url("https://example.com/").idle_timeout, 30)
+        adapter.close()
+
+    def test_idle_refresh(self):
+        """백그라운드 스레드가 오래 쉰 연결을 미리 다시 여는지 테스트"""
+        self.server.keepalive_timeout = 0.1
+        url = self.server.url("/")
+        with PublicDataApiClient(idle_timeout=0.04, idle_refresh=True) as client:
+            client.get(url, verify=False)
+            time.sleep(0.3)
+            self.assertEqual(client.get(url, verify=False).status_code, 200)
+            (stats,) = client.pool_stats().values()
+            refresher = client.adapter.poolmanager._refresher
+        self.assertGreaterEqual(stats["refreshed"], 2)
+        self.assertEqual(stats["stale_failures"], 0)
+        self.assertEqual(self.server.stats()["dropped_connections"], 0)
+        # close()가 백그라운드 스레드를 멈춤
+        self.assertFalse(refresher.is_alive())
+
+    def test_idle_refresh_without_idle_pools(self):
+        """idle_timeout이 있는 풀이 모두 밀려나도 백그라운드 스레드가 멈추지 않는지 테스트"""
+        adapter = PublicDataApiSSLAdapter(
+            pool_connections=1, host_idle_timeouts={"apis.data.go.kr": 0.02}, idle_refresh=True
+        )
+        manager = adapter.poolmanager
+        manager.connection_from_url("https://apis.data.go.kr/")
+        manager.connection_from_url("https://example.com/")  # 앞의 풀을 밀어냄
+        time.sleep(0.1)
+        refresher = manager._refresher
+        self.assertTrue(refresher.is_alive())
+        adapter.close()
+        refresher.join(1)
+        self.assertFalse(refresher.is_alive())
+
+    def test_sessions_are_per_thread(self):
+        """스레드마다 다른 세션이 같은 어댑터를 공유하는지 테스트"""
+        with PublicDataApiClient() as client:
+            main_session = client.session
+            with ThreadPoolExecutor(1) as executor:
+                other_session = executor.submit(lambda: client.session).result()
+            self.assertIsNot(main_session, other_session)
+            self.assertIs(main_session.get_adapter("https://x"), client.adapter)
+            self.assertIs(other_session.get_adapter("https://x"), client.adapter)
+        with self.assertRaises(RuntimeError):
+            client.get(self.server.url("/"))
+
+
+class TestHostProfiles(unittest.TestCase):
+    """호스트별 연결 설정 테스트 (TLS 1.3만 지원하는 로컬 스텁 서버 사용)"""
+
+    def setUp(self):
+        self.server = PublicDataApiStubServer(
+            minimum_version=ssl.TLSVersion.TLSv1_3,
+            maximum_version=ssl.TLSVersion.TLSv1_3,
+            ciphers=None,
+        ).start()
+        self.port = self.server.address[1]
+        self.profiles = HostProfileRegistry(
+            {"localhost": HostProfile(tls_profile=MODERN_TLS_PROFILE, pool_maxsize=2)}
+        )
+        self.session = create_public_data_api_session(host_profiles=self.profiles)
+        self.adapter = self.session.get_adapter("https://")
+
+    def tearDown(self):
+        self.session.close()
+        self.server.stop()
+
+    def test_lookup(self):
+        """정확한 호스트와 와일드카드 우선순위 테스트"""
+        profiles = HostProfileRegistry()
+        profiles.register("*.go.kr", pool_maxsize=4)
+        profiles.register("*.molit.go.kr", pool_maxsize=8)
+        profiles.register("APIS.data.go.kr", timeout=3)
+        self.assertEqual(profiles.lookup("apis.data.go.kr"), HostProfile(timeout=3))
+        self.assertEqual(profiles.lookup("openapi.molit.go.kr").pool_maxsize, 8)
+        self.assertEqual(profiles.lookup("www.data.go.kr").pool_maxsize, 4)
+        self.assertIsNone(profiles.lookup("api.odcloud.kr"))
+
+    def test_routes_tls_profile_by_host(self):
+        """등록된 호스트만 최신 TLS 프로필로 연결하는지 테스트"""
+        response = self.session.get(f"https://localhost:{self.port}/", verify=False)
+        self.assertEqual(response.status_code, 200)
+        # 등록되지 않은 호스트는 구형 프로필 (TLS 1.2까지)
+        with self.assertRaises(requests.exceptions.SSLError):
+            self.session.get(f"https://127.0.0.1:{self.port}/", verify=False)
+
+    def test_tls13_session_resumption(self):
+        """TLS 1.3 연결도 반납 후 세션을 재개하는지 테스트"""
+        get_public_data_api_ssl_context(MODERN_TLS_PROFILE._replace(
+            check_hostname=False, verify_mode=ssl.CERT_NONE
+        )).clear_sessions()
+        self.session.get(f"https://localhost:{self.port}/", verify=False)
+        before = self.adapter.handshake_stats()
+        result = self.adapter.prewarm(f"localhost:{self.port}", 2, verify=False)
+        self.assertEqual(result.connected, 1)
+        # 스텁 서버의 카운터는 서버 스레드가 늦게 올릴 수 있으므로 클라이언트 쪽 통계로 확인
+        self.assertEqual(self.adapter.handshake_stats()["resumed"] - before["resumed"], 1)
+
+    def test_pool_size_and_timeout(self):
+        """호스트별 풀 크기와 기본 제한 시간 테스트"""
+        result = self.adapter.prewarm(f"localhost:{self.port}", 8, verify=False)
+        self.assertEqual(result.requested, 2)
+
+        def slow(*args):
+            time.sleep(0.3)
+            return normal_service_response(*args)
+
+        self.server.responder = slow
+        self.profiles.register("localhost", self.profiles.lookup("localhost"), timeout=0.05)
+        with self.assertRaises(requests.exceptions.ReadTimeout):
+            self.session.get(f"https://localhost:{self.port}/", verify=False)
+        # 요청에 timeout을 주면 그 값을 따름
+        response = self.session.get(f"https://localhost:{self.port}/", verify=False, timeout=5)
+        self.assertEqual(response.status_code, 200)
+
+
+class TestRequestTimings(unittest.TestCase):
+    """단계별 소요 시간 기록 테스트"""
+
+    def setUp(self):
+        def slow(*args):
+            time.sleep(0.05)
+            return normal_service_response(*args)
+
+        self.server = PublicDataApiStubServer(responder=slow).start()
+        self.url = f"https://localhost:{self.server.address[1]}/"
+        self.session = create_public_data_api_session(record_timings=True)
+        self.adapter = self.session.get_adapter("https://")
+
+    def tearDown(self):
+        self.session.close()
+        self.server.stop()
+
+    def test_phases(self):
+        """새 연결은 모든 단계를, 재사용한 연결은 ttfb와 body만 기록하는지 테스트"""
+        first = self.session.get(self.url, verify=False).timings
+        self.assertFalse(first.reused)
+        for phase in RequestTimings.PHASES:
+            self.assertGreaterEqual(getattr(first, phase), 0, phase)
+        self.assertGreaterEqual(first.ttfb, 0.05)
+        self.assertLess(first.tls, first.ttfb)
+
+        second = self.session.get(self.url, verify=False).timings
+        self.assertTrue(second.reused)
+        self.assertIsNone(second.tls)
+        self.assertGreaterEqual(second.ttfb, 0.05)
+        self.assertAlmostEqual(second.total, second.ttfb + second.body)
+
+    def test_single_name_lookup(self):
+        """새 연결의 호스트 이름을 한 번만 조회하는지 테스트"""
+        with patch("socket.getaddrinfo", wraps=socket.getaddrinfo) as getaddrinfo:
+            timings = self.session.get(self.url, verify=False).timings
+        hosts = [call.args[0] for call in getaddrinfo.call_args_list]
+        self.assertEqual(hosts.count("localhost"), 1)
+        self.assertGreaterEqual(timings.dns, 0)
+
+    def test_name_resolution_error(self):
+        """이름 조회 실패가 urllib3와 같은 예외로 바뀌는지 테스트"""
+        error = socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        with patch("socket.getaddrinfo", side_effect=error) as getaddrinfo:
+            with self.assertRaises(requests.ConnectionError) as raised:
+                self.session.get(self.url, verify=False)
+        self.assertIn("NameResolutionError", str(raised.exception))
+        self.assertEqual(getaddrinfo.call_count, 1)
+
+    def test_streamed_body(self):
+        """stream=True 응답은 본문을 읽은 뒤 body가 채워지는지 테스트"""
+        response = self.session.get(self.url, verify=False, stream=True)
+        self.assertIsNone(response.timings.body)
+        response.content
+        self.assertIsNotNone(response.timings.body)
+
+    def test_timing_stats(self):
+        """호스트별 히스토그램에 누적되는지 테스트"""
+        for _ in range(3):
+            self.session.get(self.url, verify=False)
+        stats = self.adapter.timing_stats()[f"https://localhost:{self.server.address[1]}"]
+        self.assertEqual(stats["tls"]["count"], 1)
+        self.assertEqual(stats["ttfb"]["count"], 3)
+        self.assertEqual(stats["total"]["count"], 3)
+        self.assertGreater(stats["ttfb"]["p50"], 0.025)
+
+    def test_disabled(self):
+        """기본값은 기록하지 않는지 테스트"""
+        with create_public_data_api_session() as session:
+            self.assertIsNone(session.get(self.url, verify=False).timings)
+            self.assertEqual(session.get_adapter("https://").timing_stats(), {})
+
+    def test_histogram_quantiles(self):
+        """구간 누적 수와 분위수 추정 테스트"""
+        histograms = TimingHistograms(buckets=(0.01, 0.1, 1.0))
+        for ttfb in (0.005, 0.05, 0.05, 0.5, 5.0):
+            timings = RequestTimings(True)
+            timings.ttfb = ttfb
+            histograms.record(timings, ["ttfb", "dns"])
+        other = TimingHistograms(buckets=(0.01, 0.1, 1.0))
+        other.merge(histograms)
+        ttfb = other.snapshot()["ttfb"]
+        self.assertEqual(ttfb["buckets"], [(0.01, 1), (0.1, 3), (1.0, 4), (float("inf"), 5)])
+        self.assertEqual(ttfb["count"], 5)
+        self.assertAlmostEqual(ttfb["p50"], 0.01 + 0.09 * 1.5 / 2)
+        self.assertEqual(ttfb["p99"], 1.0)
+        self.assertEqual(other.snapshot()["dns"]["count"], 0)
+
+
+class TestTLSStats(unittest.TestCase):
+    """협상된 TLS 버전/cipher suite 통계 테스트"""
+
+    def request(self, server, count):
+        with create_public_data_api_session() as session:
+            for _ in range(count):
+                session.get(server.url("/"), verify=False)
+            adapter = session.get_adapter("https://")
+            return adapter.tls_stats(), adapter.tls_stats(per_pool=True)
+
+    def test_negotiated_suite(self):
+        """연결 수와 비율이 (버전, cipher)별로 기록되는지 테스트"""
+        with PublicDataApiStubServer() as server:
+            stats, per_pool = self.request(server, 3)
+        self.assertEqual(len(stats), 1)
+        (version, cipher), entry = next(iter(stats.items()))
+        self.assertEqual(version, "TLSv1.2")
+        self.assertEqual(entry["connections"], 1)  # keep-alive 연결은 한 번만 기록
+        self.assertEqual(entry["share"], 1.0)
+        self.assertEqual(entry["bits"], 256 if "AES256" in cipher else 128)
+        self.assertFalse(entry["weak"])
+        self.assertGreater(entry["handshake_seconds"], 0)
+        self.assertEqual(entry["max_handshake_seconds"], entry["handshake_seconds"])
+        self.assertEqual(per_pool, {f"https://127.0.0.1:{server.address[1]}": stats})
+
+    def test_legacy_server(self):
+        """TLS 1.0만 지원하는 서버와의 연결이 약한 suite로 집계되는지 테스트"""
+        with PublicDataApiStubServer(
+            maximum_version=ssl.TLSVersion.TLSv1, ciphers="AES128-SHA"
+        ) as server:
+            stats, _ = self.request(server, 2)
+        self.assertEqual(list(stats), [("TLSv1", "AES128-SHA")])
+        self.assertTrue(stats["TLSv1", "AES128-SHA"]["weak"])
+        self.assertEqual(stats["TLSv1", "AES128-SHA"]["connections"], 1)
+
+    def test_merge_and_share(self):
+        """여러 suite의 연결 비율과 병합 테스트"""
+        stats = TLSStats()
+        modern = TLSConnectionInfo("TLSv1.2", "ECDHE-RSA-AES128-GCM-SHA256", 128, False, 0.02)
+        legacy = TLSConnectionInfo("TLSv1", "DES-CBC3-SHA", 112, True, 0.05)
+        for _ in range(3):
+            stats.record(modern)
+        stats.record(legacy)
+        merged = TLSStats()
+        merged.merge(stats)
+        merged.merge(stats)
+        snapshot = merged.snapshot()
+        self.assertEqual(snapshot["TLSv1", "DES-CBC3-SHA"]["share"], 0.25)
+        self.assertEqual(snapshot["TLSv1", "DES-CBC3-SHA"]["bits"], 112)
+        self.assertEqual(snapshot["TLSv1", "DES-CBC3-SHA"]["resumed"], 2)
+        self.assertTrue(snapshot["TLSv1", "DES-CBC3-SHA"]["weak"])
+        modern_entry = snapshot["TLSv1.2", "ECDHE-RSA-AES128-GCM-SHA256"]
+        self.assertEqual(modern_entry["connections"], 6)
+        self.assertAlmostEqual(modern_entry["handshake_seconds"], 0.12)
+        self.assertEqual(modern_entry["max_handshake_seconds"], 0.02)
+        buckets = dict(snapshot["TLSv1", "DES-CBC3-SHA"]["handshake_buckets"])
+        self.assertEqual(buckets[0.025], 0)
+        self.assertEqual(buckets[0.05], 2)
+        self.assertEqual(buckets[float("inf")], 2)
+
+    def test_is_weak_tls(self):
+        """약한 프로토콜/cipher 판별 테스트"""
+        self.assertTrue(is_weak_tls("TLSv1.1", "ECDHE-RSA-AES128-SHA"))
+        self.assertTrue(is_weak_tls("TLSv1.2", "DES-CBC3-SHA"))
+        self.assertFalse(is_weak_tls("TLSv1.2", "AES128-GCM-SHA256"))
+        self.assertFalse(is_weak_tls("TLSv1.3", "TLS_AES_256_GCM_SHA384"))
+
+
 class TestSSLConfiguration(unittest.TestCase):
     """SSL 설정 테스트"""
 
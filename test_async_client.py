@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Public Data API Async Client - 테스트 스크립트
+
+로컬 TLS 스텁 서버를 대상으로 asyncio 클라이언트의 핸드셰이크,
+keep-alive 재사용, 동시 연결 제한, 제한 시간을 확인합니다.
+"""
+
+import asyncio
+import gzip
+import json
+import ssl
+import time
+import unittest
+
+from public_data_api_async import AsyncPublicDataApiClient, _read_response
+from public_data_api_cache import SingleFlight
+from public_data_api_stub_server import (
+    STUB_CERTFILE,
+    PublicDataApiStubServer,
+    normal_service_response,
+)
+
+
+def echo_response(method, path, query, body):
+    """요청 내용을 그대로 돌려주는 응답 함수"""
+    payload = {"method": method, "path": path, "query": query, "body": body.decode()}
+    return 200, {"Content-Type": "application/json"}, json.dumps(payload).encode()
+
+
+class TestAsyncPublicDataApiClient(unittest.IsolatedAsyncioTestCase):
+    """asyncio 클라이언트 테스트 클래스"""
+
+    def setUp(self):
+        self.server = PublicDataApiStubServer(responder=echo_response).start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    async def test_get_with_params(self):
+        """GET 요청과 쿼리 파라미터 테스트"""
+        async with AsyncPublicDataApiClient(verify=False) as client:
+            response = await client.get(
+                self.server.url("/getList?type=json"), params={"pageNo": 2}
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.ok)
+        data = response.json()
+        self.assertEqual(data["path"], "/getList")
+        self.assertEqual(data["query"], {"type": "json", "pageNo": "2"})
+
+    async def test_post_json(self):
+        """POST JSON 본문 테스트"""
+        async with AsyncPublicDataApiClient(verify=False) as client:
+            response = await client.post(self.server.url("/post"), json={"key": "값"})
+        data = response.json()
+        self.assertEqual(data["method"], "POST")
+        self.assertEqual(json.loads(data["body"]), {"key": "값"})
+
+    async def test_keep_alive_reuses_connection(self):
+        """순차 요청이 하나의 연결을 재사용하는지 테스트"""
+        async with AsyncPublicDataApiClient(verify=False) as client:
+            for _ in range(5):
+                response = await client.get(self.server.url("/"))
+                self.assertEqual(response.status_code, 200)
+
+        stats = self.server.stats()
+        self.assertEqual(stats["requests"], 5)
+        self.assertEqual(stats["full_handshakes"] + stats["resumed_handshakes"], 1)
+
+    async def test_limit_per_host(self):
+        """호스트별 동시 연결 제한 테스트"""
+        async with AsyncPublicDataApiClient(verify=False, limit_per_host=2) as client:
+            responses = await asyncio.gather(
+                *(client.get(self.server.url("/")) for _ in range(10))
+            )
+
+        self.assertTrue(all(r.status_code == 200 for r in responses))
+        stats = self.server.stats()
+        self.assertEqual(stats["requests"], 10)
+        self.assertLessEqual(stats["full_handshakes"] + stats["resumed_handshakes"], 2)
+
+    async def test_single_flight(self):
+        """동시에 보낸 같은 GET 요청이 하나로 합쳐지는지 테스트"""
+
+        def slow_response(*args):
+            time.sleep(0.2)
+            return echo_response(*args)
+
+        self.server.responder = slow_response
+        single_flight = SingleFlight()
+        async with AsyncPublicDataApiClient(
+            verify=False, single_flight=single_flight
+        ) as client:
+            responses = await asyncio.gather(
+                *(client.get(self.server.url("/"), params={"pageNo": 1}) for _ in range(5))
+            )
+
+        self.assertTrue(all(r is responses[0] for r in responses))
+        self.assertEqual(self.server.stats()["requests"], 1)
+        self.assertEqual(single_flight.stats()["coalesced"], 4)
+
+    async def test_timeout(self):
+        """제한 시간 초과 테스트"""
+
+        def slow_response(*args):
+            time.sleep(0.5)
+            return normal_service_response(*args)
+
+        self.server.responder = slow_response
+        async with AsyncPublicDataApiClient(verify=False, timeout=0.1) as client:
+            with self.assertRaises(asyncio.TimeoutError):
+                await client.get(self.server.url("/slow"))
+
+    async def test_verify_with_ca_bundle(self):
+        """CA 번들로 자체 서명 인증서를 검증하는 테스트"""
+        async with AsyncPublicDataApiClient(verify=STUB_CERTFILE) as client:
+            response = await client.get(self.server.url("/"))
+        self.assertEqual(response.status_code, 200)
+
+    async def test_verify_rejects_unknown_certificate(self):
+        """기본 검증이 자체 서명 인증서를 거부하는지 테스트"""
+        async with AsyncPublicDataApiClient() as client:
+            with self.assertRaises(ssl.SSLCertVerificationError):
+                await client.get(self.server.url("/"))
+
+    async def test_closed_client_rejects_requests(self):
+        """닫힌 클라이언트 사용 테스트"""
+        client = AsyncPublicDataApiClient(verify=False)
+        await client.close()
+        with self.assertRaises(RuntimeError):
+            await client.get(self.server.url("/"))
+
+
+class TestStaleConnectionRetry(unittest.IsolatedAsyncioTestCase):
+    """재사용한 keep-alive 연결이 끊겼을 때의 재시도 테스트"""
+
+    async def asyncSetUp(self):
+        self.requests = []
+        self.drop = None
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        self.url = "http://127.0.0.1:%d/" % self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        """연결의 두 번째 요청에서 self.drop 방식으로 끊는 HTTP 서버"""
+        served = 0
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    name, _, value = line.partition(b":")
+                    if name.lower() == b"content-length":
+                        length = int(value)
+                await reader.readexactly(length)
+                self.requests.append(head.split(b" ", 1)[0].decode())
+                served += 1
+                if served == 2 and self.drop == "before_status":
+                    break
+                if served == 2 and self.drop == "mid_body":
+                    writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\nok")
+                    await writer.drain()
+                    break
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            pass
+        finally:
+            writer.close()
+
+    async def test_retry_when_closed_before_status(self):
+        """상태 줄 전에 끊긴 연결은 POST도 새 연결로 재시도하는지 테스트"""
+        self.drop = "before_status"
+        async with AsyncPublicDataApiClient() as client:
+            await client.post(self.url, data="a")
+            response = await client.post(self.url, data="b")
+        self.assertEqual(response.content, b"ok")
+        self.assertEqual(self.requests, ["POST", "POST", "POST"])
+
+    async def test_no_post_retry_after_partial_response(self):
+        """응답 일부를 받은 뒤 끊긴 POST는 다시 보내지 않는지 테스트"""
+        self.drop = "mid_body"
+        async with AsyncPublicDataApiClient() as client:
+            await client.post(self.url, data="a")
+            with self.assertRaises(asyncio.IncompleteReadError):
+                await client.post(self.url, data="b")
+        self.assertEqual(self.requests, ["POST", "POST"])
+
+    async def test_get_retry_after_partial_response(self):
+        """응답 일부를 받은 뒤 끊긴 GET은 새 연결로 재시도하는지 테스트"""
+        self.drop = "mid_body"
+        async with AsyncPublicDataApiClient() as client:
+            await client.get(self.url)
+            response = await client.get(self.url)
+        self.assertEqual(response.content, b"ok")
+        self.assertEqual(self.requests, ["GET", "GET", "GET"])
+
+
+class TestResponseParsing(unittest.IsolatedAsyncioTestCase):
+    """HTTP 응답 파싱 테스트"""
+
+    async def parse(self, raw, method="GET"):
+        reader = asyncio.StreamReader()
+        reader.feed_data(raw)
+        reader.feed_eof()
+        return await _read_response(reader, method, "https://example.com/")
+
+    async def test_chunked_gzip(self):
+        """chunked + gzip 본문 해제 테스트"""
+        body = gzip.compress("<response>정상</response>".encode())
+        raw = (
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: text/xml;charset=UTF-8\r\n"
+            b"Content-Encoding: gzip\r\n"
+            b"Transfer-Encoding: chunked\r\n\r\n"
+            + f"{len(body[:10]):x}\r\n".encode() + body[:10] + b"\r\n"
+            + f"{len(body[10:]):x}\r\n".encode() + body[10:] + b"\r\n"
+            + b"0\r\n\r\n"
+        )
+        response, reusable = await self.parse(raw)
+        self.assertTrue(reusable)
+        self.assertEqual(response.text, "<response>정상</response>")
+
+    async def test_connection_close(self):
+        """Connection: close 응답은 재사용하지 않는지 테스트"""
+        raw = b"HTTP/1.1 200 OK\r\nConnection: close\r\nContent-Length: 2\r\n\r\nok"
+        response, reusable = await self.parse(raw)
+        self.assertFalse(reusable)
+        self.assertEqual(response.content, b"ok")
+
+    async def test_body_until_eof(self):
+        """길이 정보 없는 본문 테스트"""
+        raw = b"HTTP/1.0 200 OK\r\n\r\nrest of body"
+        response, reusable = await self.parse(raw)
+        self.assertFalse(reusable)
+        self.assertEqual(response.content, b"rest of body")
+
+    async def test_malformed_status_line(self):
+        """잘못된 상태 줄 테스트"""
+        with self.assertRaises(ConnectionError):
+            await self.parse(b"garbage\r\n\r\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
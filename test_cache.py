@@ -0,0 +1,571 @@
+#!/usr/bin/env python3
+"""
+Public Data API Response Cache - 테스트 스크립트
+
+캐시 키 정규화, TTL, LRU 제거, 오류 봉투 제외, 디스크 계층, 조건부 재검증,
+stale-while-revalidate, stale-if-error, 동시 요청 합치기, 세션 통합을 확인합니다.
+"""
+
+import asyncio
+import json
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from public_data_api_cache import (
+    CacheEntry,
+    ResponseCache,
+    SingleFlight,
+    SQLiteCacheStore,
+    cache_key,
+)
+from public_data_api_response import RESULT_FATAL, classify_response
+from public_data_api_ssl_adapter import create_public_data_api_session
+from public_data_api_stub_server import PublicDataApiStubServer, normal_service_response
+
+URL = "https://apis.data.go.kr/1741000/StanReginCd/getStanReginCdList"
+
+
+def envelope(result_code="00", items=()):
+    """resultCode와 item 목록으로 JSON 응답 봉투 생성"""
+    return json.dumps(
+        {
+            "response": {
+                "header": {"resultCode": result_code, "resultMsg": "MSG"},
+                "body": {"items": {"item": list(items)}, "totalCount": len(items)},
+            }
+        }
+    ).encode()
+
+
+def make_response(content, status_code=200):
+    """본문만 채운 requests.Response 생성"""
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = "OK"
+    response.headers["Content-Type"] = "application/json;charset=UTF-8"
+    response.headers["ETag"] = '"v1"'
+    response.headers["Content-Length"] = str(len(content))
+    response._content = content
+    response._content_consumed = True
+    return response
+
+
+def prepare(url, params=None, method="GET", headers=None):
+    """PreparedRequest 생성"""
+    return requests.Request(method, url, params=params, headers=headers).prepare()
+
+
+class FakeClock:
+    """수동으로 흐르는 가짜 시계"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestCacheKey(unittest.TestCase):
+    """캐시 키 정규화 테스트 클래스"""
+
+    def test_params_sorted_and_service_key_removed(self):
+        """파라미터 순서와 서비스키가 달라도 같은 키인지 테스트"""
+        first = cache_key("GET", f"{URL}?pageNo=1&serviceKey=A&numOfRows=10")
+        second = cache_key("get", f"{URL}?numOfRows=10&ServiceKey=B&pageNo=1")
+        self.assertEqual(first, second)
+        self.assertNotIn("A", first.split("?")[1])
+
+    def test_different_params_differ(self):
+        """다른 파라미터는 다른 키인지 테스트"""
+        self.assertNotEqual(
+            cache_key("GET", f"{URL}?pageNo=1"), cache_key("GET", f"{URL}?pageNo=2")
+        )
+
+
+class TestResponseCache(unittest.TestCase):
+    """응답 캐시 계층 테스트 클래스"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.calls = []
+        self.responses = []
+
+    def next_send(self, request, **kwargs):
+        self.calls.append(request)
+        if self.responses:
+            return self.responses.pop(0)
+        return make_response(envelope(items=[{"code": "11"}] * 100))
+
+    def test_hit_within_ttl(self):
+        """TTL 안의 같은 요청은 캐시에서 응답하는지 테스트"""
+        cache = ResponseCache(ttl=60, time_func=self.clock)
+        first = cache.send(self.next_send, prepare(URL, {"pageNo": 1, "serviceKey": "A"}))
+        second = cache.send(self.next_send, prepare(URL, {"serviceKey": "B", "pageNo": 1}))
+
+        self.assertEqual(len(self.calls), 1)
+        self.assertFalse(getattr(first, "from_cache", False))
+        self.assertTrue(second.from_cache)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(second.headers["ETag"], '"v1"')
+        self.assertNotIn("Content-Length", second.headers)
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_expires_after_ttl(self):
+        """TTL이 지나면 다시 요청하는지 테스트"""
+        cache = ResponseCache(ttl=60, time_func=self.clock)
+        cache.send(self.next_send, prepare(URL))
+        self.clock.now += 61
+        cache.send(self.next_send, prepare(URL))
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(cache.stats()["expired"], 1)
+
+    def test_endpoint_ttls(self):
+        """엔드포인트별 TTL과 캐시 제외 테스트"""
+        cache = ResponseCache(
+            ttl=60,
+            endpoint_ttls={"APIS.data.go.kr/nocache": 0, "apis.data.go.kr/long": 3600},
+            time_func=self.clock,
+        )
+        self.assertEqual(cache.ttl_for("https://apis.data.go.kr/long?x=1"), 3600)
+        for _ in range(2):
+            cache.send(self.next_send, prepare("https://apis.data.go.kr/nocache"))
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(len(cache), 0)
+
+    def test_error_envelope_not_cached(self):
+        """오류 봉투와 HTTP 오류는 보관하지 않는지 테스트"""
+        cache = ResponseCache(time_func=self.clock)
+        self.responses = [
+            make_response(envelope("99")),
+            make_response(b"Service Unavailable", status_code=503),
+        ]
+        for _ in range(3):
+            cache.send(self.next_send, prepare(URL))
+        self.assertEqual(len(self.calls), 3)
+        self.assertEqual(cache.stats()["stores"], 1)
+
+    def test_post_and_stream_bypass(self):
+        """POST와 stream=True 요청은 캐시하지 않는지 테스트"""
+        cache = ResponseCache(time_func=self.clock)
+        for _ in range(2):
+            cache.send(self.next_send, prepare(URL, method="POST"))
+            cache.send(self.next_send, prepare(URL), stream=True)
+        self.assertEqual(len(self.calls), 4)
+        self.assertEqual(len(cache), 0)
+
+    def test_no_cache_header_refreshes(self):
+        """Cache-Control: no-cache 요청은 새로 받아 갱신하는지 테스트"""
+        cache = ResponseCache(time_func=self.clock)
+        cache.send(self.next_send, prepare(URL))
+        response = cache.send(
+            self.next_send, prepare(URL, headers={"Cache-Control": "no-cache"})
+        )
+        self.assertFalse(getattr(response, "from_cache", False))
+        self.assertEqual(len(self.calls), 2)
+        self.assertTrue(cache.send(self.next_send, prepare(URL)).from_cache)
+
+    def test_lru_eviction_by_entries(self):
+        """항목 수 제한을 넘으면 가장 오래 쓰지 않은 항목을 버리는지 테스트"""
+        cache = ResponseCache(max_entries=2, time_func=self.clock)
+        cache.send(self.next_send, prepare(URL, {"pageNo": 1}))
+        cache.send(self.next_send, prepare(URL, {"pageNo": 2}))
+        cache.send(self.next_send, prepare(URL, {"pageNo": 1}))  # 1을 최근으로
+        cache.send(self.next_send, prepare(URL, {"pageNo": 3}))  # 2를 버림
+
+        self.assertEqual(cache.stats()["evictions"], 1)
+        self.assertIsNotNone(cache.get(cache_key("GET", prepare(URL, {"pageNo": 1}).url)))
+        self.assertIsNone(cache.get(cache_key("GET", prepare(URL, {"pageNo": 2}).url)))
+
+    def test_compression_and_byte_limit(self):
+        """큰 본문은 압축해서 보관하고 전체 크기 제한을 지키는지 테스트"""
+        cache = ResponseCache(max_bytes=10000, time_func=self.clock)
+        response = cache.send(self.next_send, prepare(URL))
+        stats = cache.stats()
+        self.assertLess(stats["bytes"], len(response.content) / 5)
+
+        cache = ResponseCache(max_bytes=1000, compress_threshold=None, time_func=self.clock)
+        cache.send(self.next_send, prepare(URL))
+        self.assertEqual(len(cache), 0)
+
+
+class TestStaleServing(unittest.TestCase):
+    """stale-while-revalidate / stale-if-error 테스트 클래스"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.calls = []
+        self.responses = []
+
+    def next_send(self, request, **kwargs):
+        self.calls.append(request)
+        if self.responses:
+            response = self.responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+        return make_response(envelope(items=[{"code": str(len(self.calls))}]))
+
+    def make_cache(self, **kwargs):
+        cache = ResponseCache(ttl=60, time_func=self.clock, **kwargs)
+        self.addCleanup(cache.close)
+        return cache
+
+    def test_stale_while_revalidate(self):
+        """만료된 항목으로 바로 응답하고 백그라운드에서 갱신하는지 테스트"""
+        cache = self.make_cache(stale_while_revalidate=300)
+        cache.send(self.next_send, prepare(URL))
+        self.clock.now += 61
+
+        response = cache.send(self.next_send, prepare(URL))
+        self.assertTrue(response.stale)
+        self.assertEqual(response.json()["response"]["body"]["items"]["item"][0]["code"], "1")
+        cache.close()  # 백그라운드 갱신이 끝날 때까지 대기
+
+        self.assertEqual(len(self.calls), 2)
+        self.assertEqual(self.calls[1].headers["If-None-Match"], '"v1"')
+        response = cache.send(self.next_send, prepare(URL))
+        self.assertFalse(response.stale)
+        self.assertEqual(response.json()["response"]["body"]["items"]["item"][0]["code"], "2")
+        stats = cache.stats()
+        self.assertEqual((stats["stale_hits"], stats["refreshes"]), (1, 1))
+
+    def test_single_background_refresh_per_key(self):
+        """만료된 항목 하나에 갱신은 한 번만 진행하는지 테스트"""
+        cache = self.make_cache(stale_while_revalidate=300)
+        cache.send(self.next_send, prepare(URL))
+        self.clock.now += 61
+
+        release = threading.Event()
+
+        def slow_send(request, **kwargs):
+            release.wait(5)
+            return self.next_send(request, **kwargs)
+
+        for _ in range(5):
+            self.assertTrue(cache.send(slow_send, prepare(URL)).stale)
+        release.set()
+        cache.close()
+        self.assertEqual(len(self.calls), 2)
+
+    def test_refresh_error_keeps_stale_entry(self):
+        """백그라운드 갱신 실패는 통계에만 남는지 테스트"""
+        cache = self.make_cache(stale_while_revalidate=300)
+        cache.send(self.next_send, prepare(URL))
+        self.clock.now += 61
+        self.responses = [requests.ConnectionError("down")]
+        cache.send(self.next_send, prepare(URL))
+        cache.close()
+        self.assertEqual(cache.stats()["refresh_errors"], 1)
+        self.assertTrue(cache.send(self.next_send, prepare(URL)).stale)
+
+    def test_stale_if_error(self):
+        """서버 오류 시 만료된 항목으로 응답하는지 테스트"""
+        cache = self.make_cache(stale_if_error=3600)
+        cache.send(self.next_send, prepare(URL))
+        self.clock.now += 61
+
+        self.responses = [
+            make_response(b"Bad Gateway", status_code=502),
+            make_response(envelope("99")),
+            requests.ConnectionError("down"),
+            requests.Timeout("slow"),
+        ]
+        for _ in range(4):
+            response = cache.send(self.next_send, prepare(URL))
+            self.assertTrue(response.stale)
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual(cache.stats()["stale_if_error"], 4)
+
+        # 일시적이지 않은 오류는 그대로 전달
+        self.responses = [make_response(envelope("30"))]
+        response = cache.send(self.next_send, prepare(URL))
+        self.assertFalse(getattr(response, "from_cache", False))
+
+    def test_stale_if_error_window(self):
+        """stale_if_error 시간이 지나면 오류를 그대로 전달하는지 테스트"""
+        cache = self.make_cache(stale_if_error=100)
+        cache.send(self.next_send, prepare(URL))
+        self.clock.now += 161
+        self.responses = [requests.ConnectionError("down")]
+        with self.assertRaises(requests.ConnectionError):
+            cache.send(self.next_send, prepare(URL))
+
+
+def put_entries(store, prefix, count):
+    """다른 프로세스에서 count개의 항목을 보관"""
+    for i in range(count):
+        store.put(f"{prefix}-{i}", CacheEntry(200, "OK", (), b"x" * 100, False, 0.0, 1e12))
+    store.close()
+
+
+class TestSQLiteCacheStore(unittest.TestCase):
+    """디스크 캐시 계층 테스트 클래스"""
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempdir.name, "cache.db")
+        self.clock = FakeClock()
+        self.calls = []
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def make_store(self, **kwargs):
+        store = SQLiteCacheStore(self.path, time_func=self.clock, **kwargs)
+        self.addCleanup(store.close)
+        return store
+
+    def next_send(self, request, **kwargs):
+        self.calls.append(request)
+        return make_response(envelope(items=[{"code": "11"}] * 100))
+
+    def test_cold_start_hits_disk(self):
+        """새로 시작한 프로세스가 디스크 항목으로 응답하는지 테스트"""
+        cache = ResponseCache(disk_store=self.make_store(), time_func=self.clock)
+        first = cache.send(self.next_send, prepare(URL, {"pageNo": 1}))
+
+        restarted = ResponseCache(disk_store=self.make_store(), time_func=self.clock)
+        second = restarted.send(self.next_send, prepare(URL, {"pageNo": 1}))
+        self.assertEqual(len(self.calls), 1)
+        self.assertTrue(second.from_cache)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second.headers["ETag"], '"v1"')
+        self.assertEqual(restarted.stats()["disk_hits"], 1)
+
+        # 디스크에서 올린 항목은 이후 메모리에서 응답
+        restarted.send(self.next_send, prepare(URL, {"pageNo": 1}))
+        self.assertEqual(restarted.stats()["disk_hits"], 1)
+        self.assertEqual(restarted.stats()["hits"], 2)
+
+    def test_revalidation_with_etag(self):
+        """만료된 항목을 조건부 요청으로 확인하고 304면 연장하는지 테스트"""
+        cache = ResponseCache(ttl=60, disk_store=self.make_store(), time_func=self.clock)
+        cache.send(self.next_send, prepare(URL))
+        self.clock.now += 61
+
+        def not_modified(request, **kwargs):
+            self.calls.append(request)
+            return make_response(b"", status_code=304)
+
+        response = cache.send(not_modified, prepare(URL))
+        self.assertEqual(self.calls[-1].headers["If-None-Match"], '"v1"')
+        self.assertTrue(response.from_cache)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["response"]["header"]["resultCode"], "00")
+        self.assertEqual(cache.stats()["revalidated"], 1)
+
+        # 연장된 보관 시간은 디스크에도 기록됨
+        stored = self.make_store().get(cache_key("GET", prepare(URL).url))
+        self.assertGreater(stored.expires_at, self.clock.now)
+        cache.send(self.next_send, prepare(URL))
+        self.assertEqual(len(self.calls), 2)
+
+    def test_size_cap_evicts_least_recently_used(self):
+        """크기 제한을 넘으면 가장 오래 쓰지 않은 항목부터 지우는지 테스트"""
+        store = self.make_store(max_bytes=250)
+        for name in ("a", "b"):
+            store.put(name, CacheEntry(200, "OK", (), b"x" * 100, False, 0.0, 1e12))
+            self.clock.now += 100
+        store.get("a")  # a를 최근 사용으로
+        store.put("c", CacheEntry(200, "OK", (), b"x" * 100, False, 0.0, 1e12))
+
+        self.assertIsNotNone(store.get("a"))
+        self.assertIsNone(store.get("b"))
+        self.assertEqual(store.stats(), {"entries": 2, "bytes": 200})
+
+    def test_concurrent_processes(self):
+        """여러 프로세스가 동시에 쓸 수 있는지 테스트"""
+        store = self.make_store()
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(4) as pool:
+            pool.starmap(put_entries, [(store, f"p{i}", 25) for i in range(4)])
+        self.assertEqual(len(store), 100)
+
+
+class TestSingleFlight(unittest.TestCase):
+    """동시 요청 합치기 테스트 클래스"""
+
+    def setUp(self):
+        self.single_flight = SingleFlight()
+        self.calls = []
+        self.release = threading.Event()
+
+    def slow_send(self, request, **kwargs):
+        self.calls.append(request)
+        self.release.wait(5)
+        return make_response(envelope(items=[{"code": "11"}]))
+
+    def submit_concurrently(self, count, send, requests_factory):
+        with ThreadPoolExecutor(count) as executor:
+            futures = []
+            for i in range(count):
+                futures.append(
+                    executor.submit(self.single_flight.send, send, requests_factory(i))
+                )
+                if i == 0:
+                    # 첫 요청이 먼저 시작하도록 대기
+                    while not self.calls:
+                        time.sleep(0.001)
+            # 모든 요청이 첫 요청을 기다리기 시작할 때까지 대기
+            deadline = time.monotonic() + 5
+            while self.single_flight.stats()["coalesced"] < count - 1:
+                self.assertLess(time.monotonic(), deadline)
+                time.sleep(0.01)
+            self.release.set()
+        return futures
+
+    def run_concurrently(self, count, send, requests_factory):
+        return [future.result() for future in self.submit_concurrently(count, send, requests_factory)]
+
+    def test_identical_requests_coalesced(self):
+        """같은 요청은 한 번만 보내고 응답을 나눠 받는지 테스트"""
+        responses = self.run_concurrently(
+            8, self.slow_send, lambda i: prepare(URL, {"pageNo": 1, "serviceKey": f"K{i}"})
+        )
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(len({id(response) for response in responses}), 8)
+        self.assertEqual(len({response.content for response in responses}), 1)
+        self.assertEqual(sum(getattr(r, "coalesced", False) for r in responses), 7)
+        self.assertEqual(
+            self.single_flight.stats(),
+            {"leaders": 1, "coalesced": 7, "refetched": 0, "in_flight": 0},
+        )
+
+    def test_error_not_shared_with_waiters(self):
+        """첫 요청의 예외는 나누지 않고 기다리던 요청들이 각자 보내는지 테스트"""
+
+        def failing_send(request, **kwargs):
+            self.calls.append(request)
+            self.release.wait(5)
+            if len(self.calls) == 1:
+                raise ConnectionError("upstream down")
+            return make_response(envelope(items=[{"code": "11"}]))
+
+        results = []
+        for future in self.submit_concurrently(4, failing_send, lambda i: prepare(URL)):
+            try:
+                results.append(future.result().status_code)
+            except ConnectionError as e:
+                results.append(e)
+        self.assertEqual(len(self.calls), 4)
+        self.assertEqual(sum(isinstance(result, ConnectionError) for result in results), 1)
+        self.assertEqual(self.single_flight.stats()["refetched"], 3)
+        self.assertEqual(self.single_flight.stats()["in_flight"], 0)
+
+    def test_key_specific_error_not_shared(self):
+        """서비스키마다 다른 오류 응답(미등록 키 등)은 나누지 않는지 테스트"""
+
+        def send(request, **kwargs):
+            self.calls.append(request)
+            self.release.wait(5)
+            result_code = "30" if "serviceKey=K0" in request.url else "00"
+            response = make_response(envelope(result_code, items=[{"code": "11"}]))
+            response.request = request
+            return response
+
+        responses = self.run_concurrently(
+            4, send, lambda i: prepare(URL, {"pageNo": 1, "serviceKey": f"K{i}"})
+        )
+        codes = {
+            response.request.url.rsplit("serviceKey=", 1)[1]: classify_response(response)[0]
+            for response in responses
+        }
+        self.assertEqual(codes["K0"], RESULT_FATAL)
+        self.assertEqual([codes[f"K{i}"] for i in range(1, 4)], [None] * 3)
+        self.assertFalse(any(getattr(r, "coalesced", False) for r in responses))
+
+    def test_different_requests_not_coalesced(self):
+        """다른 요청과 POST는 합치지 않는지 테스트"""
+        self.release.set()
+        self.single_flight.send(self.slow_send, prepare(URL, {"pageNo": 1}))
+        self.single_flight.send(self.slow_send, prepare(URL, {"pageNo": 2}))
+        self.single_flight.send(self.slow_send, prepare(URL, method="POST"))
+        self.assertEqual(len(self.calls), 3)
+
+    def test_do_async(self):
+        """asyncio 호출 합치기와 취소 격리 테스트"""
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "result"
+
+        async def run():
+            waiters = [
+                asyncio.ensure_future(self.single_flight.do_async("key", fetch))
+                for _ in range(5)
+            ]
+            await asyncio.sleep(0)
+            waiters[0].cancel()  # 첫 호출이 취소되어도 나머지는 결과를 받음
+            return await asyncio.gather(*waiters[1:])
+
+        self.assertEqual(asyncio.run(run()), ["result"] * 4)
+        self.assertEqual(calls, [1])
+        self.assertEqual(self.single_flight.stats()["coalesced"], 4)
+
+
+class TestResponseCacheSession(unittest.TestCase):
+    """세션 통합 테스트 클래스"""
+
+    def test_session_serves_from_cache(self):
+        """캐시된 요청은 서버로 보내지 않는지 테스트"""
+        cache = ResponseCache()
+        with PublicDataApiStubServer() as server:
+            session = create_public_data_api_session(cache=cache)
+            try:
+                for service_key in ("A", "B", "C"):
+                    response = session.get(
+                        server.url("/getList"),
+                        params={"serviceKey": service_key, "pageNo": 1},
+                        verify=False,
+                    )
+                    self.assertEqual(response.status_code, 200)
+                    self.assertEqual(
+                        response.json()["response"]["header"]["resultCode"], "00"
+                    )
+            finally:
+                session.close()
+            self.assertEqual(server.stats()["requests"], 1)
+        self.assertEqual(cache.stats()["hits"], 2)
+
+    def test_session_coalesces_concurrent_misses(self):
+        """캐시에 없는 동시 요청이 하나로 합쳐지는지 테스트"""
+
+        def slow_response(*args):
+            time.sleep(0.3)
+            return normal_service_response(*args)
+
+        single_flight = SingleFlight()
+        with PublicDataApiStubServer(responder=slow_response) as server:
+            session = create_public_data_api_session(
+                single_flight=single_flight, cache=ResponseCache()
+            )
+            try:
+                with ThreadPoolExecutor(8) as executor:
+                    responses = list(
+                        executor.map(
+                            lambda _: session.get(
+                                server.url("/getList"), params={"pageNo": 1}, verify=False
+                            ),
+                            range(8),
+                        )
+                    )
+            finally:
+                session.close()
+            self.assertTrue(all(response.status_code == 200 for response in responses))
+            self.assertEqual(server.stats()["requests"], 1)
+        self.assertEqual(single_flight.stats()["leaders"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
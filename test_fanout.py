@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Public Data API Fan-out - 테스트 스크립트
+
+로컬 TLS 스텁 서버로 파라미터 격자 실행, 동시성 제한, 체크포인트 재개를 확인합니다.
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from public_data_api_fanout import FanOutCheckpoint, fan_out, grid_cells
+from public_data_api_ratelimit import ServiceKeyRateLimiter
+from public_data_api_response import PublicDataApiError, PublicDataApiQuotaExceededError
+from public_data_api_ssl_adapter import PublicDataApiClient, create_public_data_api_session
+from public_data_api_stub_server import PagedEnvelopeResponder, PublicDataApiStubServer
+
+GRID = {"LAWD_CD": ["11110", "11140", "11170"], "DEAL_YMD": ["202401", "202402"]}
+
+
+class RecordingResponder:
+    """요청된 칸과 동시에 처리 중인 요청 수를 기록하는 응답 함수"""
+
+    def __init__(self, failing_region=None, garbled_region=None, **kwargs):
+        self.envelope = PagedEnvelopeResponder(**kwargs)
+        self.failing_region = failing_region
+        self.garbled_region = garbled_region
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, method, path, query, body):
+        with self.lock:
+            self.requests.append((query.get("LAWD_CD"), query.get("DEAL_YMD"), query.get("pageNo")))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            if query.get("LAWD_CD") == self.failing_region:
+                return 500, {"Content-Type": "text/plain"}, b"error"
+            if query.get("LAWD_CD") == self.garbled_region:
+                return 200, {"Content-Type": "text/html"}, b"<html><body>Bad Gateway<br></body></html>"
+            return self.envelope(method, path, query, body)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class TestGridCells(unittest.TestCase):
+    """격자 칸 생성 테스트 클래스"""
+
+    def test_product(self):
+        """dict 격자는 모든 조합을 이름 순서대로 만드는지 테스트"""
+        cells = list(grid_cells(GRID))
+        self.assertEqual(len(cells), 6)
+        self.assertEqual(
+            cells[1], ("LAWD_CD=11110&DEAL_YMD=202402", {"LAWD_CD": "11110", "DEAL_YMD": "202402"})
+        )
+
+    def test_explicit_cells(self):
+        """칸 목록을 그대로 쓰는지 테스트"""
+        cells = list(grid_cells([{"LAWD_CD": 11110}, {"LAWD_CD": 11140}]))
+        self.assertEqual([cell_id for cell_id, _ in cells], ["LAWD_CD=11110", "LAWD_CD=11140"])
+
+
+class TestFanOut(unittest.TestCase):
+    """fan_out 테스트 클래스"""
+
+    def setUp(self):
+        self.responder = RecordingResponder(total_count=25, latency=0.02)
+        self.server = PublicDataApiStubServer(responder=self.responder).start()
+        self.session = create_public_data_api_session()
+        self.url = self.server.url("/getRTMSDataSvcAptTrade")
+        self.params = {"serviceKey": "KEY", "numOfRows": 10, "_type": "json"}
+        self.directory = tempfile.TemporaryDirectory()
+        self.checkpoint_path = os.path.join(self.directory.name, "trades.checkpoint")
+
+    def tearDown(self):
+        self.session.close()
+        self.server.stop()
+        self.directory.cleanup()
+
+    def run_fan_out(self, grid=GRID, **kwargs):
+        return fan_out(self.session, self.url, grid, self.params, verify=False, **kwargs)
+
+    def test_all_cells_paginated(self):
+        """모든 칸의 모든 페이지를 읽어 칸 식별자와 함께 반환하는지 테스트"""
+        results = list(self.run_fan_out(max_workers=2))
+        self.assertEqual(
+            sorted(result.cell_id for result in results),
+            sorted(cell_id for cell_id, _ in grid_cells(GRID)),
+        )
+        for result in results:
+            self.assertIsNone(result.error)
+            self.assertEqual(result.total_count, 25)
+            self.assertEqual([item["seq"] for item in result.items], list(range(25)))
+        # 칸마다 3페이지, 칸 파라미터가 요청에 포함됨
+        self.assertEqual(len(self.responder.requests), 18)
+        self.assertIn(("11170", "202402", "3"), self.responder.requests)
+        self.assertLessEqual(self.responder.max_active, 2)
+
+    def test_resume_from_checkpoint(self):
+        """중단된 뒤 체크포인트에 기록되지 않은 칸만 다시 받는지 테스트"""
+        results = self.run_fan_out(max_workers=1, checkpoint=self.checkpoint_path)
+        first = [next(results).cell_id, next(results).cell_id]
+        results.close()  # 두 번째 칸은 다음 결과를 요청하기 전에 중단됨
+
+        with FanOutCheckpoint(self.checkpoint_path) as checkpoint:
+            self.assertEqual(len(checkpoint), 1)
+            self.assertIn(first[0], checkpoint)
+            resumed = [result.cell_id for result in self.run_fan_out(checkpoint=checkpoint)]
+            self.assertEqual(len(checkpoint), 6)
+
+        self.assertNotIn(first[0], resumed)
+        self.assertIn(first[1], resumed)
+        self.assertEqual(len(resumed), 5)
+        self.assertEqual(list(self.run_fan_out(checkpoint=self.checkpoint_path)), [])
+
+    def test_truncated_checkpoint_line(self):
+        """기록 중 중단된 마지막 줄은 무시하고 이어 쓰지 않는지 테스트"""
+        with open(self.checkpoint_path, "w", encoding="utf-8") as f:
+            f.write("LAWD_CD=11110\nLAWD_CD=111")
+        with FanOutCheckpoint(self.checkpoint_path) as checkpoint:
+            self.assertEqual(len(checkpoint), 1)
+            checkpoint.add("LAWD_CD=11140")
+        with FanOutCheckpoint(self.checkpoint_path) as checkpoint:
+            self.assertIn("LAWD_CD=11140", checkpoint)
+            self.assertNotIn("LAWD_CD=111", checkpoint)
+
+    def test_failed_cell(self):
+        """실패한 칸은 예외로 멈추거나(on_error="raise") 결과로 반환하는지 테스트"""
+        self.responder.failing_region = "11140"
+        with self.assertRaises(requests.HTTPError):
+            list(self.run_fan_out())
+
+        results = list(self.run_fan_out(on_error="yield", checkpoint=self.checkpoint_path))
+        failed = [result for result in results if result.error is not None]
+        self.assertEqual(len(results), 6)
+        self.assertEqual({result.cell["LAWD_CD"] for result in failed}, {"11140"})
+        self.assertIsInstance(failed[0].error, requests.HTTPError)
+        with FanOutCheckpoint(self.checkpoint_path) as checkpoint:
+            self.assertEqual(len(checkpoint), 4)
+
+    def test_unparseable_cell(self):
+        """해석할 수 없는 본문(게이트웨이 HTML 등)도 실패한 칸으로 반환하는지 테스트"""
+        self.responder.garbled_region = "11170"
+        results = list(self.run_fan_out(on_error="yield"))
+        failed = [result for result in results if result.error is not None]
+        self.assertEqual(len(results), 6)
+        self.assertEqual({result.cell["LAWD_CD"] for result in failed}, {"11170"})
+        self.assertIsInstance(failed[0].error, PublicDataApiError)
+
+    def test_quota_result_code_stops(self):
+        """한도 초과 resultCode(22)는 on_error="yield"에서도 실행을 멈추는지 테스트"""
+        self.responder.envelope = PagedEnvelopeResponder(total_count=25, errors={1: "22"})
+        results = self.run_fan_out(max_workers=1, on_error="yield")
+        with self.assertRaises(PublicDataApiQuotaExceededError):
+            list(results)
+        # 진행 중이던 칸 외에는 요청하지 않음
+        self.assertLessEqual(len(self.responder.requests), 3)
+
+    def test_worker_threads_do_not_share_session(self):
+        """칸을 처리하는 스레드가 세션 대신 어댑터만 함께 쓰는지 테스트"""
+        adapters = set()
+        self.session.hooks["response"].append(
+            lambda response, **kwargs: adapters.add(response.connection)
+        )
+        with patch.object(self.session, "request", side_effect=AssertionError):
+            results = list(self.run_fan_out(max_workers=3))
+        self.assertTrue(all(result.error is None for result in results))
+        self.assertEqual(adapters, {self.session.get_adapter("https://")})
+
+    def test_client(self):
+        """PublicDataApiClient로 호출하는 테스트"""
+        with PublicDataApiClient() as client:
+            results = list(fan_out(client, self.url, GRID, self.params, verify=False))
+        self.assertEqual(len(results), 6)
+        self.assertTrue(all(len(result.items) == 25 for result in results))
+
+    def test_invalid_on_error(self):
+        """잘못된 on_error 값 테스트"""
+        with self.assertRaises(ValueError):
+            next(self.run_fan_out(on_error="ignore"))
+
+    def test_rate_limiter_quota(self):
+        """세션의 호출 한도를 따르고 일일 한도를 모두 쓰면 멈추는지 테스트"""
+        limiter = ServiceKeyRateLimiter(per_second=1000, daily_limit=7)
+        with create_public_data_api_session(rate_limiter=limiter) as session:
+            results = fan_out(
+                session, self.url, GRID, self.params, max_workers=1,
+                checkpoint=self.checkpoint_path, verify=False,
+            )
+            received = []
+            with self.assertRaises(PublicDataApiQuotaExceededError):
+                for result in results:
+                    received.append(result.cell_id)
+        # 칸마다 3번 호출하므로 두 칸을 받은 뒤 세 번째 칸에서 한도 초과
+        self.assertEqual(len(received), 2)
+        self.assertEqual(len(self.responder.requests), 7)
+        with FanOutCheckpoint(self.checkpoint_path) as checkpoint:
+            self.assertEqual(len(checkpoint), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Public Data API Metrics - 테스트 스크립트
+
+로컬 TLS 스텁 서버로 요청 지표 집계와 Prometheus 텍스트 형식을 확인합니다.
+"""
+
+import re
+import unittest
+import urllib.request
+
+import requests
+
+from public_data_api_cache import ResponseCache
+from public_data_api_metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    PublicDataApiMetrics,
+    service_key_id,
+    start_http_server,
+)
+from public_data_api_ratelimit import ServiceKeyRateLimiter
+from public_data_api_response import PublicDataApiQuotaExceededError, ResultCodeRetryPolicy
+from public_data_api_ssl_adapter import create_public_data_api_session
+from public_data_api_stub_server import PagedEnvelopeResponder, PublicDataApiStubServer
+
+SAMPLE_PATTERN = re.compile(r"^([a-z_]+)(\{.*\})? (\S+)$")
+
+
+def parse_samples(text):
+    """Prometheus 텍스트에서 {(이름, 레이블 문자열): 값} 추출"""
+    samples = {}
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        match = SAMPLE_PATTERN.match(line)
+        if match is None:
+            raise AssertionError(f"잘못된 형식: {line!r}")
+        name, labels, value = match.groups()
+        samples[(name, labels or "")] = float(value)
+    return samples
+
+
+class TestPublicDataApiMetrics(unittest.TestCase):
+    """요청 지표와 내보내기 테스트 클래스"""
+
+    def setUp(self):
+        self.responder = PagedEnvelopeResponder(errors={3: "22", 4: 500})
+        self.server = PublicDataApiStubServer(responder=self.responder).start()
+        self.metrics = PublicDataApiMetrics()
+        self.session = create_public_data_api_session(
+            metrics=self.metrics,
+            cache=ResponseCache(),
+            rate_limiter=ServiceKeyRateLimiter(per_second=1000, daily_limit=100),
+            retry_policy=ResultCodeRetryPolicy(max_retries=0),
+        )
+        self.url = self.server.url("/getList")
+
+    def tearDown(self):
+        self.session.close()
+        self.server.stop()
+
+    def get(self, page_no):
+        return self.session.get(
+            self.url, params={"pageNo": page_no, "serviceKey": "SECRET-KEY"}, verify=False
+        )
+
+    def test_requests_by_status_and_result_code(self):
+        """HTTP 상태와 resultCode별 호출 수 테스트"""
+        self.get(1)
+        self.get(1)  # 캐시 응답도 호출로 기록
+        with self.assertRaises(PublicDataApiQuotaExceededError):
+            self.get(3)
+        self.assertEqual(self.get(4).status_code, 500)
+
+        samples = parse_samples(self.metrics.render())
+        prefix = 'host="127.0.0.1",endpoint="/getList"'
+        name = "public_data_api_requests_total"
+        self.assertEqual(samples[(name, f'{{{prefix},status="200",result_code="00"}}')], 2)
+        self.assertEqual(samples[(name, f'{{{prefix},status="200",result_code="22"}}')], 1)
+        self.assertEqual(samples[(name, f'{{{prefix},status="500",result_code=""}}')], 1)
+        self.assertEqual(
+            samples[("public_data_api_request_duration_seconds_count", f"{{{prefix}}}")], 4
+        )
+        self.assertEqual(
+            samples[
+                ("public_data_api_request_duration_seconds_bucket", f'{{{prefix},le="+Inf"}}')
+            ],
+            4,
+        )
+        self.assertEqual(samples[("public_data_api_cache_hits_total", "")], 1)
+        # 핸드셰이크 통계는 공유 SSL 컨텍스트 단위이므로 다른 테스트의 값도 포함
+        self.assertGreaterEqual(samples[("public_data_api_handshakes_total", '{kind="full"}')], 1)
+        pool = f'{{pool="https://127.0.0.1:{self.server.address[1]}"}}'
+        self.assertEqual(samples[("public_data_api_pool_created_total", pool)], 1)
+        self.assertEqual(samples[("public_data_api_pool_timeouts_total", pool)], 0)
+        tls = [
+            (labels, value)
+            for (name, labels), value in samples.items()
+            if name == "public_data_api_tls_connections_total"
+        ]
+        self.assertEqual(len(tls), 1)
+        self.assertIn('version="TLSv1.2"', tls[0][0])
+        self.assertGreaterEqual(tls[0][1], 1)
+        handshake = {
+            name: value
+            for (name, labels), value in samples.items()
+            if name.startswith("public_data_api_tls_handshake_seconds")
+            and labels.startswith(tls[0][0][:-1])
+        }
+        self.assertEqual(handshake["public_data_api_tls_handshake_seconds_count"], tls[0][1])
+        self.assertGreater(handshake["public_data_api_tls_handshake_seconds_sum"], 0)
+        self.assertIn("public_data_api_tls_handshake_seconds_bucket", handshake)
+
+    def test_pool_peak_not_summed(self):
+        """여러 어댑터의 풀 통계에서 누적값은 더하고 max_in_use는 더하지 않는지 테스트"""
+        with create_public_data_api_session(metrics=self.metrics) as other:
+            self.get(1)
+            other.get(self.url, params={"pageNo": 2}, verify=False)
+            samples = parse_samples(self.metrics.render())
+        pool = f'{{pool="https://127.0.0.1:{self.server.address[1]}"}}'
+        self.assertEqual(samples[("public_data_api_pool_checkouts_total", pool)], 2)
+        self.assertEqual(samples[("public_data_api_pool_max_in_use", pool)], 1)
+
+    def test_quota_usage_hides_service_key(self):
+        """호출 한도 지표는 서비스키 대신 식별자를 쓰는지 테스트"""
+        self.get(1)
+        text = self.metrics.render()
+        self.assertNotIn("SECRET-KEY", text)
+        labels = (
+            f'{{key_id="{service_key_id("SECRET-KEY")}",'
+            f'endpoint="127.0.0.1:{self.server.address[1]}/getList"}}'
+        )
+        samples = parse_samples(text)
+        self.assertEqual(samples[("public_data_api_quota_used", labels)], 1)
+        self.assertEqual(samples[("public_data_api_quota_limit", labels)], 100)
+
+    def test_connection_errors(self):
+        """응답 없이 끝난 호출은 예외 종류별로 기록하는지 테스트"""
+        with PublicDataApiStubServer() as closed:
+            url = closed.url("/getList")
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self.session.get(url, verify=False)
+        samples = parse_samples(self.metrics.render())
+        self.assertEqual(
+            samples[
+                (
+                    "public_data_api_request_errors_total",
+                    '{host="127.0.0.1",endpoint="/getList",error="ConnectionError"}',
+                )
+            ],
+            1,
+        )
+
+    def test_http_server(self):
+        """GET /metrics 엔드포인트 테스트"""
+        self.get(1)
+        server = start_http_server(self.metrics, port=0)
+        try:
+            host, port = server.server_address[:2]
+            with urllib.request.urlopen(f"http://{host}:{port}/metrics") as response:
+                self.assertEqual(response.headers["Content-Type"], PROMETHEUS_CONTENT_TYPE)
+                body = response.read().decode("utf-8")
+            self.assertIn("# TYPE public_data_api_requests_total counter", body)
+            with self.assertRaises(urllib.error.HTTPError):
+                urllib.request.urlopen(f"http://{host}:{port}/other")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_label_escaping(self):
+        """레이블 값의 따옴표와 역슬래시를 이스케이프하는지 테스트"""
+        metrics = PublicDataApiMetrics()
+        metrics._record("h", 'a"b\\c', "200", "00", 0.1)
+        self.assertIn('endpoint="a\\"b\\\\c"', metrics.render())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Public Data API Pagination - 테스트 스크립트
+
+로컬 TLS 스텁 서버가 돌려주는 페이지 응답으로 자동 페이지 순회를 확인합니다.
+"""
+
+import json
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from public_data_api_pagination import paginate
+from public_data_api_response import PublicDataApiError
+from public_data_api_ssl_adapter import create_public_data_api_session
+from public_data_api_stub_server import PublicDataApiStubServer
+
+
+class PagedResponder:
+    """totalCount개의 item을 pageNo/numOfRows로 나눠 돌려주는 응답 함수"""
+
+    def __init__(self, total_count, delays=None, error_page=None, max_rows=None):
+        self.total_count = total_count
+        self.max_rows = max_rows
+        self.delays = delays or {}
+        self.error_page = error_page
+        self.requested_pages = []
+        self.lock = threading.Lock()
+
+    def __call__(self, method, path, query, body):
+        page_no = int(query.get("pageNo", 1))
+        num_of_rows = int(query.get("numOfRows", 10))
+        if self.max_rows:
+            num_of_rows = min(num_of_rows, self.max_rows)
+        with self.lock:
+            self.requested_pages.append(page_no)
+        time.sleep(self.delays.get(page_no, 0))
+
+        result_code = "99" if page_no == self.error_page else "00"
+        start = (page_no - 1) * num_of_rows
+        end = min(start + num_of_rows, self.total_count)
+        payload = {
+            "response": {
+                "header": {"resultCode": result_code, "resultMsg": "MSG"},
+                "body": {
+                    "items": {"item": [{"seq": n} for n in range(start, end)]},
+                    "numOfRows": num_of_rows,
+                    "pageNo": page_no,
+                    "totalCount": self.total_count,
+                },
+            }
+        }
+        return 200, {"Content-Type": "application/json"}, json.dumps(payload).encode()
+
+
+class TestPaginate(unittest.TestCase):
+    """paginate 테스트 클래스"""
+
+    def setUp(self):
+        self.server = PublicDataApiStubServer().start()
+        self.session = create_public_data_api_session()
+        self.url = self.server.url("/getList")
+
+    def tearDown(self):
+        self.session.close()
+        self.server.stop()
+
+    def test_yields_all_items_in_page_order(self):
+        """모든 item을 페이지 순서대로 반환하는지 테스트"""
+        self.server.responder = PagedResponder(25, delays={2: 0.2})
+        items = list(
+            paginate(self.session, self.url, {"numOfRows": 10}, verify=False)
+        )
+        self.assertEqual([item["seq"] for item in items], list(range(25)))
+        self.assertEqual(sorted(self.server.responder.requested_pages), [1, 2, 3])
+
+    def test_unordered_yields_pages_as_they_arrive(self):
+        """ordered=False면 먼저 도착한 페이지부터 반환하는지 테스트"""
+        self.server.responder = PagedResponder(30, delays={2: 0.3})
+        items = list(
+            paginate(
+                self.session,
+                self.url,
+                {"numOfRows": 10},
+                ordered=False,
+                verify=False,
+            )
+        )
+        seqs = [item["seq"] for item in items]
+        self.assertEqual(sorted(seqs), list(range(30)))
+        # 늦게 도착한 2페이지(10~19)가 3페이지보다 뒤에 나옴
+        self.assertLess(seqs.index(20), seqs.index(10))
+
+    def test_worker_threads_do_not_share_session(self):
+        """스레드마다 세션을 복사하고 설정과 어댑터만 함께 쓰는지 테스트"""
+        self.server.responder = PagedResponder(50)
+        seen = []
+        self.session.headers["X-Client"] = "test"
+        self.session.hooks["response"].append(
+            lambda response, **kwargs: seen.append(
+                (
+                    threading.get_ident(),
+                    response.request.headers.get("X-Client"),
+                    response.connection,
+                )
+            )
+        )
+        with patch.object(self.session, "request", side_effect=AssertionError):
+            items = list(
+                paginate(
+                    self.session, self.url, {"numOfRows": 10}, max_workers=4, verify=False
+                )
+            )
+        self.assertEqual(len(items), 50)
+        self.assertEqual({header for _, header, _ in seen}, {"test"})
+        self.assertEqual(
+            {adapter for _, _, adapter in seen}, {self.session.get_adapter("https://")}
+        )
+        self.assertGreater(len({thread for thread, _, _ in seen}), 1)
+
+    def test_single_page(self):
+        """totalCount가 한 페이지 이내인 경우 테스트"""
+        self.server.responder = PagedResponder(3)
+        items = list(paginate(self.session, self.url, {"numOfRows": 10}, verify=False))
+        self.assertEqual(len(items), 3)
+        self.assertEqual(self.server.responder.requested_pages, [1])
+
+    def test_start_page(self):
+        """pageNo로 시작 페이지를 지정하는 테스트"""
+        self.server.responder = PagedResponder(25)
+        items = list(
+            paginate(
+                self.session, self.url, {"numOfRows": 10, "pageNo": 2}, verify=False
+            )
+        )
+        self.assertEqual([item["seq"] for item in items], list(range(10, 25)))
+
+    def test_server_caps_num_of_rows(self):
+        """서버가 페이지당 행 수를 줄이면 응답의 numOfRows로 페이지를 나누는지 테스트"""
+        self.server.responder = PagedResponder(25, max_rows=10)
+        items = list(paginate(self.session, self.url, {"numOfRows": 100}, verify=False))
+        self.assertEqual([item["seq"] for item in items], list(range(25)))
+        self.assertEqual(sorted(self.server.responder.requested_pages), [1, 2, 3])
+
+    def test_error_result_code_raises(self):
+        """오류 resultCode 페이지에서 예외가 발생하는지 테스트"""
+        self.server.responder = PagedResponder(30, error_page=3)
+        with self.assertRaises(PublicDataApiError) as ctx:
+            list(paginate(self.session, self.url, {"numOfRows": 10}, verify=False))
+        self.assertEqual(ctx.exception.result_code, "99")
+
+    def test_early_close_stops_fetching(self):
+        """제너레이터를 일찍 닫으면 남은 페이지를 요청하지 않는지 테스트"""
+        self.server.responder = PagedResponder(1000)
+        pages = paginate(
+            self.session, self.url, {"numOfRows": 10}, max_workers=2, verify=False
+        )
+        next(pages)
+        pages.close()
+        time.sleep(0.1)
+        self.assertLessEqual(len(self.server.responder.requested_pages), 1 + 2 * 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
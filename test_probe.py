@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Public Data API TLS Probe - 테스트 스크립트
+
+cipher 설정이 다른 로컬 스텁 서버로 프로필 선택, 결과 보관, 어댑터 연동을 확인합니다.
+"""
+
+import os
+import socket
+import ssl
+import tempfile
+import time
+import unittest
+
+import requests
+
+from public_data_api_probe import (
+    SQLiteProbeStore,
+    TLSProfileProber,
+    probe_host,
+)
+from public_data_api_ssl_adapter import create_public_data_api_session
+from public_data_api_stub_server import PublicDataApiStubServer
+
+TLS12 = ssl.TLSVersion.TLSv1_2
+TLS13 = ssl.TLSVersion.TLSv1_3
+
+
+def stub_server(minimum_version=TLS12, maximum_version=TLS12, ciphers=None):
+    return PublicDataApiStubServer(
+        minimum_version=minimum_version, maximum_version=maximum_version, ciphers=ciphers
+    )
+
+
+class TestProbeHost(unittest.TestCase):
+    """후보 프로필 시도 테스트 클래스"""
+
+    def probe(self, server):
+        with server:
+            return probe_host(*server.address, timeout=2)
+
+    def test_tls13(self):
+        """TLS 1.3 서버는 첫 후보로 연결하는지 테스트"""
+        result = self.probe(stub_server(TLS12, TLS13))
+        self.assertEqual(result.name, "tls13")
+        self.assertEqual(result.version, "TLSv1.3")
+        self.assertEqual(len(result.attempts), 1)
+        self.assertGreater(result.handshake_time, 0)
+
+    def test_tls12_ecdhe_gcm(self):
+        """TLS 1.2 ECDHE-GCM 서버 테스트"""
+        result = self.probe(stub_server(ciphers="ECDHE-RSA-AES128-GCM-SHA256"))
+        self.assertEqual(result.name, "tls12-ecdhe-gcm")
+        self.assertEqual(result.cipher, "ECDHE-RSA-AES128-GCM-SHA256")
+        self.assertEqual([a.ok for a in result.attempts], [False, True])
+
+    def test_legacy_server(self):
+        """공공데이터 API와 같은 cipher 목록의 서버는 RSA-CBC를 고르는지 테스트"""
+        result = self.probe(PublicDataApiStubServer())
+        self.assertEqual(result.name, "tls12-rsa-cbc")
+        self.assertEqual(result.cipher, "AES128-SHA")
+
+    def test_dhe_only(self):
+        """DHE만 지원하는 서버 테스트"""
+        result = self.probe(stub_server(ciphers="DHE-RSA-AES256-SHA"))
+        self.assertEqual(result.name, "dhe")
+        self.assertEqual(len(result.attempts), 4)
+
+    def test_no_candidate(self):
+        """어떤 후보도 맞지 않으면 name이 None인지 테스트"""
+        result = self.probe(stub_server(ciphers="ECDHE-RSA-AES256-SHA"))
+        self.assertIsNone(result.name)
+        self.assertIsNone(result.tls_profile)
+        self.assertFalse(any(attempt.ok for attempt in result.attempts))
+
+    def test_connection_refused(self):
+        """연결이 거부되면 남은 후보를 시도하지 않는지 테스트"""
+        with PublicDataApiStubServer() as server:
+            address = server.address
+        result = probe_host(*address, timeout=1)
+        self.assertIsNone(result.name)
+        self.assertEqual(len(result.attempts), 1)
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestTLSProfileProber(unittest.TestCase):
+    """결과 보관과 어댑터 연동 테스트 클래스"""
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempdir.name, "probe.db")
+        self.clock = FakeClock()
+        self.server = stub_server(TLS12, TLS13).start()
+        self.host, self.port = self.server.address
+
+    def tearDown(self):
+        self.server.stop()
+        self.tempdir.cleanup()
+
+    def make_prober(self, **kwargs):
+        store = SQLiteProbeStore(self.path)
+        self.addCleanup(store.close)
+        return TLSProfileProber(store=store, time_func=self.clock, timeout=2, **kwargs)
+
+    def test_result_is_persisted(self):
+        """재시작한 prober가 서버에 연결하지 않고 보관된 결과를 쓰는지 테스트"""
+        self.assertEqual(self.make_prober().result(self.host, self.port).name, "tls13")
+        self.server.stop()
+
+        restarted = self.make_prober()
+        result = restarted.result(self.host, self.port)
+        self.assertEqual(result.name, "tls13")
+        self.assertEqual(result.attempts, ())
+
+    def test_ttl(self):
+        """ttl이 지나면 다시 확인하는지 테스트"""
+        prober = self.make_prober(ttl=60)
+        first = prober.result(self.host, self.port)
+        self.clock.now += 59
+        self.assertIs(prober.result(self.host, self.port), first)
+        self.clock.now += 1
+        second = prober.result(self.host, self.port)
+        self.assertIsNot(second, first)
+        self.assertEqual(second.probed_at, self.clock.now)
+
+    def test_failure_is_not_persisted(self):
+        """모두 실패한 결과는 failure_ttl 동안 메모리에만 보관하는지 테스트"""
+        self.server.stop()
+        prober = self.make_prober(failure_ttl=10)
+        self.assertIsNone(prober.profile_for(self.host, self.port))
+        self.assertIsNone(prober.store.get(self.host, self.port))
+        self.clock.now += 10
+        self.assertIsNone(prober.result(self.host, self.port).name)
+
+    def test_slow_probe_does_not_block(self):
+        """확인이 wait초 안에 끝나지 않으면 기다리지 않고 None을 반환하는지 테스트"""
+        # 연결은 받지만 핸드셰이크에 응답하지 않는 서버
+        listener = socket.create_server(("127.0.0.1", 0))
+        self.addCleanup(listener.close)
+        host, port = listener.getsockname()
+        prober = TLSProfileProber(timeout=0.2, wait=0.05)
+
+        start = time.perf_counter()
+        self.assertIsNone(prober.profile_for(host, port))
+        self.assertLess(time.perf_counter() - start, 0.15)
+        # 확인은 백그라운드에서 계속되어 결과가 보관됨
+        result = prober.result(host, port)
+        self.assertIsNone(result.name)
+        self.assertEqual(len(result.attempts), len(prober.candidates))
+        self.assertIs(prober.results()[(host, port)], result)
+
+    def test_adapter_uses_probed_profile(self):
+        """어댑터가 확인된 프로필로 TLS 1.3 전용 서버에 연결하는지 테스트"""
+        server = stub_server(TLS13, TLS13)
+        with server:
+            url = server.url("/")
+            with self.assertRaises(requests.exceptions.SSLError):
+                create_public_data_api_session().get(url, verify=False)
+
+            prober = self.make_prober()
+            session = create_public_data_api_session(prober=prober)
+            try:
+                self.assertEqual(session.get(url, verify=False).status_code, 200)
+                self.assertEqual(session.get(url, verify=False).status_code, 200)
+            finally:
+                session.close()
+            host, port = server.address
+            self.assertEqual(prober.results()[(host, port)].name, "tls13")
+
+
+if __name__ == "__main__":
+    unittest.main()
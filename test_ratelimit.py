@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Public Data API Rate Limiter - 테스트 스크립트
+
+토큰 버킷, KST 자정 일일 한도 초기화, 어댑터 계층 통합을 확인합니다.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import pickle
+import tempfile
+import unittest
+
+from public_data_api_ratelimit import (
+    ServiceKeyRateLimiter,
+    SQLiteRateLimiter,
+    TokenBucket,
+    kst_day,
+    rate_limit_key,
+)
+from public_data_api_response import PublicDataApiQuotaExceededError
+from public_data_api_ssl_adapter import create_public_data_api_session
+from public_data_api_stub_server import PublicDataApiStubServer
+
+# 2024-01-01 23:59:00 KST (= 2024-01-01 14:59:00 UTC)
+KST_BEFORE_MIDNIGHT = 1704121140.0
+
+
+class FakeClock:
+    """sleep() 호출만큼 시간이 흐르는 가짜 시계"""
+
+    def __init__(self, now=0.0, wall=KST_BEFORE_MIDNIGHT):
+        self.now = now
+        self.wall = wall
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.wall
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+        self.wall += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+    """토큰 버킷 테스트 클래스"""
+
+    def test_burst_then_refill(self):
+        """버스트를 소진한 뒤 rate에 맞춰 채워지는지 테스트"""
+        bucket = TokenBucket(rate=2.0, capacity=2.0)
+        self.assertEqual(bucket.take(0.0), 0)
+        self.assertEqual(bucket.take(0.0), 0)
+        self.assertAlmostEqual(bucket.take(0.0), 0.5)
+        self.assertEqual(bucket.take(0.5), 0)
+
+    def test_capacity_cap(self):
+        """오래 쉬어도 capacity 이상 쌓이지 않는지 테스트"""
+        bucket = TokenBucket(rate=1.0, capacity=1.0)
+        bucket.take(0.0)
+        self.assertEqual(bucket.take(100.0), 0)
+        self.assertGreater(bucket.take(100.0), 0)
+
+
+class TestServiceKeyRateLimiter(unittest.TestCase):
+    """서비스키별 호출 속도 제한 테스트 클래스"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def make_limiter(self, **kwargs):
+        return ServiceKeyRateLimiter(
+            clock=self.clock.monotonic,
+            time_func=self.clock.time,
+            sleep=self.clock.sleep,
+            **kwargs,
+        )
+
+    def test_kst_day_boundary(self):
+        """KST 자정에 날짜 번호가 바뀌는지 테스트"""
+        self.assertEqual(kst_day(KST_BEFORE_MIDNIGHT + 59), kst_day(KST_BEFORE_MIDNIGHT))
+        self.assertEqual(kst_day(KST_BEFORE_MIDNIGHT + 60), kst_day(KST_BEFORE_MIDNIGHT) + 1)
+
+    def test_rate_limit_key(self):
+        """URL에서 serviceKey와 엔드포인트를 추출하는지 테스트"""
+        self.assertEqual(
+            rate_limit_key("https://apis.data.go.kr/B552/getList?ServiceKey=a%2Bb&pageNo=1"),
+            ("a+b", "apis.data.go.kr/B552/getList"),
+        )
+        self.assertEqual(
+            rate_limit_key("https://apis.data.go.kr/B552/getList"),
+            (None, "apis.data.go.kr/B552/getList"),
+        )
+
+    def test_blocking_acquire_paces_calls(self):
+        """초당 호출 수에 맞춰 대기하는지 테스트"""
+        limiter = self.make_limiter(per_second=5)
+        for _ in range(15):
+            limiter.acquire("key", "endpoint")
+        # 처음 5번은 버스트, 나머지 10번은 0.2초 간격
+        self.assertAlmostEqual(self.clock.now, 2.0)
+
+    def test_non_blocking_and_timeout(self):
+        """대기하지 않거나 제한 시간 안에 허가받지 못하면 False를 반환하는지 테스트"""
+        limiter = self.make_limiter(per_second=1)
+        self.assertTrue(limiter.acquire("key", "endpoint"))
+        self.assertFalse(limiter.acquire("key", "endpoint", blocking=False))
+        self.assertFalse(limiter.acquire("key", "endpoint", timeout=0.5))
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_keys_and_endpoints_are_independent(self):
+        """serviceKey와 엔드포인트마다 버킷이 따로인지 테스트"""
+        limiter = self.make_limiter(per_second=1)
+        self.assertTrue(limiter.acquire("key1", "endpoint", blocking=False))
+        self.assertTrue(limiter.acquire("key2", "endpoint", blocking=False))
+        self.assertTrue(limiter.acquire("key1", "other", blocking=False))
+        self.assertFalse(limiter.acquire("key1", "endpoint", blocking=False))
+
+    def test_daily_limit_resets_at_kst_midnight(self):
+        """일일 한도 초과 후 KST 자정에 초기화되는지 테스트"""
+        limiter = self.make_limiter(per_second=100, daily_limit=3)
+        for _ in range(3):
+            limiter.acquire("key", "endpoint")
+        with self.assertRaises(PublicDataApiQuotaExceededError) as ctx:
+            limiter.acquire("key", "endpoint")
+        self.assertEqual(ctx.exception.result_code, "22")
+        self.assertEqual(limiter.usage()[("key", "endpoint")], {"used": 3, "limit": 3})
+
+        self.clock.wall += 60
+        self.assertEqual(limiter.usage()[("key", "endpoint")]["used"], 0)
+        self.assertTrue(limiter.acquire("key", "endpoint"))
+
+    def test_endpoint_limits(self):
+        """엔드포인트별 한도 덮어쓰기 테스트"""
+        limiter = self.make_limiter(
+            per_second=100, endpoint_limits={"slow": (1, 1)}
+        )
+        limiter.acquire("key", "slow")
+        with self.assertRaises(PublicDataApiQuotaExceededError):
+            limiter.acquire("key", "slow")
+        self.assertTrue(limiter.acquire("key", "fast", blocking=False))
+
+    def test_acquire_async(self):
+        """asyncio 대기 테스트"""
+        limiter = ServiceKeyRateLimiter(per_second=20)
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            for _ in range(25):
+                await limiter.acquire_async("key", "endpoint")
+            return loop.time() - start
+
+        elapsed = asyncio.run(run())
+        self.assertGreaterEqual(elapsed, 0.2)
+
+
+def acquire_in_process(limiter, count):
+    """다른 프로세스에서 대기 없이 count번 허가를 시도하고 허가받은 수를 반환"""
+    granted = 0
+    for _ in range(count):
+        try:
+            granted += limiter.acquire("key", "endpoint", blocking=False)
+        except PublicDataApiQuotaExceededError:
+            pass
+    return granted
+
+
+class TestSQLiteRateLimiter(unittest.TestCase):
+    """프로세스 간 공유 호출 속도 제한 테스트 클래스"""
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempdir.name, "ratelimit.db")
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def make_limiter(self, **kwargs):
+        limiter = SQLiteRateLimiter(
+            self.path, time_func=self.clock.time, sleep=self.clock.sleep, **kwargs
+        )
+        self.addCleanup(limiter.close)
+        return limiter
+
+    def test_blocking_acquire_paces_calls(self):
+        """초당 호출 수에 맞춰 대기하는지 테스트"""
+        limiter = self.make_limiter(per_second=5)
+        for _ in range(15):
+            limiter.acquire("key", "endpoint")
+        self.assertAlmostEqual(sum(self.clock.sleeps), 2.0, places=5)
+
+    def test_daily_limit_survives_restart(self):
+        """다시 연 장부가 오늘 사용한 호출 수를 유지하는지 테스트"""
+        limiter = self.make_limiter(per_second=100, daily_limit=3)
+        for _ in range(2):
+            limiter.acquire("key", "endpoint")
+        limiter.close()
+
+        restarted = self.make_limiter(per_second=100, daily_limit=3)
+        self.assertEqual(restarted.usage()[("key", "endpoint")], {"used": 2, "limit": 3})
+        restarted.acquire("key", "endpoint")
+        with self.assertRaises(PublicDataApiQuotaExceededError):
+            restarted.acquire("key", "endpoint")
+
+        # KST 자정이 지나면 초기화
+        self.clock.wall += 60
+        self.assertTrue(restarted.acquire("key", "endpoint"))
+
+    def test_missing_service_key(self):
+        """serviceKey 없는 요청도 하나의 버킷으로 세는지 테스트"""
+        limiter = self.make_limiter(per_second=1)
+        self.assertTrue(limiter.acquire(None, "endpoint", blocking=False))
+        self.assertFalse(limiter.acquire(None, "endpoint", blocking=False))
+        self.assertIn((None, "endpoint"), limiter.usage())
+
+    def test_shared_across_processes(self):
+        """여러 프로세스가 하나의 일일 한도를 나눠 쓰는지 테스트"""
+        limiter = SQLiteRateLimiter(self.path, per_second=100000, daily_limit=100)
+        self.addCleanup(limiter.close)
+        limiter = pickle.loads(pickle.dumps(limiter))
+        self.addCleanup(limiter.close)
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(4) as pool:
+            granted = pool.starmap(acquire_in_process, [(limiter, 60)] * 4)
+        self.assertEqual(sum(granted), 100)
+        self.assertEqual(limiter.usage()[("key", "endpoint")]["used"], 100)
+
+
+class TestRateLimiterLayer(unittest.TestCase):
+    """어댑터 계층 통합 테스트 클래스"""
+
+    def test_session_enforces_daily_limit(self):
+        """일일 한도를 넘는 요청은 서버로 보내지 않는지 테스트"""
+        limiter = ServiceKeyRateLimiter(per_second=100, daily_limit=2)
+        with PublicDataApiStubServer() as server:
+            session = create_public_data_api_session(rate_limiter=limiter)
+            try:
+                for _ in range(2):
+                    response = session.get(
+                        server.url("/getList"), params={"serviceKey": "key"}, verify=False
+                    )
+                    self.assertEqual(response.status_code, 200)
+                with self.assertRaises(PublicDataApiQuotaExceededError):
+                    session.get(
+                        server.url("/getList"), params={"serviceKey": "key"}, verify=False
+                    )
+                # 다른 서비스키는 영향을 받지 않음
+                session.get(
+                    server.url("/getList"), params={"serviceKey": "other"}, verify=False
+                )
+            finally:
+                session.close()
+            self.assertEqual(server.stats()["requests"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Public Data API Response - 테스트 스크립트
+
+JSON/XML 응답 봉투 해석을 확인합니다.
+"""
+
+import json
+import tracemalloc
+import unittest
+
+import requests
+
+from public_data_api_response import (
+    RESULT_FATAL,
+    RESULT_QUOTA,
+    RESULT_RETRYABLE,
+    PublicDataApiError,
+    PublicDataApiQuotaExceededError,
+    ResultCodeRetryPolicy,
+    XmlItemStream,
+    classify_response,
+    classify_result_code,
+    is_success_result_code,
+    iter_xml_items,
+    normalize_result_code,
+    parse_page,
+    peek_result_code,
+)
+from public_data_api_ssl_adapter import create_public_data_api_session
+from public_data_api_stub_server import PublicDataApiStubServer
+
+
+def make_response(content, content_type="application/json"):
+    """본문만 채운 requests.Response 생성"""
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = content_type
+    response._content = content if isinstance(content, bytes) else content.encode()
+    response._content_consumed = True
+    return response
+
+
+class TestParsePage(unittest.TestCase):
+    """parse_page 테스트 클래스"""
+
+    def test_json_page(self):
+        """JSON 응답 해석 테스트"""
+        payload = {
+            "response": {
+                "header": {"resultCode": "00", "resultMsg": "NORMAL SERVICE."},
+                "body": {
+                    "items": {"item": [{"a": 1}, {"a": 2}]},
+                    "numOfRows": 2,
+                    "pageNo": 1,
+                    "totalCount": 5,
+                },
+            }
+        }
+        page = parse_page(make_response(json.dumps(payload)))
+        self.assertEqual(page.result_code, "00")
+        self.assertEqual(page.total_count, 5)
+        self.assertEqual(page.num_of_rows, 2)
+        self.assertEqual(page.items, [{"a": 1}, {"a": 2}])
+
+    def test_json_single_and_empty_items(self):
+        """item이 하나(dict)이거나 비어 있는("") JSON 응답 테스트"""
+        single = {"response": {"header": {}, "body": {"items": {"item": {"a": 1}}}}}
+        empty = {"response": {"header": {}, "body": {"items": "", "totalCount": 0}}}
+        self.assertEqual(parse_page(make_response(json.dumps(single))).items, [{"a": 1}])
+        self.assertEqual(parse_page(make_response(json.dumps(empty))).items, [])
+
+    def test_xml_page(self):
+        """XML 응답 해석 테스트"""
+        content = (
+            "<response><header><resultCode>00</resultCode>"
+            "<resultMsg>NORMAL SERVICE.</resultMsg></header>"
+            "<body><items>"
+            "<item><name>서울</name><code>11</code></item>"
+            "<item><name>부산</name><code>26</code></item>"
+            "</items><numOfRows>2</numOfRows><pageNo>1</pageNo>"
+            "<totalCount>17</totalCount></body></response>"
+        )
+        page = parse_page(make_response(content, "text/xml;charset=UTF-8"))
+        self.assertEqual(page.result_msg, "NORMAL SERVICE.")
+        self.assertEqual(page.total_count, 17)
+        self.assertEqual(
+            page.items, [{"name": "서울", "code": "11"}, {"name": "부산", "code": "26"}]
+        )
+
+    def test_openapi_service_response_error(self):
+        """OpenAPI_ServiceResponse 오류 형식 해석 테스트"""
+        content = (
+            "<OpenAPI_ServiceResponse><cmmMsgHeader>"
+            "<errMsg>SERVICE ERROR</errMsg>"
+            "<returnAuthMsg>SERVICE_KEY_IS_NOT_REGISTERED_ERROR</returnAuthMsg>"
+            "<returnReasonCode>30</returnReasonCode>"
+            "</cmmMsgHeader></OpenAPI_ServiceResponse>"
+        )
+        page = parse_page(make_response(content, "text/xml"))
+        self.assertEqual(page.result_code, "30")
+        self.assertEqual(page.result_msg, "SERVICE_KEY_IS_NOT_REGISTERED_ERROR")
+        self.assertFalse(is_success_result_code(page.result_code))
+
+    def test_success_result_codes(self):
+        """정상 resultCode 판별 테스트"""
+        for code in ("00", "0", "000", "03", None):
+            self.assertTrue(is_success_result_code(code))
+        for code in ("22", "30", "99"):
+            self.assertFalse(is_success_result_code(code))
+
+
+def generate_xml(item_count, result_code="00", chunk_items=100):
+    """item_count개의 item을 가진 XML 응답을 조각 단위로 생성"""
+    yield (
+        "<?xml version='1.0' encoding='UTF-8'?><response><header>"
+        f"<resultCode>{result_code}</resultCode><resultMsg>MSG</resultMsg>"
+        "</header><body><items>"
+    ).encode()
+    for start in range(0, item_count, chunk_items):
+        yield "".join(
+            f"<item><seq>{n}</seq><name>아파트{n}</name><dealAmount>{n * 7}</dealAmount></item>"
+            for n in range(start, min(start + chunk_items, item_count))
+        ).encode()
+    yield (
+        f"</items><numOfRows>{item_count}</numOfRows><pageNo>1</pageNo>"
+        f"<totalCount>{item_count}</totalCount></body></response>"
+    ).encode()
+
+
+class TestXmlItemStream(unittest.TestCase):
+    """스트리밍 XML 파서 테스트 클래스"""
+
+    def test_items_and_counts(self):
+        """item과 header/body 값 해석 테스트"""
+        stream = XmlItemStream(generate_xml(250))
+        self.assertEqual(stream.read_header(), ("00", "MSG"))
+        items = list(stream)
+        self.assertEqual(len(items), 250)
+        self.assertEqual(items[7], {"seq": "7", "name": "아파트7", "dealAmount": "49"})
+        self.assertEqual(stream.total_count, 250)
+        self.assertEqual(stream.num_of_rows, 250)
+
+    def test_error_header_raises_before_body(self):
+        """오류 resultCode는 body를 읽기 전에 예외가 발생하는지 테스트"""
+        read_chunks = []
+
+        def counting_chunks():
+            for chunk in generate_xml(10000, result_code="22"):
+                read_chunks.append(chunk)
+                yield chunk
+
+        with self.assertRaises(PublicDataApiError) as ctx:
+            next(iter_xml_items(counting_chunks()))
+        self.assertEqual(ctx.exception.result_code, "22")
+        # header 조각만 읽고 나머지 body는 읽지 않음
+        self.assertEqual(len(read_chunks), 1)
+
+    def test_openapi_service_response_header(self):
+        """OpenAPI_ServiceResponse 오류 형식 header 테스트"""
+        content = (
+            b"<OpenAPI_ServiceResponse><cmmMsgHeader><errMsg>SERVICE ERROR</errMsg>"
+            b"<returnAuthMsg>LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR"
+            b"</returnAuthMsg><returnReasonCode>22</returnReasonCode>"
+            b"</cmmMsgHeader></OpenAPI_ServiceResponse>"
+        )
+        stream = XmlItemStream([content], raise_on_error=False)
+        self.assertEqual(stream.read_header()[0], "22")
+        self.assertEqual(list(stream), [])
+
+    def test_memory_stays_flat(self):
+        """item 수와 관계없이 메모리 사용량이 일정한지 테스트"""
+
+        def peak_memory(item_count):
+            tracemalloc.start()
+            try:
+                for _ in iter_xml_items(generate_xml(item_count)):
+                    pass
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        small = peak_memory(1000)
+        large = peak_memory(20000)
+        self.assertLess(large, small * 2)
+
+    def test_streamed_response(self):
+        """stream=True 응답을 읽고 연결을 재사용하는지 테스트"""
+
+        def xml_response(method, path, query, body):
+            content = b"".join(generate_xml(int(query["numOfRows"])))
+            return 200, {"Content-Type": "text/xml;charset=UTF-8"}, content
+
+        with PublicDataApiStubServer(responder=xml_response) as server:
+            session = create_public_data_api_session()
+            for _ in range(2):
+                response = session.get(
+                    server.url("/getList"),
+                    params={"numOfRows": 3000},
+                    stream=True,
+                    verify=False,
+                )
+                self.assertEqual(len(list(iter_xml_items(response))), 3000)
+            session.close()
+            stats = server.stats()
+        self.assertEqual(stats["full_handshakes"] + stats["resumed_handshakes"], 1)
+
+
+def envelope(result_code, result_msg="MSG"):
+    """resultCode만 채운 JSON 응답 봉투"""
+    return json.dumps(
+        {"response": {"header": {"resultCode": result_code, "resultMsg": result_msg}}}
+    ).encode()
+
+
+class TestResultCodeClassification(unittest.TestCase):
+    """resultCode 분류 테스트 클래스"""
+
+    def test_peek_formats(self):
+        """JSON, XML, OpenAPI_ServiceResponse 앞부분에서 resultCode 찾기 테스트"""
+        self.assertEqual(peek_result_code(envelope("22", "LIMIT")), ("22", "LIMIT"))
+        self.assertEqual(
+            peek_result_code(
+                b"<response><header><resultCode>99</resultCode>"
+                b"<resultMsg>UNKNOWN_ERROR</resultMsg></header>"
+            ),
+            ("99", "UNKNOWN_ERROR"),
+        )
+        self.assertEqual(
+            peek_result_code(
+                b"<OpenAPI_ServiceResponse><cmmMsgHeader><errMsg>SERVICE ERROR</errMsg>"
+                b"<returnAuthMsg>SERVICE_KEY_IS_NOT_REGISTERED_ERROR</returnAuthMsg>"
+                b"<returnReasonCode>30</returnReasonCode></cmmMsgHeader>"
+            ),
+            ("30", "SERVICE_KEY_IS_NOT_REGISTERED_ERROR"),
+        )
+        self.assertEqual(peek_result_code(b"plain text"), (None, None))
+
+    def test_unpadded_result_codes(self):
+        """앞의 0이 빠지거나 더 붙은 resultCode도 같은 분류인지 테스트"""
+        cases = {
+            "3": None,
+            "003": None,
+            "0": None,
+            "00": None,
+            "22": RESULT_QUOTA,
+            "022": RESULT_QUOTA,
+            "1": RESULT_RETRYABLE,
+            " 30 ": RESULT_FATAL,
+        }
+        for code, expected in cases.items():
+            self.assertEqual(classify_result_code(code), expected, code)
+        self.assertEqual(normalize_result_code("3"), "03")
+        self.assertEqual(normalize_result_code("INFO-000"), "INFO-000")
+
+    def test_classify_response(self):
+        """응답 분류 테스트"""
+        cases = {
+            "00": None,
+            "03": None,
+            "22": RESULT_QUOTA,
+            "23": RESULT_RETRYABLE,
+            "30": RESULT_FATAL,
+            "99": RESULT_RETRYABLE,
+            "77": RESULT_FATAL,
+        }
+        for code, expected in cases.items():
+            self.assertEqual(classify_response(make_response(envelope(code)))[0], expected)
+
+        unavailable = make_response(b"Service Unavailable")
+        unavailable.status_code = 503
+        self.assertEqual(classify_response(unavailable)[0], RESULT_RETRYABLE)
+
+
+class TestResultCodeRetryPolicy(unittest.TestCase):
+    """resultCode 재시도 정책 테스트 클래스"""
+
+    def setUp(self):
+        self.sleeps = []
+        self.policy = ResultCodeRetryPolicy(
+            max_retries=3, backoff_factor=1.0, sleep=self.sleeps.append
+        )
+
+    def send_sequence(self, *result_codes):
+        responses = [make_response(envelope(code)) for code in result_codes]
+        calls = []
+
+        def next_send(request, **kwargs):
+            calls.append(request)
+            return responses[len(calls) - 1]
+
+        return next_send, calls
+
+    def test_retryable_then_success(self):
+        """일시적 오류 후 성공하면 정상 응답을 반환하는지 테스트"""
+        next_send, calls = self.send_sequence("99", "23", "00")
+        response = self.policy.send(next_send, "request")
+        self.assertEqual(peek_result_code(response.content)[0], "00")
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(len(self.sleeps), 2)
+        self.assertLessEqual(self.sleeps[0], 1.0)
+        self.assertLessEqual(self.sleeps[1], 2.0)
+
+    def test_retries_exhausted(self):
+        """재시도 횟수를 다 쓰면 예외가 발생하는지 테스트"""
+        next_send, calls = self.send_sequence("99", "99", "99", "99")
+        with self.assertRaises(PublicDataApiError) as ctx:
+            self.policy.send(next_send, "request")
+        self.assertEqual(ctx.exception.result_code, "99")
+        self.assertEqual(len(calls), 4)
+
+    def test_quota_not_retried(self):
+        """한도 초과는 재시도하지 않는지 테스트"""
+        next_send, calls = self.send_sequence("22")
+        with self.assertRaises(PublicDataApiQuotaExceededError):
+            self.policy.send(next_send, "request")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.sleeps, [])
+
+    def test_fatal_not_retried(self):
+        """치명적 오류는 재시도하지 않는지 테스트"""
+        next_send, calls = self.send_sequence("30")
+        with self.assertRaises(PublicDataApiError) as ctx:
+            self.policy.send(next_send, "request")
+        self.assertNotIsInstance(ctx.exception, PublicDataApiQuotaExceededError)
+        self.assertEqual(len(calls), 1)
+
+    def test_retry_after_header(self):
+        """Retry-After 헤더를 따르는지 테스트"""
+        response = make_response(b"busy")
+        response.status_code = 429
+        response.headers["Retry-After"] = "7"
+        self.assertEqual(self.policy.get_backoff_time(0, response), 7.0)
+
+    def test_mounted_on_session(self):
+        """어댑터에 마운트된 정책이 실제 요청을 재시도하는지 테스트"""
+        result_codes = iter(["99", "05", "00"])
+
+        def flaky_response(method, path, query, body):
+            return 200, {"Content-Type": "application/json"}, envelope(next(result_codes))
+
+        with PublicDataApiStubServer(responder=flaky_response) as server:
+            session = create_public_data_api_session(retry_policy=self.policy)
+            response = session.get(server.url("/getList"), verify=False)
+            session.close()
+            self.assertEqual(server.stats()["requests"], 3)
+        self.assertEqual(response.json()["response"]["header"]["resultCode"], "00")
+
+
+if __name__ == "__main__":
+    unittest.main()
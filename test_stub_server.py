@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Public Data API Stub Server - 테스트 스크립트
+
+스텁 서버의 레거시 TLS 설정, 유휴 연결 종료, 페이지 응답 봉투를 확인합니다.
+"""
+
+import http.client
+import socket
+import ssl
+import time
+import unittest
+
+import requests
+
+from public_data_api_pagination import paginate
+from public_data_api_response import PublicDataApiError, parse_page
+from public_data_api_ssl_adapter import create_public_data_api_session
+from public_data_api_stub_server import PagedEnvelopeResponder, PublicDataApiStubServer
+
+
+def tls_client_context(version):
+    ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    ctx.check_hostname = False
+    ctx.verify_mode = ssl.CERT_NONE
+    ctx.minimum_version = version
+    ctx.maximum_version = version
+    ctx.set_ciphers("DEFAULT:@SECLEVEL=0")
+    return ctx
+
+
+class TestLegacyTLS(unittest.TestCase):
+    """레거시 TLS 설정 테스트 클래스"""
+
+    def handshake(self, server, version):
+        with socket.create_connection(server.address, timeout=5) as sock:
+            with tls_client_context(version).wrap_socket(sock) as tls_sock:
+                return tls_sock.version(), tls_sock.cipher()[0]
+
+    def test_accepts_tls10_to_tls12(self):
+        """TLS 1.0~1.2 핸드셰이크를 받는지 테스트"""
+        with PublicDataApiStubServer() as server:
+            self.assertEqual(
+                self.handshake(server, ssl.TLSVersion.TLSv1), ("TLSv1", "AES128-SHA")
+            )
+            self.assertEqual(self.handshake(server, ssl.TLSVersion.TLSv1_2)[0], "TLSv1.2")
+            with self.assertRaises(ssl.SSLError):
+                self.handshake(server, ssl.TLSVersion.TLSv1_3)
+
+    def test_idle_timeout_closes_connection(self):
+        """idle_timeout 동안 요청이 없으면 서버가 연결을 닫는지 테스트"""
+        with PublicDataApiStubServer(idle_timeout=0.2) as server:
+            connection = http.client.HTTPSConnection(
+                *server.address, timeout=5, context=tls_client_context(ssl.TLSVersion.TLSv1_2)
+            )
+            connection.request("GET", "/")
+            connection.getresponse().read()
+            start = time.monotonic()
+            self.assertEqual(connection.sock.recv(1), b"")  # FIN
+            self.assertGreaterEqual(time.monotonic() - start, 0.15)
+            connection.close()
+
+            session = create_public_data_api_session()
+            try:
+                self.assertEqual(session.get(server.url("/"), verify=False).status_code, 200)
+            finally:
+                session.close()
+
+
+class TestPagedEnvelopeResponder(unittest.TestCase):
+    """페이지 응답 봉투 테스트 클래스"""
+
+    def setUp(self):
+        self.server = PublicDataApiStubServer().start()
+        self.session = create_public_data_api_session()
+        self.url = self.server.url("/getList")
+
+    def tearDown(self):
+        self.session.close()
+        self.server.stop()
+
+    def get_page(self, **params):
+        return parse_page(self.session.get(self.url, params=params, verify=False))
+
+    def test_xml_and_json_envelopes(self):
+        """XML(기본값)과 JSON(_type=json) 봉투가 같은 페이지를 담는지 테스트"""
+        self.server.responder = PagedEnvelopeResponder(total_count=25)
+        xml_page = self.get_page(pageNo=3, numOfRows=10)
+        json_page = self.get_page(pageNo=3, numOfRows=10, _type="json")
+
+        self.assertEqual(json_page.result_code, "00")
+        self.assertEqual(json_page.total_count, 25)
+        self.assertEqual(json_page.page_no, 3)
+        self.assertEqual([item["seq"] for item in json_page.items], list(range(20, 25)))
+        self.assertEqual(xml_page[:5], json_page[:5])
+        self.assertEqual(
+            xml_page.items, [{"seq": str(n), "name": f"item-{n}"} for n in range(20, 25)]
+        )
+
+    def test_paginate(self):
+        """paginate가 모든 페이지의 item을 읽는지 테스트"""
+        self.server.responder = responder = PagedEnvelopeResponder(total_count=95)
+        items = list(
+            paginate(self.session, self.url, {"numOfRows": 10, "_type": "json"}, verify=False)
+        )
+        self.assertEqual([item["seq"] for item in items], list(range(95)))
+        self.assertEqual(responder.result_codes, {"00": 10})
+
+    def test_latency(self):
+        """응답 지연 주입 테스트"""
+        self.server.responder = PagedEnvelopeResponder(latency=0.2)
+        start = time.monotonic()
+        self.get_page()
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+
+    def test_error_injection(self):
+        """pageNo별 오류 주입 테스트"""
+        self.server.responder = PagedEnvelopeResponder(
+            errors={2: "99", 3: "22", 4: 503}
+        )
+        self.assertEqual(self.get_page(pageNo=2, _type="json").result_code, "99")
+        # 호출 한도 오류는 게이트웨이 형식 (OpenAPI_ServiceResponse)
+        page = self.get_page(pageNo=3, _type="json")
+        self.assertEqual(page.result_code, "22")
+        self.assertEqual(page.items, [])
+        response = self.session.get(self.url, params={"pageNo": 4}, verify=False)
+        self.assertEqual(response.status_code, 503)
+
+        with self.assertRaises(PublicDataApiError):
+            list(paginate(self.session, self.url, {"pageNo": 2}, verify=False))
+
+    def test_error_rate(self):
+        """error_rate 비율만큼 오류를 주입하는지 테스트"""
+        self.server.responder = responder = PagedEnvelopeResponder(
+            error_rate=0.5, error_codes=("01", "05"), seed=1
+        )
+        for _ in range(40):
+            self.get_page()
+        self.assertEqual(sum(responder.result_codes.values()), 40)
+        self.assertEqual(set(responder.result_codes), {"00", "01", "05"})
+        self.assertLess(abs(responder.result_codes["00"] - 20), 10)
+
+    def test_http_error_status(self):
+        """HTTP 상태 코드 오류가 requests.HTTPError가 되는지 테스트"""
+        self.server.responder = PagedEnvelopeResponder(errors={1: 500})
+        with self.assertRaises(requests.HTTPError):
+            list(paginate(self.session, self.url, verify=False))
+
+
+if __name__ == "__main__":
+    unittest.main()